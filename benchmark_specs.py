@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+"""
+Benchmark for the specification generator.
+
+Times the generation phases (discovery, file read, parse, class lookup,
+property extraction and JSON write) per component for two workloads and
+saves the profile reports as JSON:
+
+- reflex: a full, non-incremental run over the Reflex codebase.
+- large_component: a synthetic component package with many classes per
+  module, thousands of props and a deep inheritance chain, extracted at two
+  sizes. The ratio of the two timings shows how the extraction scales, so
+  accidentally quadratic changes stand out.
+"""
+import os
+import io
+import argparse
+import tempfile
+import contextlib
+from typing import Dict, Any, Optional
+
+from spec_generator.output import generate_spec_files
+from spec_generator.output.writer import extract_component_spec, save_spec_file
+from spec_generator.utils.profiling import (
+    start_profile,
+    stop_profile,
+    profile_phase,
+    profile_component,
+    save_profile_report,
+)
+
+FIXTURE_PACKAGE = "large_fixture"
+FIXTURE_COMPONENT = "large_component"
+
+
+def write_large_component_fixture(directory: str, num_classes: int = 100, props_per_class: int = 40) -> Dict[str, str]:
+    """Write a synthetic component package.
+
+    The package has a `base` module with a chain of base classes and a
+    `large_component` module with `num_classes` components, exposed through
+    a ComponentNamespace. The components form inheritance chains of five
+    classes on top of the base chain, so the size of the specs grows
+    linearly with the number of classes.
+
+    Args:
+        directory: The directory to create the package in
+        num_classes: The number of component classes in the large module
+        props_per_class: The number of props declared by each class
+
+    Returns:
+        The mapping information of the namespace component
+    """
+    package_dir = os.path.join(directory, FIXTURE_PACKAGE)
+    os.makedirs(package_dir, exist_ok=True)
+
+    with open(os.path.join(package_dir, "__init__.py"), "w") as f:
+        f.write('"""Synthetic components for benchmarking."""\n')
+
+    base_lines = [
+        '"""Base classes of the synthetic components."""',
+        "from typing import Literal",
+        "",
+        "",
+        "class Component:",
+        '    """Stand-in for the framework base class."""',
+        "",
+        "",
+        "class ComponentNamespace:",
+        '    """Stand-in for the framework namespace class."""',
+        "",
+    ]
+    for level in range(10):
+        parent = f"Base{level - 1}" if level else "Component"
+        base_lines += ["", f"class Base{level}({parent}):", f'    """Base class {level}."""', ""]
+        base_lines += _fixture_props(f"base{level}", props_per_class)
+    with open(os.path.join(package_dir, "base.py"), "w") as f:
+        f.write("\n".join(base_lines) + "\n")
+
+    lines = [
+        '"""A large synthetic component module."""',
+        "from typing import Literal",
+        "",
+        "from .base import Base9, ComponentNamespace",
+        "",
+    ]
+    for index in range(num_classes):
+        parent = f"Item{index - 1}" if index % 5 else "Base9"
+        lines += ["", f"class Item{index}({parent}):", f'    """Synthetic component {index}."""', ""]
+        lines += _fixture_props(f"item{index}", props_per_class)
+        lines += [
+            "",
+            "    @classmethod",
+            "    def create(cls, *children, **props):",
+            '        """Create the component."""',
+            "        return super().create(*children, **props)",
+            "",
+        ]
+
+    lines += ["", "class LargeComponent(ComponentNamespace):", '    """The namespace of the synthetic components."""', ""]
+    for index in range(num_classes):
+        lines.append(f"    item{index} = staticmethod(Item{index}.create)")
+    lines += ["", "", f"{FIXTURE_COMPONENT} = LargeComponent()"]
+
+    file_path = os.path.join(package_dir, f"{FIXTURE_COMPONENT}.py")
+    with open(file_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    return {"module_path": f"{FIXTURE_PACKAGE}.{FIXTURE_COMPONENT}", "file_path": file_path}
+
+
+def _fixture_props(prefix: str, count: int) -> list:
+    """Generate the prop declarations of a synthetic class, in every style the extractor handles."""
+    lines = []
+    for index in range(count):
+        name = f"{prefix}_prop_{index}"
+        style = index % 5
+        if style == 0:
+            lines += [f"    {name}: Var[str]", f'    """Docstring of {name}."""', ""]
+        elif style == 1:
+            lines += [f"    # Comment of {name}", f"    {name}: Var[int]", ""]
+        elif style == 2:
+            lines += [f"    {name}: Var[LiteralRadius]  # Radius of {name}", ""]
+        elif style == 3:
+            lines += [f'    {name}: Var[Literal["1", "2", "3"]] = "1"', f'    """Size of {name}: "1" - "3"."""', ""]
+        else:
+            lines += [f"    on_{name}: EventHandler[no_args_event_spec]", ""]
+    return lines
+
+
+def run_reflex_benchmark(base_dir: str) -> Dict[str, Any]:
+    """Time a full, non-incremental generation run over the Reflex codebase.
+
+    Args:
+        base_dir: The base directory of the Reflex codebase
+
+    Returns:
+        The profile report of the run
+    """
+    with tempfile.TemporaryDirectory() as specs_dir:
+        start_profile()
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_spec_files(base_dir, specs_dir, incremental=False)
+        return stop_profile()
+
+
+def run_large_component_benchmark(num_classes: int, props_per_class: int) -> Dict[str, Any]:
+    """Time the extraction of the synthetic large component.
+
+    Args:
+        num_classes: The number of component classes in the large module
+        props_per_class: The number of props declared by each class
+
+    Returns:
+        The profile report of the extraction, with the size of the fixture
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        mapping = write_large_component_fixture(directory, num_classes, props_per_class)
+        specs_dir = os.path.join(directory, "specs")
+
+        start_profile()
+        with contextlib.redirect_stdout(io.StringIO()):
+            with profile_component(FIXTURE_COMPONENT):
+                spec = extract_component_spec(FIXTURE_COMPONENT, mapping, {}, set())
+                with profile_phase("json_write"):
+                    save_spec_file(spec, FIXTURE_COMPONENT, specs_dir)
+        report = stop_profile()
+
+    report["fixture"] = {
+        "classes": num_classes,
+        "props_per_class": props_per_class,
+        "subcomponents": len(spec["subcomponents"]),
+    }
+    return report
+
+
+def run_benchmarks(
+    base_dir: str,
+    repeat: int = 3,
+    num_classes: int = 100,
+    props_per_class: int = 40,
+) -> Dict[str, Any]:
+    """Run every benchmark and keep the fastest run of each.
+
+    Args:
+        base_dir: The base directory of the Reflex codebase
+        repeat: The number of times to run each benchmark
+        num_classes: The number of component classes in the large module
+        props_per_class: The number of props declared by each class
+
+    Returns:
+        The benchmark report
+    """
+    def fastest(run) -> Dict[str, Any]:
+        return min((run() for _ in range(repeat)), key=lambda report: report["total_seconds"])
+
+    report = {
+        "reflex": fastest(lambda: run_reflex_benchmark(base_dir)),
+        "large_component": fastest(lambda: run_large_component_benchmark(num_classes, props_per_class)),
+        "large_component_double": fastest(lambda: run_large_component_benchmark(2 * num_classes, props_per_class)),
+    }
+
+    # About 2 for linear extraction, 4 or more for quadratic
+    report["large_component_scaling"] = round(
+        report["large_component_double"]["total_seconds"] / report["large_component"]["total_seconds"], 2
+    )
+    return report
+
+
+def main(args: Optional[argparse.Namespace] = None) -> None:
+    """Run the benchmarks and save the report.
+
+    Args:
+        args: Command-line arguments
+    """
+    if args is None:
+        parser = argparse.ArgumentParser(description="Benchmark the specification generator")
+        parser.add_argument("--base-dir", type=str, default=os.getcwd(), help="Base directory of the Reflex codebase")
+        parser.add_argument("--output", type=str, default="benchmark_report.json", help="Path of the JSON report")
+        parser.add_argument("--repeat", type=int, default=3, help="Number of runs of each benchmark, the fastest is kept")
+        parser.add_argument("--classes", type=int, default=100, help="Number of classes in the synthetic module")
+        parser.add_argument("--props", type=int, default=40, help="Number of props per synthetic class")
+        args = parser.parse_args()
+
+    report = run_benchmarks(args.base_dir, args.repeat, args.classes, args.props)
+    save_profile_report(report, args.output)
+
+    for name in ("reflex", "large_component", "large_component_double"):
+        phases = ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in report[name]["phases"].items())
+        print(f"{name}: {report[name]['total_seconds']:.3f}s ({phases})")
+    print(f"large_component scaling: {report['large_component_scaling']}x")
+    print(f"Benchmark report saved to: {os.path.abspath(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -72,7 +72,7 @@ from reflex.components.core.sticky import sticky
 from reflex.components.core.upload import Upload, get_upload_dir
 from reflex.components.radix import themes
 from reflex.components.sonner.toast import toast
-from reflex.config import ExecutorType, environment, get_config
+from reflex.config import ExecutorType, PerformanceMode, environment, get_config
 from reflex.event import (
     _EVENT_FIELDS,
     Event,
@@ -106,6 +106,7 @@ from reflex.utils import (
     format,
     path_ops,
     prerequisites,
+    state_profile,
     types,
 )
 from reflex.utils.exec import get_compile_context, is_prod_mode, is_testing_env
@@ -474,6 +475,24 @@ class App(MiddlewareMixin, LifespanMixin):
             self._state = State
             self._setup_state()
 
+    @contextlib.asynccontextmanager
+    async def _close_state_manager(self):
+        """Close the state manager when the app shuts down.
+
+        Managers holding states in memory write them out when closed. The
+        sizes profiled since the last periodic save are saved afterwards.
+
+        Yields:
+            None, while the app runs.
+        """
+        try:
+            yield
+        finally:
+            if self._state_manager is not None:
+                await self._state_manager.close()
+            if environment.REFLEX_PERF_MODE.get() == PerformanceMode.PROFILE:
+                state_profile.save_profile()
+
     def _setup_state(self) -> None:
         """Set up the state for the app.
 
@@ -487,6 +506,10 @@ class App(MiddlewareMixin, LifespanMixin):
 
         # Set up the state manager.
         self._state_manager = StateManager.create(state=self._state)
+        # The state is set up again when it is enabled later, but the task
+        # closes whichever state manager the app has when it shuts down.
+        if self._close_state_manager not in self.lifespan_tasks:
+            self.register_lifespan_task(self._close_state_manager)
 
         # Set up the Socket.IO AsyncServer.
         if not self.sio:
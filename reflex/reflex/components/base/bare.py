@@ -37,7 +37,7 @@ def validate_str(value: str):
     """
     perf_mode = get_performance_mode()
     if perf_mode != PerformanceMode.OFF and value.startswith("reflex___state"):
-        if perf_mode == PerformanceMode.WARN:
+        if perf_mode in (PerformanceMode.WARN, PerformanceMode.PROFILE):
             console.warn(
                 f"Output includes {value!s} which will be displayed as a string. If you are calling `str` on a Var, consider using .to_string() instead."
             )
@@ -490,6 +490,8 @@ class PerformanceMode(enum.Enum):
 
     WARN = "warn"
     RAISE = "raise"
+    # Warn, and record the serialized size of each state var (see `reflex state-profile`).
+    PROFILE = "profile"
     OFF = "off"
 
 
@@ -845,6 +847,27 @@ class Config(Base):
     # Token expiration time for redis state manager
     redis_token_expiration: int = constants.Expiration.TOKEN
 
+    # Maximum number of clients whose deserialized states each worker caches for the redis state manager, reused by the events holding the lock of the client; 0 disables the cache
+    redis_near_cache_size: int = 0
+
+    # Whether the redis state manager stores each substate as a hash of its vars, writing only the vars that changed; cannot be combined with redis_near_cache_size, as the near-cache only holds states stored whole
+    redis_state_hash_fields: bool = False
+
+    # Maximum number of client sessions kept by the memory state manager; None for no limit
+    memory_state_max_sessions: int | None = None
+
+    # Maximum estimated size in bytes of the client sessions kept by the memory state manager; None for no limit
+    memory_state_max_bytes: int | None = None
+
+    # Seconds a client session stays in memory after its last event before the tiered state manager spills it to disk
+    tiered_state_idle_threshold: int = 300
+
+    # How states are serialized by the state managers: pickle, or compact to only store var values
+    state_codec: constants.StateCodecMode = constants.StateCodecMode.PICKLE
+
+    # Size in bytes above which the compact state codec compresses states with zlib; None to never compress
+    state_compression_threshold: int | None = 4096
+
     # Attributes that were explicitly set by the user.
     _non_default_attributes: set[str] = pydantic.PrivateAttr(set())
 
@@ -893,6 +916,11 @@ class Config(Base):
                 "REDIS_URL is required when using the redis state manager."
             )
 
+        if self.redis_state_hash_fields and self.redis_near_cache_size:
+            raise ConfigError(
+                "REDIS_STATE_HASH_FIELDS cannot be combined with REDIS_NEAR_CACHE_SIZE."
+            )
+
     @property
     def app_module(self) -> ModuleType | None:
         """Return the app module if `app_module_import` is set.
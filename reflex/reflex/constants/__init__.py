@@ -57,7 +57,7 @@ from .route import (
     RouteRegex,
     RouteVar,
 )
-from .state import StateManagerMode
+from .state import StateCodecMode, StateManagerMode
 from .style import Tailwind
 
 __ALL__ = [
@@ -109,6 +109,7 @@ __ALL__ = [
     ROUTE_NOT_FOUND,
     SETTER_PREFIX,
     SocketEvent,
+    StateCodecMode,
     StateManagerMode,
     Tailwind,
     Templates,
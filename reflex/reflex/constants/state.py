@@ -9,6 +9,15 @@ class StateManagerMode(str, Enum):
     DISK = "disk"
     MEMORY = "memory"
     REDIS = "redis"
+    TIERED = "tiered"
+    SQLITE = "sqlite"
+
+
+class StateCodecMode(str, Enum):
+    """State serialization formats."""
+
+    PICKLE = "pickle"
+    COMPACT = "compact"
 
 
 # Used for things like console_log, etc.
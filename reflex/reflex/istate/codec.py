@@ -0,0 +1,447 @@
+"""Codecs converting states to bytes for the state managers.
+
+The pickle codec stores the whole state instance, as reflex always did. The
+compact codec only stores the values of the base vars and backend vars
+defined by the state class, in a tagged binary encoding behind a header
+holding the schema hash of the class:
+
+    magic (4 bytes) | flags (1 byte) | schema hash (16 bytes) | body
+
+The body is a count and (name, value) pairs for the base vars, then for the
+backend vars, optionally compressed with zlib. Scalar values (None, bool,
+int, float, str and bytes) are encoded natively; containers and any other
+value are pickled on their own. The pydantic internals, router, dirty sets
+and computed var caches of the instance are not stored. Unlike pickle,
+objects referenced from several vars are restored as separate copies.
+
+States are always decoded according to the format of the data, so switching
+codecs does not invalidate the states already stored.
+"""
+
+from __future__ import annotations
+
+import functools
+import pickle
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from reflex.utils.exceptions import StateSchemaMismatchError
+
+if TYPE_CHECKING:
+    from reflex.state import BaseState
+
+# The first bytes of a state encoded by the compact codec. Pickles start with b"\x80".
+COMPACT_MAGIC = b"RXS\x01"
+
+# The flag set when the body is compressed.
+_FLAG_ZLIB = 0x01
+
+_HEADER_SIZE = len(COMPACT_MAGIC) + 1 + 16
+
+_TAG_NONE = 0x00
+_TAG_TRUE = 0x01
+_TAG_FALSE = 0x02
+_TAG_INT = 0x03
+_TAG_FLOAT = 0x04
+_TAG_STR = 0x05
+_TAG_BYTES = 0x06
+_TAG_PICKLE = 0x07
+
+_FLOAT = struct.Struct("<d")
+
+
+class StateCodec(ABC):
+    """Convert a state to bytes and back."""
+
+    @abstractmethod
+    def encode(self, state: BaseState) -> bytes:
+        """Encode a state, without its parent state and substates.
+
+        Args:
+            state: The state to encode.
+
+        Returns:
+            The encoded state.
+        """
+
+    @abstractmethod
+    def decode(self, data: bytes, state_cls: type[BaseState]) -> BaseState:
+        """Decode a state encoded by this codec.
+
+        Args:
+            data: The encoded state.
+            state_cls: The class of the state.
+
+        Returns:
+            The decoded state.
+        """
+
+
+class PickleStateCodec(StateCodec):
+    """Pickle the whole state instance with the schema hash of its class."""
+
+    def encode(self, state: BaseState) -> bytes:
+        """Pickle a state.
+
+        Args:
+            state: The state to encode.
+
+        Returns:
+            The pickled schema hash and state.
+        """
+        return pickle.dumps((state._to_schema(), state))
+
+    def decode(self, data: bytes, state_cls: type[BaseState]) -> BaseState:
+        """Unpickle a state.
+
+        Args:
+            data: The pickled schema hash and state.
+            state_cls: The class of the state, unused since pickles name their class.
+
+        Returns:
+            The unpickled state.
+
+        Raises:
+            StateSchemaMismatchError: If the state schema does not match the expected schema.
+        """
+        (substate_schema, state) = pickle.loads(data)
+        if substate_schema != state._to_schema():
+            raise StateSchemaMismatchError()
+        return state
+
+
+class CompactStateCodec(StateCodec):
+    """Encode only the var values of a state, in a tagged binary format."""
+
+    def __init__(self, compression_threshold: int | None = None):
+        """Create a compact codec.
+
+        Args:
+            compression_threshold: Compress bodies larger than this many bytes with zlib, None to never compress.
+        """
+        self.compression_threshold = compression_threshold
+
+    def encode(self, state: BaseState) -> bytes:
+        """Encode the base vars and backend vars of a state.
+
+        Args:
+            state: The state to encode.
+
+        Returns:
+            The encoded state.
+        """
+        base_vars, backend_vars = get_state_vars(state)
+
+        body = bytearray()
+        for section in (base_vars, backend_vars):
+            _write_uvarint(body, len(section))
+            for name, value in section:
+                _write_str(body, name)
+                encode_value(body, value)
+
+        flags = 0
+        if (
+            self.compression_threshold is not None
+            and len(body) > self.compression_threshold
+        ):
+            compressed = zlib.compress(body)
+            if len(compressed) < len(body):
+                body = compressed
+                flags |= _FLAG_ZLIB
+        return b"".join(
+            (
+                COMPACT_MAGIC,
+                bytes((flags,)),
+                bytes.fromhex(state._to_schema()),
+                body,
+            )
+        )
+
+    def decode(self, data: bytes, state_cls: type[BaseState]) -> BaseState:
+        """Decode a state into a new instance of its class.
+
+        Args:
+            data: The encoded state.
+            state_cls: The class of the state.
+
+        Returns:
+            The decoded state.
+
+        Raises:
+            StateSchemaMismatchError: If the state was encoded with another schema of the class.
+        """
+        if data[len(COMPACT_MAGIC) + 1 : _HEADER_SIZE] != bytes.fromhex(
+            state_cls._to_schema()
+        ):
+            raise StateSchemaMismatchError()
+        body = memoryview(data)[_HEADER_SIZE:]
+        if data[len(COMPACT_MAGIC)] & _FLAG_ZLIB:
+            body = memoryview(zlib.decompress(body))
+
+        state = state_cls(init_substates=False, _reflex_internal_init=True)
+        pos = 0
+        for _section in range(2):
+            count, pos = _read_uvarint(body, pos)
+            for _ in range(count):
+                name, pos = _read_str(body, pos)
+                value, pos = decode_value(body, pos)
+                set_state_var(state, name, value)
+        return state
+
+
+def get_state_vars(
+    state: BaseState,
+) -> tuple[list[tuple[str, Any]], list[tuple[str, Any]]]:
+    """Get the var values a state needs to be restored.
+
+    Args:
+        state: The state.
+
+    Returns:
+        The names and values of the base vars and of the backend vars defined
+        by the class of the state, with the router data of a root state.
+    """
+    values = state.__dict__
+    base_vars = [
+        (name, values[name])
+        for name in state.base_vars
+        if name not in state.inherited_vars and name != "router" and name in values
+    ]
+    if state.parent_state is None and "router_data" in values:
+        # The router is rebuilt from the router data of the root state.
+        base_vars.append(("router_data", values["router_data"]))
+    backend_vars = [
+        (name, value)
+        for name, value in state._backend_vars.items()
+        if name not in state.inherited_backend_vars
+    ]
+    return base_vars, backend_vars
+
+
+def get_state_var(state: BaseState, name: str) -> tuple[bool, Any]:
+    """Get the value of a var a state needs to be restored.
+
+    Args:
+        state: The state.
+        name: The name of the var.
+
+    Returns:
+        Whether the var is stored with the state, and its value.
+    """
+    if name in state._backend_vars:
+        if name in state.inherited_backend_vars:
+            return False, None
+        return True, state._backend_vars[name]
+    if name == "router_data":
+        return state.parent_state is None, state.__dict__.get(name)
+    if name in state.base_vars and name not in state.inherited_vars and name != "router":
+        return name in state.__dict__, state.__dict__.get(name)
+    return False, None
+
+
+def set_state_var(state: BaseState, name: str, value: Any):
+    """Restore the value of a var, without marking it dirty.
+
+    Vars the class does not define anymore are ignored.
+
+    Args:
+        state: The state, a new instance of its class.
+        name: The name of the var.
+        value: The value of the var.
+    """
+    if name in state._backend_vars:
+        state._backend_vars[name] = value
+    elif name == "router_data":
+        state.__dict__[name] = value
+        if value:
+            from reflex.istate.data import RouterData
+
+            state.__dict__["router"] = RouterData(value)
+    elif name in state.base_vars:
+        state.__dict__[name] = value
+
+
+def decode_state(data: bytes, state_cls: type[BaseState]) -> BaseState:
+    """Decode a state encoded by any codec.
+
+    Args:
+        data: The encoded state.
+        state_cls: The class of the state.
+
+    Returns:
+        The decoded state.
+    """
+    if data[: len(COMPACT_MAGIC)] == COMPACT_MAGIC:
+        return CompactStateCodec().decode(data, state_cls)
+    return PickleStateCodec().decode(data, state_cls)
+
+
+def get_state_codec() -> StateCodec:
+    """Get the codec configured to encode states.
+
+    Returns:
+        The state codec.
+    """
+    from reflex.config import get_config
+
+    config = get_config()
+    return _create_state_codec(config.state_codec, config.state_compression_threshold)
+
+
+@functools.lru_cache
+def _create_state_codec(
+    mode: str, compression_threshold: int | None
+) -> StateCodec:
+    """Create a state codec.
+
+    Args:
+        mode: The name of the codec.
+        compression_threshold: The compression threshold of the compact codec.
+
+    Returns:
+        The state codec.
+
+    Raises:
+        ValueError: If the codec is unknown.
+    """
+    from reflex import constants
+
+    if mode == constants.StateCodecMode.PICKLE:
+        return PickleStateCodec()
+    if mode == constants.StateCodecMode.COMPACT:
+        return CompactStateCodec(compression_threshold)
+    raise ValueError(f"Invalid state codec: {mode}")
+
+
+def encode_value(out: bytearray, value: Any):
+    """Append the tagged encoding of a value.
+
+    Args:
+        out: The buffer to append to.
+        value: The value to encode.
+    """
+    value_type = type(value)
+    if value is None:
+        out.append(_TAG_NONE)
+    elif value_type is bool:
+        out.append(_TAG_TRUE if value else _TAG_FALSE)
+    elif value_type is int:
+        out.append(_TAG_INT)
+        # Zigzag, so small negative numbers stay small.
+        _write_uvarint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+    elif value_type is float:
+        out.append(_TAG_FLOAT)
+        out += _FLOAT.pack(value)
+    elif value_type is str:
+        out.append(_TAG_STR)
+        _write_str(out, value)
+    elif value_type is bytes:
+        out.append(_TAG_BYTES)
+        _write_uvarint(out, len(value))
+        out += value
+    else:
+        # Containers and other types are left to pickle, which runs in C and
+        # writes repeated objects like the keys of a list of dicts only once.
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        out.append(_TAG_PICKLE)
+        _write_uvarint(out, len(payload))
+        out += payload
+
+
+def decode_value(data: memoryview, pos: int) -> tuple[Any, int]:
+    """Decode a tagged value.
+
+    Args:
+        data: The encoded data.
+        pos: The position of the tag of the value.
+
+    Returns:
+        The value and the position after it.
+
+    Raises:
+        ValueError: If the tag is unknown.
+    """
+    tag = data[pos]
+    pos += 1
+    if tag == _TAG_NONE:
+        return None, pos
+    if tag == _TAG_TRUE:
+        return True, pos
+    if tag == _TAG_FALSE:
+        return False, pos
+    if tag == _TAG_INT:
+        zigzag, pos = _read_uvarint(data, pos)
+        return (zigzag >> 1) if not zigzag & 1 else -((zigzag + 1) >> 1), pos
+    if tag == _TAG_FLOAT:
+        return _FLOAT.unpack_from(data, pos)[0], pos + _FLOAT.size
+    if tag == _TAG_STR:
+        return _read_str(data, pos)
+    if tag == _TAG_BYTES:
+        size, pos = _read_uvarint(data, pos)
+        return bytes(data[pos : pos + size]), pos + size
+    if tag == _TAG_PICKLE:
+        size, pos = _read_uvarint(data, pos)
+        return pickle.loads(data[pos : pos + size]), pos + size
+    raise ValueError(f"Invalid state value tag: {tag}")
+
+
+def _write_uvarint(out: bytearray, value: int):
+    """Append an unsigned integer, 7 bits per byte.
+
+    Args:
+        out: The buffer to append to.
+        value: The integer to append.
+    """
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_uvarint(data: memoryview, pos: int) -> tuple[int, int]:
+    """Read an unsigned integer written by `_write_uvarint`.
+
+    Args:
+        data: The encoded data.
+        pos: The position of the integer.
+
+    Returns:
+        The integer and the position after it.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_str(out: bytearray, value: str):
+    """Append a string as its length and UTF-8 bytes.
+
+    Args:
+        out: The buffer to append to.
+        value: The string to append.
+    """
+    encoded = value.encode("utf-8", "surrogatepass")
+    _write_uvarint(out, len(encoded))
+    out += encoded
+
+
+def _read_str(data: memoryview, pos: int) -> tuple[str, int]:
+    """Read a string written by `_write_str`.
+
+    Args:
+        data: The encoded data.
+        pos: The position of the string.
+
+    Returns:
+        The string and the position after it.
+    """
+    size, pos = _read_uvarint(data, pos)
+    return str(data[pos : pos + size], "utf-8", "surrogatepass"), pos + size
@@ -10,7 +10,7 @@ import typer.core
 from reflex_cli.v2.deployments import check_version, hosting_cli
 
 from reflex import constants
-from reflex.config import environment, get_config
+from reflex.config import PerformanceMode, environment, get_config
 from reflex.custom_components.custom_components import custom_components_cli
 from reflex.state import reset_disk_state_manager
 from reflex.utils import console, telemetry
@@ -150,6 +150,12 @@ def _run(
     # Delete the states folder if it exists.
     reset_disk_state_manager()
 
+    # Start the state size profile of this run from scratch.
+    if environment.REFLEX_PERF_MODE.get() == PerformanceMode.PROFILE:
+        from reflex.utils import state_profile
+
+        state_profile.clear_profiles()
+
     # Find the next available open port if applicable.
     if frontend:
         auto_increment_frontend = not bool(frontend_port or config.frontend_port)
@@ -615,6 +621,50 @@ def rename(
     prerequisites.rename_app(new_name, loglevel)
 
 
+@cli.command(name="state-profile")
+def state_profile(
+    top: int = typer.Option(20, help="The number of vars to show."),
+    clear: bool = typer.Option(
+        False, help="Delete the recorded sizes instead of showing them."
+    ),
+    loglevel: constants.LogLevel = typer.Option(
+        config.loglevel, help="The log level to use."
+    ),
+):
+    """Show the state vars with the largest serialized sizes, recorded with REFLEX_PERF_MODE=profile."""
+    from reflex.utils import state_profile
+
+    console.set_log_level(loglevel)
+
+    if clear:
+        state_profile.clear_profiles()
+        return
+
+    rows = state_profile.get_report(top)
+    coverage = (
+        "Sizes are only recorded when states are serialized: never with the memory state manager, "
+        "and with the tiered state manager only for the states spilled to disk."
+    )
+    if not rows:
+        console.info(
+            "No state sizes were recorded. Run the app with REFLEX_PERF_MODE=profile first. "
+            + coverage
+        )
+        return
+
+    headers = ["state", "var", "kind", "count", "p50", "p90", "p99", "max"]
+    table = [headers, *([str(row[header]) for header in headers] for row in rows)]
+    widths = [max(len(line[i]) for line in table) for i in range(len(headers))]
+    for line in table:
+        console.print(
+            "  ".join(
+                cell.ljust(width) if i < 3 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(line, widths, strict=True))
+            )
+        )
+    console.info(coverage)
+
+
 cli.add_typer(db_cli, name="db", help="Subcommands for managing the database schema.")
 cli.add_typer(script_cli, name="script", help="Subcommands running helper scripts.")
 cli.add_typer(
@@ -10,12 +10,14 @@ import functools
 import inspect
 import json
 import pickle
+import sqlite3
 import sys
 import time
 import typing
 import uuid
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import md5
 from pathlib import Path
 from types import FunctionType, MethodType
@@ -46,7 +48,7 @@ from pydantic.v1 import BaseModel as BaseModelV1
 from pydantic.v1 import validator
 from pydantic.v1.fields import ModelField
 from redis.asyncio import Redis
-from redis.asyncio.client import PubSub
+from redis.commands.core import AsyncScript
 from redis.exceptions import ResponseError
 from sqlalchemy.orm import DeclarativeBase
 from typing_extensions import Self
@@ -1462,7 +1464,7 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
         return parent_state
 
     async def _get_state_from_redis(self, state_cls: Type[T_STATE]) -> T_STATE:
-        """Get a state instance from redis.
+        """Get a state instance from redis, or from disk with the disk state manager.
 
         Args:
             state_cls: The class of the state.
@@ -1471,14 +1473,16 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
             The instance of state_cls associated with this state's client_token.
 
         Raises:
-            RuntimeError: If redis is not used in this backend process.
+            RuntimeError: If neither redis nor disk is used in this backend process.
             StateMismatchError: If the state instance is not of the expected type.
         """
         # Then get the target state and all its substates.
         state_manager = get_state_manager()
-        if not isinstance(state_manager, StateManagerRedis):
+        if not isinstance(
+            state_manager, (StateManagerRedis, StateManagerDisk, StateManagerSQLite)
+        ):
             raise RuntimeError(
-                f"Requested state {state_cls.get_full_name()} is not cached and cannot be accessed without redis. "
+                f"Requested state {state_cls.get_full_name()} is not cached and cannot be accessed without redis or disk. "
                 "(All states should already be available -- this is likely a bug).",
             )
         state_in_redis = await state_manager.get_state(
@@ -1531,7 +1535,7 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
         except ValueError:
             pass
 
-        # Slow case - fetch missing parent states from redis.
+        # Slow case - fetch missing parent states from redis or disk.
         return await self._get_state_from_redis(state_cls)
 
     async def get_var_value(self, var: Var[VAR_TYPE]) -> VAR_TYPE:
@@ -1987,6 +1991,11 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
                 continue
             self.substates[substate]._clean()
 
+        # Remember the changed vars until they are saved to the redis hash the
+        # state was read from (see `StateManagerRedis.hash_fields`).
+        if self.dirty_vars and self.__dict__.get("_redis_fields_saved"):
+            self.__dict__.setdefault("_unsaved_vars", set()).update(self.dirty_vars)
+
         # Clean this state.
         self.dirty_vars = set()
         self.dirty_substates = set()
@@ -2103,6 +2112,8 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
         state["__dict__"].pop("parent_state", None)
         state["__dict__"].pop("substates", None)
         state["__dict__"].pop("_was_touched", None)
+        state["__dict__"].pop("_unsaved_vars", None)
+        state["__dict__"].pop("_redis_fields_saved", None)
         # Remove all inherited vars.
         for inherited_var_name in self.inherited_vars:
             state["__dict__"].pop(inherited_var_name, None)
@@ -2142,7 +2153,10 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
                 f"State {state_full_name} serializes to {pickle_state_size} bytes "
                 + "which may present performance issues. Consider reducing the size of this state."
             )
-            if environment.REFLEX_PERF_MODE.get() == PerformanceMode.WARN:
+            if environment.REFLEX_PERF_MODE.get() in (
+                PerformanceMode.WARN,
+                PerformanceMode.PROFILE,
+            ):
                 console.warn(msg)
             elif environment.REFLEX_PERF_MODE.get() == PerformanceMode.RAISE:
                 raise StateTooLargeError(msg)
@@ -2188,10 +2202,12 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
         Raises:
             StateSerializationError: If the state cannot be serialized.
         """
+        from reflex.istate.codec import get_state_codec
+
         payload = b""
         error = ""
         try:
-            payload = pickle.dumps((self._to_schema(), self))
+            payload = get_state_codec().encode(self)
         except HANDLED_PICKLE_ERRORS as og_pickle_error:
             error = (
                 f"Failed to serialize state {self.get_full_name()} due to unpicklable object. "
@@ -2210,8 +2226,13 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
                 error += f"Dill was also unable to pickle the state: {ex}"
             console.warn(error)
 
-        if environment.REFLEX_PERF_MODE.get() != PerformanceMode.OFF:
+        perf_mode = environment.REFLEX_PERF_MODE.get()
+        if perf_mode != PerformanceMode.OFF:
             self._check_state_size(len(payload))
+        if perf_mode == PerformanceMode.PROFILE:
+            from reflex.utils import state_profile
+
+            state_profile.record_state_sizes(self)
 
         if not payload:
             raise StateSerializationError(error)
@@ -2224,7 +2245,9 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
     ) -> BaseState:
         """Deserialize the state from redis/disk.
 
-        data and fp are mutually exclusive, but one must be provided.
+        data and fp are mutually exclusive, but one must be provided. States
+        written by the compact codec are decoded into an instance of cls, so
+        it must be called on the class of the state.
 
         Args:
             data: The serialized state data.
@@ -2237,15 +2260,13 @@ class BaseState(Base, ABC, extra=pydantic.Extra.allow):
             ValueError: If both data and fp are provided, or neither are provided.
             StateSchemaMismatchError: If the state schema does not match the expected schema.
         """
-        if data is not None and fp is None:
-            (substate_schema, state) = pickle.loads(data)
-        elif fp is not None and data is None:
-            (substate_schema, state) = pickle.load(fp)
-        else:
+        from reflex.istate.codec import decode_state
+
+        if fp is not None and data is None:
+            data = fp.read()
+        elif data is None or fp is not None:
             raise ValueError("Only one of `data` or `fp` must be provided")
-        if substate_schema != state._to_schema():
-            raise StateSchemaMismatchError()
-        return state
+        return decode_state(data, cls)
 
 
 T_STATE = TypeVar("T_STATE", bound=BaseState)
@@ -2800,7 +2821,7 @@ class StateManager(Base, ABC):
             InvalidStateManagerModeError: If the state manager mode is invalid.
 
         Returns:
-            The state manager (either disk, memory or redis).
+            The state manager (either disk, memory, redis, tiered or sqlite).
         """
         config = get_config()
         if prerequisites.parse_redis_url() is not None:
@@ -2809,6 +2830,10 @@ class StateManager(Base, ABC):
             return StateManagerMemory(state=state)
         if config.state_manager_mode == constants.StateManagerMode.DISK:
             return StateManagerDisk(state=state)
+        if config.state_manager_mode == constants.StateManagerMode.TIERED:
+            return StateManagerTiered(state=state)
+        if config.state_manager_mode == constants.StateManagerMode.SQLITE:
+            return StateManagerSQLite(state=state)
         if config.state_manager_mode == constants.StateManagerMode.REDIS:
             redis = prerequisites.get_redis()
             if redis is not None:
@@ -2819,11 +2844,119 @@ class StateManager(Base, ABC):
                     token_expiration=config.redis_token_expiration,
                     lock_expiration=config.redis_lock_expiration,
                     lock_warning_threshold=config.redis_lock_warning_threshold,
+                    near_cache_size=config.redis_near_cache_size,
+                    hash_fields=config.redis_state_hash_fields,
                 )
         raise InvalidStateManagerModeError(
-            f"Expected one of: DISK, MEMORY, REDIS, got {config.state_manager_mode}"
+            f"Expected one of: DISK, MEMORY, REDIS, TIERED, SQLITE, got {config.state_manager_mode}"
         )
 
+    def _get_required_state_classes(
+        self,
+        target_state_cls: Type[BaseState],
+        subclasses: bool = False,
+        required_state_classes: set[Type[BaseState]] | None = None,
+    ) -> set[Type[BaseState]]:
+        """Recursively determine which states are required to fetch the target state.
+
+        This will always include potentially dirty substates that depend on vars
+        in the target_state_cls.
+
+        Args:
+            target_state_cls: The target state class being fetched.
+            subclasses: Whether to include subclasses of the target state.
+            required_state_classes: Recursive argument tracking state classes that have already been seen.
+
+        Returns:
+            The set of state classes required to fetch the target state.
+        """
+        if required_state_classes is None:
+            required_state_classes = set()
+        # Get the substates if requested.
+        if subclasses:
+            for substate in target_state_cls.get_substates():
+                self._get_required_state_classes(
+                    substate,
+                    subclasses=True,
+                    required_state_classes=required_state_classes,
+                )
+        if target_state_cls in required_state_classes:
+            return required_state_classes
+        required_state_classes.add(target_state_cls)
+
+        # Get dependent substates.
+        for pd_substates in target_state_cls._get_potentially_dirty_states():
+            self._get_required_state_classes(
+                pd_substates,
+                subclasses=False,
+                required_state_classes=required_state_classes,
+            )
+
+        # Get the parent state if it exists.
+        if parent_state := target_state_cls.get_parent_state():
+            self._get_required_state_classes(
+                parent_state,
+                subclasses=False,
+                required_state_classes=required_state_classes,
+            )
+        return required_state_classes
+
+    def _get_populated_states(
+        self,
+        target_state: BaseState,
+        populated_states: dict[str, BaseState] | None = None,
+    ) -> dict[str, BaseState]:
+        """Recursively determine which states from target_state are already fetched.
+
+        Args:
+            target_state: The state to check for populated states.
+            populated_states: Recursive argument tracking states seen in previous calls.
+
+        Returns:
+            A dictionary of state full name to state instance.
+        """
+        if populated_states is None:
+            populated_states = {}
+        if target_state.get_full_name() in populated_states:
+            return populated_states
+        populated_states[target_state.get_full_name()] = target_state
+        for substate in target_state.substates.values():
+            self._get_populated_states(substate, populated_states=populated_states)
+        if target_state.parent_state is not None:
+            self._get_populated_states(
+                target_state.parent_state, populated_states=populated_states
+            )
+        return populated_states
+
+    @staticmethod
+    def _attach_states(
+        flat_state_tree: dict[str, BaseState],
+        states: Sequence[BaseState],
+    ):
+        """Attach fetched states to their parents in a state tree.
+
+        Args:
+            flat_state_tree: A dictionary of state full name to the state instances already in the tree, updated in place.
+            states: The fetched states, parents before their substates.
+
+        Raises:
+            RuntimeError: when the parent state of a state was not fetched.
+        """
+        for state in states:
+            flat_state_tree[state.get_full_name()] = state
+            if state.get_parent_state() is None:
+                continue
+            parent_state_name, _dot, state_name = state.get_full_name().rpartition(".")
+            parent_state = flat_state_tree.get(parent_state_name)
+            if parent_state is None:
+                raise RuntimeError(
+                    f"Parent state for {state.get_full_name()} was not found "
+                    "in the state tree, but should have already been fetched. "
+                    "This is a bug",
+                )
+            parent_state.substates[state_name] = state
+            state.parent_state = parent_state
+
     @abstractmethod
     async def get_state(self, token: str) -> BaseState:
         """Get the state for a token.
@@ -2859,19 +2992,84 @@ class StateManager(Base, ABC):
         """
         yield self.state()
 
+    async def close(self):  # noqa: B027
+        """Release the resources of the state manager, when the app shuts down."""
+        pass
+
+
+def _default_token_expiration() -> int:
+    """Get the default token expiration time.
+
+    Returns:
+        The default token expiration time.
+    """
+    return get_config().redis_token_expiration
+
+
+def _default_memory_max_sessions() -> int | None:
+    """Get the default maximum number of sessions kept by the memory state manager.
+
+    Returns:
+        The default maximum number of sessions, or None for no limit.
+    """
+    return get_config().memory_state_max_sessions
+
+
+def _default_memory_max_bytes() -> int | None:
+    """Get the default estimated byte budget of the memory state manager.
+
+    Returns:
+        The default byte budget, or None for no limit.
+    """
+    return get_config().memory_state_max_bytes
+
 
 class StateManagerMemory(StateManager):
-    """A state manager that stores states in memory."""
+    """A state manager that stores states in memory.
 
-    # The mapping of client ids to states.
+    Sessions are evicted, least recently used first, when they have been idle
+    for longer than the token expiration, when there are more than
+    `max_sessions` of them, or when their estimated size exceeds `max_bytes`.
+    Sessions held by `modify_state` are never evicted.
+    """
+
+    # The mapping of client ids to states, least recently used first.
     states: dict[str, BaseState] = {}
 
+    # The token expiration time (s), after which idle sessions are evicted.
+    token_expiration: int = pydantic.Field(default_factory=_default_token_expiration)
+
+    # The maximum number of sessions to keep, or None for no limit.
+    max_sessions: int | None = pydantic.Field(
+        default_factory=_default_memory_max_sessions
+    )
+
+    # The maximum estimated size of all sessions in bytes, or None for no limit.
+    max_bytes: int | None = pydantic.Field(default_factory=_default_memory_max_bytes)
+
     # The mutex ensures the dict of mutexes is updated exclusively
     _state_manager_lock = asyncio.Lock()
 
     # The dict of mutexes for each client
     _states_locks: dict[str, asyncio.Lock] = pydantic.PrivateAttr({})
 
+    # The number of modify_state calls holding or waiting for each client's lock.
+    _states_lock_users: dict[str, int] = pydantic.PrivateAttr({})
+
+    # The last time each client's state was accessed.
+    _last_access: dict[str, float] = pydantic.PrivateAttr({})
+
+    # The estimated pickled size of each substate of each client, by substate name.
+    _substate_sizes: dict[str, dict[str, int]] = pydantic.PrivateAttr({})
+
+    # The estimated size of all sessions in bytes.
+    _total_bytes: int = pydantic.PrivateAttr(0)
+
+    # The number of evicted sessions, by reason.
+    _evictions: dict[str, int] = pydantic.PrivateAttr(
+        {"expired": 0, "max_sessions": 0, "max_bytes": 0}
+    )
+
     class Config:  # pyright: ignore [reportIncompatibleVariableOverride]
         """The Pydantic config."""
 
@@ -2891,9 +3089,14 @@ class StateManagerMemory(StateManager):
         """
         # Memory state manager ignores the substate suffix and always returns the top-level state.
         token = _split_substate_key(token)[0]
-        if token not in self.states:
-            self.states[token] = self.state(_reflex_internal_init=True)
-        return self.states[token]
+        state = self.states.pop(token, None)
+        if state is None:
+            state = self.state(_reflex_internal_init=True)
+        # Re-insert to mark the token as most recently used.
+        self.states[token] = state
+        self._last_access[token] = time.monotonic()
+        self._evict(token)
+        return state
 
     @override
     async def set_state(self, token: str, state: BaseState):
@@ -2903,7 +3106,13 @@ class StateManagerMemory(StateManager):
             token: The token to set the state for.
             state: The state to set.
         """
-        pass
+        if self.max_bytes is None:
+            return
+        token = _split_substate_key(token)[0]
+        if self.states.get(token) is not state:
+            return
+        self._update_state_size(token, state)
+        self._evict(token)
 
     @override
     @contextlib.asynccontextmanager
@@ -2923,19 +3132,90 @@ class StateManagerMemory(StateManager):
                 if token not in self._states_locks:
                     self._states_locks[token] = asyncio.Lock()
 
-        async with self._states_locks[token]:
-            state = await self.get_state(token)
-            yield state
-            await self.set_state(token, state)
+        # The lock of a session in use must not be evicted.
+        self._states_lock_users[token] = self._states_lock_users.get(token, 0) + 1
+        try:
+            async with self._states_locks[token]:
+                state = await self.get_state(token)
+                yield state
+                await self.set_state(token, state)
+        finally:
+            self._states_lock_users[token] -= 1
+            if not self._states_lock_users[token]:
+                del self._states_lock_users[token]
 
+    def get_metrics(self) -> dict[str, Any]:
+        """Get the session count, estimated size and eviction counts.
 
-def _default_token_expiration() -> int:
-    """Get the default token expiration time.
+        Returns:
+            The number of "sessions", their "estimated_bytes" (0 unless
+            max_bytes is set) and the number of "evictions" by reason.
+        """
+        return {
+            "sessions": len(self.states),
+            "estimated_bytes": self._total_bytes,
+            "evictions": dict(self._evictions),
+        }
 
-    Returns:
-        The default token expiration time.
-    """
-    return get_config().redis_token_expiration
+    def _update_state_size(self, token: str, state: BaseState):
+        """Update the estimated size of the substates of a client that were touched.
+
+        Args:
+            token: The client token.
+            state: The root state of the client.
+        """
+        sizes = self._substate_sizes.setdefault(token, {})
+        pending = [state]
+        while pending:
+            substate = pending.pop()
+            pending.extend(substate.substates.values())
+            name = substate.get_full_name()
+            if name in sizes and not substate._get_was_touched():
+                continue
+            substate._was_touched = False
+            try:
+                size = len(pickle.dumps(substate))
+            except Exception:
+                # Memory states do not have to be picklable; keep the last estimate.
+                size = sizes.get(name, 0)
+            self._total_bytes += size - sizes.get(name, 0)
+            sizes[name] = size
+
+    def _evict(self, current_token: str):
+        """Evict expired sessions, then least recently used sessions over the limits.
+
+        Args:
+            current_token: The token of the session being accessed, which is kept.
+        """
+        now = time.monotonic()
+        for token in list(self.states):
+            if token == current_token:
+                continue
+            if self.max_sessions is not None and len(self.states) > self.max_sessions:
+                reason = "max_sessions"
+            elif self.max_bytes is not None and self._total_bytes > self.max_bytes:
+                reason = "max_bytes"
+            elif now - self._last_access.get(token, now) > self.token_expiration:
+                reason = "expired"
+            else:
+                # Sessions are ordered by last access, the others are more recent.
+                break
+            if token in self._states_lock_users:
+                continue
+            self._evict_token(token)
+            self._evictions[reason] += 1
+
+    def _evict_token(self, token: str):
+        """Drop the state, lock and bookkeeping of a client.
+
+        Args:
+            token: The client token.
+        """
+        self.states.pop(token, None)
+        self._states_locks.pop(token, None)
+        self._last_access.pop(token, None)
+        self._total_bytes -= sum(self._substate_sizes.pop(token, {}).values())
+        console.debug(f"Evicted state for token {token} from memory.")
 
 
 def _serialize_type(type_: Any) -> str:
@@ -2976,7 +3256,11 @@ def reset_disk_state_manager():
 
 
 class StateManagerDisk(StateManager):
-    """A state manager that stores states in memory."""
+    """A state manager that stores states on disk and caches them in memory.
+
+    Disk I/O runs in worker threads, so reading and writing states does not
+    block the event loop.
+    """
 
     # The mapping of client ids to states.
     states: dict[str, BaseState] = {}
@@ -3024,8 +3308,8 @@ class StateManagerDisk(StateManager):
         import time
 
         for path in path_ops.ls(self.states_directory):
-            # check path is a pickle file
-            if path.suffix != ".pkl":
+            # check path is a pickle file, or a temporary file left by an interrupted write
+            if path.suffix not in (".pkl", ".tmp"):
                 continue
 
             # load last edited field from file
@@ -3049,100 +3333,165 @@ class StateManagerDisk(StateManager):
             self.states_directory / f"{md5(token.encode()).hexdigest()}.pkl"
         ).absolute()
 
-    async def load_state(self, token: str) -> BaseState | None:
-        """Load a state object based on the provided token.
+    @staticmethod
+    def _read_state_file(
+        token_path: Path, state_cls: Type[BaseState]
+    ) -> BaseState | None:
+        """Read and deserialize a state file.
+
+        This runs in a worker thread.
 
         Args:
-            token: The token used to identify the state object.
+            token_path: The path of the state file.
+            state_cls: The class of the state.
 
         Returns:
-            The loaded state object or None.
+            The deserialized state object or None.
         """
-        token_path = self.token_path(token)
+        try:
+            with token_path.open(mode="rb") as file:
+                return state_cls._deserialize(fp=file)
+        except Exception:
+            return None
 
-        if token_path.exists():
-            try:
-                with token_path.open(mode="rb") as file:
-                    return BaseState._deserialize(fp=file)
-            except Exception:
-                pass
+    @staticmethod
+    def _write_state_file(token_path: Path, pickle_state: bytes):
+        """Atomically replace a state file.
 
-    async def populate_substates(
-        self, client_token: str, state: BaseState, root_state: BaseState
-    ):
-        """Populate the substates of a state object.
+        The state is written to a temporary file in the same directory, then
+        renamed over the state file, so readers never see a partial write.
+        This runs in a worker thread.
 
         Args:
-            client_token: The client token.
-            state: The state object to populate.
-            root_state: The root state object.
+            token_path: The path of the state file.
+            pickle_state: The serialized state.
         """
-        for substate in state.get_substates():
-            substate_token = _substate_key(client_token, substate)
+        token_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = token_path.with_name(f"{token_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            temp_path.write_bytes(pickle_state)
+            temp_path.replace(token_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
-            fresh_instance = await root_state.get_state(substate)
-            instance = await self.load_state(substate_token)
-            if instance is not None:
-                # Ensure all substates exist, even if they weren't serialized previously.
-                instance.substates = fresh_instance.substates
-            else:
-                instance = fresh_instance
-            state.substates[substate.get_name()] = instance
-            instance.parent_state = state
+    async def load_state(self, token: str) -> BaseState | None:
+        """Load a state object based on the provided token.
+
+        The file is read and deserialized in a worker thread.
+
+        Args:
+            token: The token used to identify the state object.
 
-            await self.populate_substates(client_token, instance, root_state)
+        Returns:
+            The loaded state object or None.
+        """
+        state_path = _split_substate_key(token)[1]
+        state_cls = (
+            self.state.get_class_substate(state_path) if state_path else self.state
+        )
+        return await asyncio.to_thread(
+            self._read_state_file, self.token_path(token), state_cls
+        )
 
     @override
     async def get_state(
         self,
         token: str,
+        top_level: bool = True,
+        for_state_instance: BaseState | None = None,
     ) -> BaseState:
         """Get the state for a token.
 
+        Like `StateManagerRedis`, only the states required to handle the
+        requested substate are loaded from disk; the others are loaded when
+        they are first accessed with `BaseState.get_state`. Loaded states are
+        kept in memory for the following events.
+
         Args:
-            token: The token to get the state for.
+            token: The token to get the state for, optionally suffixed with the
+                full name of a substate.
+            top_level: If true, return an instance of the top-level state (self.state).
+            for_state_instance: If provided, attach the requested states to this existing state tree.
 
         Returns:
             The state for the token.
         """
-        client_token = _split_substate_key(token)[0]
-        root_state = self.states.get(client_token)
-        if root_state is not None:
-            # Retrieved state from memory.
-            return root_state
+        client_token, state_path = _split_substate_key(token)
+        state_cls = (
+            self.state.get_class_substate(state_path) if state_path else self.state
+        )
 
-        # Deserialize root state from disk.
-        root_state = await self.load_state(_substate_key(client_token, self.state))
-        # Create a new root state tree with all substates instantiated.
-        fresh_root_state = self.state(_reflex_internal_init=True)
-        if root_state is None:
-            root_state = fresh_root_state
-        else:
-            # Ensure all substates exist, even if they were not serialized previously.
-            root_state.substates = fresh_root_state.substates
-        self.states[client_token] = root_state
-        await self.populate_substates(client_token, root_state, root_state)
-        return root_state
+        # Determine which states we already have.
+        if for_state_instance is None:
+            for_state_instance = self.states.get(client_token)
+        flat_state_tree: dict[str, BaseState] = (
+            self._get_populated_states(for_state_instance) if for_state_instance else {}
+        )
+
+        # Determine which states from the tree need to be loaded.
+        required_state_classes = sorted(
+            self._get_required_state_classes(state_cls, subclasses=True)
+            - {type(s) for s in flat_state_tree.values()},
+            key=lambda x: x.get_full_name(),
+        )
+
+        loaded_states = await asyncio.gather(
+            *(
+                self.load_state(_substate_key(client_token, required_state_cls))
+                for required_state_cls in required_state_classes
+            )
+        )
+
+        self._attach_states(
+            flat_state_tree,
+            [
+                # File didn't exist or schema mismatch so create a new instance for this token.
+                state
+                if state is not None
+                else required_state_cls(init_substates=False, _reflex_internal_init=True)
+                for required_state_cls, state in zip(
+                    required_state_classes, loaded_states, strict=True
+                )
+            ],
+        )
+
+        root_state = flat_state_tree[self.state.get_full_name()]
+        self.states.setdefault(client_token, root_state)
+        if top_level:
+            return root_state
+        return flat_state_tree[state_cls.get_full_name()]
 
     async def set_state_for_substate(self, client_token: str, substate: BaseState):
-        """Set the state for a substate.
+        """Set the state for a substate and its loaded substates.
+
+        The touched states are serialized, then written to disk in worker
+        threads.
 
         Args:
             client_token: The client token.
             substate: The substate to set.
         """
-        substate_token = _substate_key(client_token, substate)
-
-        if substate._get_was_touched():
-            substate._was_touched = False  # Reset the touched flag after serializing.
-            pickle_state = substate._serialize()
+        writes = []
+        pending = [substate]
+        while pending:
+            state = pending.pop()
+            pending.extend(state.substates.values())
+            if not state._get_was_touched():
+                continue
+            state._was_touched = False  # Reset the touched flag after serializing.
+            pickle_state = state._serialize()
             if pickle_state:
-                if not self.states_directory.exists():
-                    self.states_directory.mkdir(parents=True, exist_ok=True)
-                self.token_path(substate_token).write_bytes(pickle_state)
+                writes.append(
+                    (self.token_path(_substate_key(client_token, state)), pickle_state)
+                )
 
-        for substate_substate in substate.substates.values():
-            await self.set_state_for_substate(client_token, substate_substate)
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(self._write_state_file, token_path, pickle_state)
+                for token_path, pickle_state in writes
+            )
+        )
 
     @override
     async def set_state(self, token: str, state: BaseState):
@@ -3179,41 +3528,311 @@ class StateManagerDisk(StateManager):
             await self.set_state(token, state)
 
 
-def _default_lock_expiration() -> int:
-    """Get the default lock expiration time.
+def _default_tiered_idle_threshold() -> int:
+    """Get the default idle threshold of the tiered state manager.
 
     Returns:
-        The default lock expiration time.
+        The default idle threshold in seconds.
     """
-    return get_config().redis_lock_expiration
+    return get_config().tiered_state_idle_threshold
 
 
-def _default_lock_warning_threshold() -> int:
-    """Get the default lock warning threshold.
+class StateManagerTiered(StateManagerDisk):
+    """A state manager that keeps active states in memory and spills idle states to disk.
 
-    Returns:
-        The default lock warning threshold.
+    Events are served from memory and nothing is written to disk while a
+    client is active. Once a client has been idle for `idle_threshold`
+    seconds, the substates touched since they were loaded are serialized to
+    the `StateManagerDisk` directory layout and the state tree is dropped
+    from memory; the next event loads it back from disk.
+
+    Idle states are spilled by a background task, which runs while states
+    are held in memory, so events never wait for the disk writes of other
+    clients. `close` spills the remaining states, and the app calls it when
+    it shuts down.
     """
-    return get_config().redis_lock_warning_threshold
 
+    # Seconds after the last access before a client's state is spilled to disk.
+    idle_threshold: int = pydantic.Field(default_factory=_default_tiered_idle_threshold)
 
-class StateManagerRedis(StateManager):
-    """A state manager that stores states in redis."""
+    # The number of modify_state calls holding or waiting for each client's lock.
+    _states_lock_users: dict[str, int] = pydantic.PrivateAttr({})
 
-    # The redis client to use.
-    redis: Redis
+    # The last time each client's state was accessed.
+    _last_access: dict[str, float] = pydantic.PrivateAttr({})
 
-    # The token expiration time (s).
-    token_expiration: int = pydantic.Field(default_factory=_default_token_expiration)
+    # The task spilling idle states, while states are held in memory.
+    _spill_task: asyncio.Task | None = pydantic.PrivateAttr(None)
 
-    # The maximum time to hold a lock (ms).
-    lock_expiration: int = pydantic.Field(default_factory=_default_lock_expiration)
+    @override
+    async def get_state(
+        self,
+        token: str,
+        top_level: bool = True,
+        for_state_instance: BaseState | None = None,
+    ) -> BaseState:
+        """Get the state for a token, loading it from disk if it was spilled.
+
+        Args:
+            token: The token to get the state for.
+            top_level: If true, return an instance of the top-level state (self.state).
+            for_state_instance: If provided, attach the requested states to this existing state tree.
+
+        Returns:
+            The state for the token.
+        """
+        client_token = _split_substate_key(token)[0]
+        state = await super().get_state(token, top_level, for_state_instance)
+        # Re-insert to mark the token as most recently used.
+        self.states[client_token] = self.states.pop(client_token)
+        self._last_access[client_token] = time.monotonic()
+        if self._spill_task is None or self._spill_task.done():
+            self._spill_task = asyncio.create_task(self._spill_idle_states_loop())
+        return state
+
+    @override
+    async def set_state(self, token: str, state: BaseState):
+        """Keep the state in memory until the client is idle.
+
+        The touched flags of the substates are kept, so the substates are
+        written when the state is spilled.
+
+        Args:
+            token: The token to set the state for.
+            state: The state to set.
+        """
+        self._last_access[_split_substate_key(token)[0]] = time.monotonic()
+
+    @override
+    @contextlib.asynccontextmanager
+    async def modify_state(self, token: str) -> AsyncIterator[BaseState]:
+        """Modify the state for a token while holding exclusive lock.
+
+        Args:
+            token: The token to modify the state for.
+
+        Yields:
+            The state for the token.
+        """
+        client_token = _split_substate_key(token)[0]
+        # The state of a client in use must not be spilled.
+        self._states_lock_users[client_token] = (
+            self._states_lock_users.get(client_token, 0) + 1
+        )
+        try:
+            async with await self._get_state_lock(client_token):
+                state = await self.get_state(token)
+                yield state
+                await self.set_state(token, state)
+        finally:
+            self._states_lock_users[client_token] -= 1
+            if not self._states_lock_users[client_token]:
+                del self._states_lock_users[client_token]
+
+    async def close(self):
+        """Stop spilling idle states, then spill the states of all clients that are not in use to disk."""
+        if self._spill_task is not None:
+            self._spill_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._spill_task
+            self._spill_task = None
+        for client_token in list(self.states):
+            if client_token not in self._states_lock_users:
+                await self._spill_state(client_token)
+
+    async def _get_state_lock(self, client_token: str) -> asyncio.Lock:
+        """Get the lock of a client, creating it if needed.
+
+        Args:
+            client_token: The client token.
+
+        Returns:
+            The lock of the client.
+        """
+        if client_token not in self._states_locks:
+            async with self._state_manager_lock:
+                if client_token not in self._states_locks:
+                    self._states_locks[client_token] = asyncio.Lock()
+        return self._states_locks[client_token]
+
+    async def _spill_idle_states_loop(self):
+        """Spill idle states periodically, until no state is held in memory."""
+        while self.states:
+            await asyncio.sleep(max(self.idle_threshold / 2, 1))
+            try:
+                await self._spill_idle_states()
+            except Exception as ex:
+                console.error(f"Failed to spill idle states to disk: {ex}")
+
+    async def _spill_idle_states(self):
+        """Spill the states of the clients idle for longer than the threshold."""
+        now = time.monotonic()
+        for client_token in list(self.states):
+            last_access = self._last_access.get(client_token, now)
+            if (
+                now - last_access > self.idle_threshold
+                and client_token not in self._states_lock_users
+            ):
+                await self._spill_state(client_token, last_access)
+
+    async def _spill_state(self, client_token: str, last_access: float | None = None):
+        """Write the touched substates of a client to disk and drop it from memory.
+
+        Args:
+            client_token: The client token.
+            last_access: The last access time the client was found idle at, to
+                keep the state in memory if it was accessed since.
+        """
+        async with await self._get_state_lock(client_token):
+            root_state = self.states.get(client_token)
+            if root_state is None:
+                return
+            await self.set_state_for_substate(client_token, root_state)
+            if client_token in self._states_lock_users or (
+                last_access is not None
+                and self._last_access.get(client_token) != last_access
+            ):
+                # The client was accessed while writing, keep serving it from memory.
+                return
+            # Drop the state only once written, so readers never see a stale copy.
+            del self.states[client_token]
+            self._last_access.pop(client_token, None)
+            self._states_locks.pop(client_token, None)
+
+
+# The suffix of the key holding the version of a substate key, bumped on every write.
+_REDIS_VERSION_SUFFIX = ":version"
+
+# Write states only if the lock (KEYS[1]) is held by ARGV[1]. The other keys are
+# set to the values from ARGV[3] on, expiring after ARGV[2] seconds, and their
+# versions are bumped. Returns the remaining time of the lock in milliseconds
+# followed by the new versions, or nil if the lock is not held.
+_REDIS_SET_STATE_SCRIPT = """
+if redis.call("GET", KEYS[1]) ~= ARGV[1] then
+    return false
+end
+local result = {redis.call("PTTL", KEYS[1])}
+for i = 2, #KEYS do
+    redis.call("SET", KEYS[i], ARGV[i + 1], "EX", ARGV[2])
+    local version_key = KEYS[i] .. "%(version_suffix)s"
+    result[i] = redis.call("INCR", version_key)
+    redis.call("EXPIRE", version_key, ARGV[2])
+end
+return result
+""" % {"version_suffix": _REDIS_VERSION_SUFFIX}
+
+# Get the versions of the states in KEYS, and their values when the version
+# differs from the cached version in ARGV ("" if not cached). Returns {1} for
+# each state whose cached version is current, and {0, version, value} for the
+# others, with false for a missing version or value.
+_REDIS_GET_STATE_SCRIPT = """
+local result = {}
+for i = 1, #KEYS do
+    local version = redis.call("GET", KEYS[i] .. "%(version_suffix)s")
+    if version and version == ARGV[i] then
+        result[i] = {1}
+    else
+        result[i] = {0, version, redis.call("GET", KEYS[i])}
+    end
+end
+return result
+""" % {"version_suffix": _REDIS_VERSION_SUFFIX}
+
+
+# The suffix of the key of the redis hash holding the fields of a substate.
+_REDIS_FIELDS_SUFFIX = ":fields"
+
+# The hash field holding the schema hash of the substate class.
+_REDIS_SCHEMA_FIELD = "__schema__"
+
+# The maximum number of fields set by each HSET of the fields script.
+_REDIS_HSET_CHUNK_PAIRS = 500
+
+# Write the fields of states only if the lock (KEYS[1]) is held by ARGV[1]. The
+# other keys are hashes expiring after ARGV[2] seconds. From ARGV[3] on, each
+# hash has a flag that is "1" to delete the hash first, a count of fields,
+# then the field names and values. Returns the remaining time of the lock in
+# milliseconds, or nil if the lock is not held. The fields are set in chunks, as
+# unpacking too many values at once overflows the stack of the Lua interpreter.
+_REDIS_SET_STATE_FIELDS_SCRIPT = """
+if redis.call("GET", KEYS[1]) ~= ARGV[1] then
+    return false
+end
+local lock_pttl = redis.call("PTTL", KEYS[1])
+local arg = 3
+for i = 2, #KEYS do
+    if ARGV[arg] == "1" then
+        redis.call("DEL", KEYS[i])
+    end
+    local count = tonumber(ARGV[arg + 1])
+    arg = arg + 2
+    local last = arg + 2 * count - 1
+    for first = arg, last, %(chunk_size)d do
+        redis.call("HSET", KEYS[i], unpack(ARGV, first, math.min(first + %(chunk_size)d - 1, last)))
+    end
+    arg = last + 1
+    redis.call("EXPIRE", KEYS[i], ARGV[2])
+end
+return lock_pttl
+""" % {"chunk_size": 2 * _REDIS_HSET_CHUNK_PAIRS}
+
+
+def _default_redis_near_cache_size() -> int:
+    """Get the default size of the near-cache of the redis state manager.
+
+    Returns:
+        The default maximum number of clients cached, 0 to disable the cache.
+    """
+    return get_config().redis_near_cache_size
+
+
+def _default_redis_hash_fields() -> bool:
+    """Get whether the redis state manager stores substates as hashes of fields by default.
+
+    Returns:
+        The default for StateManagerRedis.hash_fields.
+    """
+    return get_config().redis_state_hash_fields
+
+
+def _default_lock_expiration() -> int:
+    """Get the default lock expiration time.
+
+    Returns:
+        The default lock expiration time.
+    """
+    return get_config().redis_lock_expiration
+
+
+def _default_lock_warning_threshold() -> int:
+    """Get the default lock warning threshold.
+
+    Returns:
+        The default lock warning threshold.
+    """
+    return get_config().redis_lock_warning_threshold
+
+
+class StateManagerRedis(StateManager):
+    """A state manager that stores states in redis."""
+
+    # The redis client to use.
+    redis: Redis
+
+    # The token expiration time (s).
+    token_expiration: int = pydantic.Field(default_factory=_default_token_expiration)
+
+    # The maximum time to hold a lock (ms).
+    lock_expiration: int = pydantic.Field(default_factory=_default_lock_expiration)
 
     # The maximum time to hold a lock (ms) before warning.
     lock_warning_threshold: int = pydantic.Field(
         default_factory=_default_lock_warning_threshold
     )
 
+    # How often to try a held lock (ms) when keyspace notifications are disabled.
+    lock_poll_interval: int = 50
+
     # The keyspace subscription string when redis is waiting for lock to be released.
     _redis_notify_keyspace_events: str = (
         "K"  # Enable keyspace notifications (target a particular key)
@@ -3230,88 +3849,782 @@ class StateManagerRedis(StateManager):
         b"evicted",
     }
 
-    # Whether keyspace notifications have been enabled.
-    _redis_notify_keyspace_events_enabled: bool = False
+    # Whether keyspace notifications have been enabled, None until checked.
+    _redis_notify_keyspace_events_enabled: bool | None = None
 
     # The logical database number used by the redis client.
     _redis_db: int = 0
 
-    def _get_required_state_classes(
+    # The maximum number of clients whose deserialized states are cached in this worker, 0 to disable the cache.
+    near_cache_size: int = pydantic.Field(default_factory=_default_redis_near_cache_size)
+
+    # Whether to store each substate as a hash of its encoded vars, only writing the changed vars. States stored as hashes are never near-cached.
+    hash_fields: bool = pydantic.Field(default_factory=_default_redis_hash_fields)
+
+    # The script checking the lock and writing the states in set_state.
+    _set_state_script: AsyncScript | None = pydantic.PrivateAttr(None)
+
+    # The script checking the lock and writing the changed fields in set_state.
+    _set_state_fields_script: AsyncScript | None = pydantic.PrivateAttr(None)
+
+    # The script reading the states whose cached version is not current.
+    _get_state_script: AsyncScript | None = pydantic.PrivateAttr(None)
+
+    # The deserialized states of each client with their version, least recently used client first.
+    _near_cache: dict[str, dict[str, tuple[int, BaseState]]] = pydantic.PrivateAttr({})
+
+    # The task holding the lock of each client in modify_state, the only one using the near cache of the client.
+    _near_cache_owners: dict[str, asyncio.Task] = pydantic.PrivateAttr({})
+
+    # The task listening to lock release events for all the waiters of this worker.
+    _lock_listener: asyncio.Task | None = pydantic.PrivateAttr(None)
+
+    # Resolved once the lock listener is subscribed, or failed if it could not subscribe.
+    _lock_listener_ready: asyncio.Future | None = pydantic.PrivateAttr(None)
+
+    # The futures of the coroutines waiting for each lock key.
+    _lock_waiters: dict[bytes, set[asyncio.Future]] = pydantic.PrivateAttr({})
+
+    @override
+    async def get_state(
         self,
-        target_state_cls: Type[BaseState],
-        subclasses: bool = False,
-        required_state_classes: set[Type[BaseState]] | None = None,
-    ) -> set[Type[BaseState]]:
-        """Recursively determine which states are required to fetch the target state.
+        token: str,
+        top_level: bool = True,
+        for_state_instance: BaseState | None = None,
+    ) -> BaseState:
+        """Get the state for a token.
+
+        Args:
+            token: The token to get the state for.
+            top_level: If true, return an instance of the top-level state (self.state).
+            for_state_instance: If provided, attach the requested states to this existing state tree.
+
+        Returns:
+            The state for the token.
+
+        Raises:
+            RuntimeError: when the state_cls is not specified in the token, or when the parent state for a
+                requested state was not fetched.
+        """
+        # Split the actual token from the fully qualified substate name.
+        token, state_path = _split_substate_key(token)
+        if state_path:
+            # Get the State class associated with the given path.
+            state_cls = self.state.get_class_substate(state_path)
+        else:
+            raise RuntimeError(
+                f"StateManagerRedis requires token to be specified in the form of {{token}}_{{state_full_name}}, but got {token}"
+            )
+
+        # Determine which states we already have.
+        flat_state_tree: dict[str, BaseState] = (
+            self._get_populated_states(for_state_instance) if for_state_instance else {}
+        )
+
+        # Determine which states from the tree need to be fetched.
+        required_state_classes = sorted(
+            self._get_required_state_classes(state_cls, subclasses=True)
+            - {type(s) for s in flat_state_tree.values()},
+            key=lambda x: x.get_full_name(),
+        )
+
+        if self.hash_fields:
+            states = await self._get_state_fields(token, required_state_classes)
+        elif self._owns_near_cache(token):
+            states = await self._get_near_cached_states(token, required_state_classes)
+        else:
+            redis_pipeline = self.redis.pipeline()
+            for state_cls in required_state_classes:
+                redis_pipeline.get(_substate_key(token, state_cls))
+            states = [
+                self._deserialize_state(state_cls, redis_state)
+                for state_cls, redis_state in zip(
+                    required_state_classes,
+                    await redis_pipeline.execute(),
+                    strict=False,
+                )
+            ]
+        self._attach_states(flat_state_tree, states)
+
+        # To retain compatibility with previous implementation, by default, we return
+        # the top-level state which should always be fetched or already cached.
+        if top_level:
+            return flat_state_tree[self.state.get_full_name()]
+        return flat_state_tree[state_cls.get_full_name()]
+
+    @override
+    async def set_state(
+        self,
+        token: str,
+        state: BaseState,
+        lock_id: bytes | None = None,
+    ):
+        """Set the state for a token.
+
+        The touched states of the tree are written with a single round trip to
+        redis: a pipeline, or with lock_id, a script that also checks the lock
+        and how long it was held.
+
+        Args:
+            token: The token to set the state for.
+            state: The state to set.
+            lock_id: If provided, the lock_key must be set to this value to set the state.
+
+        Raises:
+            LockExpiredError: If lock_id is provided and the lock for the token is not held by that ID.
+            RuntimeError: If the state instance doesn't match the state name in the token.
+        """
+        client_token, substate_name = _split_substate_key(token)
+        # If the substate name on the token doesn't match the instance name, it cannot have a parent.
+        if state.parent_state is not None and state.get_full_name() != substate_name:
+            raise RuntimeError(
+                f"Cannot `set_state` with mismatching token {token} and substate {state.get_full_name()}."
+            )
+
+        touched_states = []
+        pending = [state]
+        while pending:
+            substate = pending.pop()
+            pending.extend(substate.substates.values())
+            if substate._get_was_touched():
+                touched_states.append(substate)
+
+        if self.hash_fields:
+            await self._set_state_fields(token, touched_states, lock_id)
+            for substate in touched_states:
+                substate._was_touched = False
+            return
+
+        # Serialize the touched states of the tree (parents or substates are excluded by BaseState.__getstate__).
+        keys = []
+        pickle_states = []
+        states = []
+        for substate in touched_states:
+            pickle_state = substate._serialize()
+            if pickle_state:
+                keys.append(_substate_key(client_token, substate))
+                pickle_states.append(pickle_state)
+                states.append(substate)
+
+        if lock_id is None:
+            if keys:
+                redis_pipeline = self.redis.pipeline(transaction=False)
+                for key, pickle_state in zip(keys, pickle_states, strict=True):
+                    redis_pipeline.set(key, pickle_state, ex=self.token_expiration)
+                    version_key = key + _REDIS_VERSION_SUFFIX
+                    redis_pipeline.incr(version_key)
+                    redis_pipeline.expire(version_key, self.token_expiration)
+                await redis_pipeline.execute()
+            for substate in touched_states:
+                substate._was_touched = False
+            return
+
+        # Check the lock and write all the states in a single round trip.
+        if self._set_state_script is None:
+            self._set_state_script = self.redis.register_script(_REDIS_SET_STATE_SCRIPT)
+        result = await self._set_state_script(
+            keys=[self._lock_key(token), *keys],
+            args=[lock_id, self.token_expiration, *pickle_states],
+        )
+        if result is None:
+            # The cached states may hold changes that were not saved.
+            self._near_cache.pop(client_token, None)
+            raise LockExpiredError(
+                f"Lock expired for token {token} while processing. Consider increasing "
+                f"`app.state_manager.lock_expiration` (currently {self.lock_expiration}) "
+                "or use `@rx.event(background=True)` decorator for long-running tasks."
+            )
+        lock_pttl, *versions = result
+        # Written states are not written again until they are touched again.
+        for substate in touched_states:
+            substate._was_touched = False
+        self._cache_states(client_token, states, versions)
+        self._warn_lock_held(token, lock_pttl)
+
+    def _warn_lock_held(self, token: str, lock_pttl: int):
+        """Warn when the lock of a token was held too long.
+
+        Args:
+            token: The token the lock belongs to.
+            lock_pttl: The remaining time of the lock in milliseconds.
+        """
+        time_taken = (self.lock_expiration - lock_pttl) / 1000
+        if time_taken > self.lock_warning_threshold / 1000:
+            console.warn(
+                f"Lock for token {token} was held too long {time_taken=}s, "
+                f"use `@rx.event(background=True)` decorator for long-running tasks.",
+                dedupe=True,
+            )
+
+    @override
+    @contextlib.asynccontextmanager
+    async def modify_state(self, token: str) -> AsyncIterator[BaseState]:
+        """Modify the state for a token while holding exclusive lock.
+
+        Args:
+            token: The token to modify the state for.
+
+        Yields:
+            The state for the token.
+        """
+        client_token = _split_substate_key(token)[0]
+        async with self._lock(token) as lock_id:
+            if self.near_cache_size:
+                self._near_cache_owners[client_token] = asyncio.current_task()  # pyright: ignore [reportArgumentType]
+            try:
+                state = await self.get_state(token)
+                try:
+                    yield state
+                except BaseException:
+                    # The cached states may hold changes that will not be saved.
+                    self._near_cache.pop(client_token, None)
+                    raise
+                await self.set_state(token, state, lock_id)
+            finally:
+                self._near_cache_owners.pop(client_token, None)
+
+    def _owns_near_cache(self, client_token: str) -> bool:
+        """Check if the current task may use the near cache of a client.
+
+        Cached states are reused and mutated in place, so only the task holding
+        the lock of the client in modify_state uses them. Other readers get new
+        instances.
+
+        Args:
+            client_token: The client token.
+
+        Returns:
+            Whether the near cache is enabled and the current task holds the lock of the client.
+        """
+        return bool(self.near_cache_size) and self._near_cache_owners.get(
+            client_token
+        ) is asyncio.current_task()
+
+    @staticmethod
+    def _deserialize_state(
+        state_cls: Type[BaseState], redis_state: bytes | None
+    ) -> BaseState:
+        """Deserialize a state read from redis.
+
+        Args:
+            state_cls: The class of the state.
+            redis_state: The serialized state, or None if the key didn't exist.
+
+        Returns:
+            The deserialized state, or a new instance if the key didn't exist or the schema changed.
+        """
+        if redis_state is not None:
+            with contextlib.suppress(StateSchemaMismatchError):
+                return state_cls._deserialize(data=redis_state)
+        return state_cls(
+            init_substates=False,
+            _reflex_internal_init=True,
+        )
+
+    async def _get_near_cached_states(
+        self, client_token: str, state_classes: list[Type[BaseState]]
+    ) -> list[BaseState]:
+        """Get states, only deserializing the ones whose version moved since they were cached.
+
+        Only the versions of the cached states are read from redis, together
+        with the values of the other states, in a single round trip.
+
+        Args:
+            client_token: The client token.
+            state_classes: The classes of the states to get.
+
+        Returns:
+            The states, in the order of state_classes.
+        """
+        if not state_classes:
+            return []
+        cached = self._near_cache.pop(client_token, {})
+        # Re-insert to mark the client as most recently used.
+        self._near_cache[client_token] = cached
+        while len(self._near_cache) > self.near_cache_size:
+            del self._near_cache[next(iter(self._near_cache))]
+
+        if self._get_state_script is None:
+            self._get_state_script = self.redis.register_script(_REDIS_GET_STATE_SCRIPT)
+        results = await self._get_state_script(
+            keys=[_substate_key(client_token, state_cls) for state_cls in state_classes],
+            args=[
+                str(cached[name][0]) if (name := state_cls.get_full_name()) in cached else ""
+                for state_cls in state_classes
+            ],
+        )
+
+        states = []
+        for state_cls, result in zip(state_classes, results, strict=True):
+            name = state_cls.get_full_name()
+            if result[0] == 1:
+                state = cached[name][1]
+                # Detach from the tree it was last fetched in.
+                state.parent_state = None
+                state.substates = {}
+            else:
+                _current, version, redis_state = result
+                state = self._deserialize_state(state_cls, redis_state)
+                if version is not None and redis_state is not None:
+                    cached[name] = (int(version), state)
+                else:
+                    cached.pop(name, None)
+            states.append(state)
+        return states
+
+    def _cache_states(
+        self, client_token: str, states: list[BaseState], versions: list[int]
+    ):
+        """Cache the states written to redis with their new versions.
+
+        Args:
+            client_token: The client token.
+            states: The written states.
+            versions: The versions of the states after the write.
+        """
+        if not states or not self._owns_near_cache(client_token):
+            return
+        cached = self._near_cache.setdefault(client_token, {})
+        for state, version in zip(states, versions, strict=True):
+            cached[state.get_full_name()] = (int(version), state)
+
+    async def _get_state_fields(
+        self, client_token: str, state_classes: list[Type[BaseState]]
+    ) -> list[BaseState]:
+        """Get states stored as hashes of fields, in a single round trip.
+
+        Args:
+            client_token: The client token.
+            state_classes: The classes of the states to get.
+
+        Returns:
+            The states, in the order of state_classes. New instances for the
+            states without a hash or stored with another schema.
+        """
+        from reflex.istate.codec import decode_value, set_state_var
+
+        redis_pipeline = self.redis.pipeline()
+        for state_cls in state_classes:
+            redis_pipeline.hgetall(
+                _substate_key(client_token, state_cls) + _REDIS_FIELDS_SUFFIX
+            )
+
+        states = []
+        for state_cls, fields in zip(
+            state_classes, await redis_pipeline.execute(), strict=True
+        ):
+            state = state_cls(init_substates=False, _reflex_internal_init=True)
+            schema = fields.pop(_REDIS_SCHEMA_FIELD.encode(), None)
+            if schema is not None and schema.decode() == state_cls._to_schema():
+                for name, data in fields.items():
+                    set_state_var(state, name.decode(), decode_value(memoryview(data), 0)[0])
+                state.__dict__["_redis_fields_saved"] = True
+            states.append(state)
+        return states
+
+    async def _set_state_fields(
+        self, token: str, states: list[BaseState], lock_id: bytes | None = None
+    ):
+        """Write the vars of states changed since they were read, as fields of their hashes.
+
+        A state that was not read from a hash with the current schema of its
+        class has its hash replaced with all its vars, so fields of a previous
+        schema are dropped. All the vars are also written when a touched state
+        has no recorded var changes, like after an in-place mutation of an
+        object that is not proxied.
+
+        Args:
+            token: The token the states belong to.
+            states: The touched states.
+            lock_id: If provided, the lock_key must be set to this value to set the states.
+
+        Raises:
+            LockExpiredError: If lock_id is provided and the lock for the token is not held by that ID.
+        """
+        from reflex.istate.codec import encode_value, get_state_var, get_state_vars
+
+        client_token = _split_substate_key(token)[0]
+        writes = []
+        for substate in states:
+            replace = not substate.__dict__.get("_redis_fields_saved", False)
+            values = []
+            if not replace:
+                for name in substate.__dict__.get("_unsaved_vars", set()) | substate.dirty_vars:
+                    stored, value = get_state_var(substate, name)
+                    if stored:
+                        values.append((name, value))
+            if not values:
+                values = [item for section in get_state_vars(substate) for item in section]
+            fields = {}
+            for name, value in values:
+                encoded = bytearray()
+                encode_value(encoded, value)
+                fields[name] = bytes(encoded)
+            if environment.REFLEX_PERF_MODE.get() == PerformanceMode.PROFILE:
+                from reflex.utils import state_profile
+
+                state_profile.record_state_sizes(substate)
+            if replace:
+                fields[_REDIS_SCHEMA_FIELD] = substate._to_schema()
+            if fields or replace:
+                writes.append(
+                    (
+                        _substate_key(client_token, substate) + _REDIS_FIELDS_SUFFIX,
+                        replace,
+                        fields,
+                    )
+                )
+        if not writes:
+            return
+
+        if lock_id is None:
+            redis_pipeline = self.redis.pipeline(transaction=False)
+            for key, replace, fields in writes:
+                if replace:
+                    redis_pipeline.delete(key)
+                redis_pipeline.hset(key, mapping=fields)
+                redis_pipeline.expire(key, self.token_expiration)
+            await redis_pipeline.execute()
+        else:
+            args = [lock_id, self.token_expiration]
+            for _key, replace, fields in writes:
+                args.extend((b"1" if replace else b"0", len(fields)))
+                for name, value in fields.items():
+                    args.extend((name, value))
+            if self._set_state_fields_script is None:
+                self._set_state_fields_script = self.redis.register_script(
+                    _REDIS_SET_STATE_FIELDS_SCRIPT
+                )
+            lock_pttl = await self._set_state_fields_script(
+                keys=[self._lock_key(token), *(key for key, _, _ in writes)],
+                args=args,
+            )
+            if lock_pttl is None:
+                raise LockExpiredError(
+                    f"Lock expired for token {token} while processing. Consider increasing "
+                    f"`app.state_manager.lock_expiration` (currently {self.lock_expiration}) "
+                    "or use `@rx.event(background=True)` decorator for long-running tasks."
+                )
+            self._warn_lock_held(token, lock_pttl)
+
+        for substate in states:
+            substate.__dict__.pop("_unsaved_vars", None)
+            substate.__dict__["_redis_fields_saved"] = True
+
+    @validator("lock_warning_threshold")
+    @classmethod
+    def validate_lock_warning_threshold(
+        cls, lock_warning_threshold: int, values: dict[str, int]
+    ):
+        """Validate the lock warning threshold.
+
+        Args:
+            lock_warning_threshold: The lock warning threshold.
+            values: The validated attributes.
+
+        Returns:
+            The lock warning threshold.
+
+        Raises:
+            InvalidLockWarningThresholdError: If the lock warning threshold is invalid.
+        """
+        if lock_warning_threshold >= (lock_expiration := values["lock_expiration"]):
+            raise InvalidLockWarningThresholdError(
+                f"The lock warning threshold({lock_warning_threshold}) must be less than the lock expiration time({lock_expiration})."
+            )
+        return lock_warning_threshold
+
+    @staticmethod
+    def _lock_key(token: str) -> bytes:
+        """Get the redis key for a token's lock.
+
+        Args:
+            token: The token to get the lock key for.
+
+        Returns:
+            The redis lock key for the token.
+        """
+        # All substates share the same lock domain, so ignore any substate path suffix.
+        client_token = _split_substate_key(token)[0]
+        return f"{client_token}_lock".encode()
+
+    async def _try_get_lock(self, lock_key: bytes, lock_id: bytes) -> bool | None:
+        """Try to get a redis lock for a token.
+
+        Args:
+            lock_key: The redis key for the lock.
+            lock_id: The ID of the lock.
+
+        Returns:
+            True if the lock was obtained.
+        """
+        return await self.redis.set(
+            lock_key,
+            lock_id,
+            px=self.lock_expiration,
+            nx=True,  # only set if it doesn't exist
+        )
+
+    async def _enable_keyspace_notifications(self) -> bool:
+        """Enable keyspace notifications for the redis server.
+
+        Returns:
+            Whether lock release notifications are delivered.
+
+        Raises:
+            ResponseError: when the keyspace config cannot be set.
+        """
+        if self._redis_notify_keyspace_events_enabled is not None:
+            return self._redis_notify_keyspace_events_enabled
+        # Find out which logical database index is being used.
+        self._redis_db = self.redis.get_connection_kwargs().get("db", self._redis_db)
+
+        enabled = True
+        try:
+            await self.redis.config_set(
+                "notify-keyspace-events",
+                self._redis_notify_keyspace_events,
+            )
+        except ResponseError:
+            # Some redis servers only allow out-of-band configuration, so ignore errors here.
+            if not environment.REFLEX_IGNORE_REDIS_CONFIG_ERROR.get():
+                raise
+            # Check the out-of-band configuration, if it can be read.
+            with contextlib.suppress(ResponseError):
+                config = await self.redis.config_get("notify-keyspace-events")
+                flags = config.get("notify-keyspace-events", "")
+                if isinstance(flags, bytes):
+                    flags = flags.decode()
+                enabled = "K" in flags and (
+                    "A" in flags
+                    or all(flag in flags for flag in self._redis_notify_keyspace_events[1:])
+                )
+            if not enabled:
+                console.debug(
+                    "Redis keyspace notifications are disabled, polling for state locks."
+                )
+        self._redis_notify_keyspace_events_enabled = enabled
+        return enabled
+
+    async def _start_lock_listener(self) -> bool:
+        """Start the listener of lock release events of this worker, if it is not running.
+
+        Returns:
+            Whether the listener is subscribed to lock release events.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._lock_listener is None
+            or self._lock_listener.done()
+            or self._lock_listener.get_loop() is not loop
+        ):
+            if not await self._enable_keyspace_notifications():
+                return False
+            # Another waiter may have started the listener in the meantime.
+            if (
+                self._lock_listener is None
+                or self._lock_listener.done()
+                or self._lock_listener.get_loop() is not loop
+            ):
+                self._lock_listener_ready = loop.create_future()
+                self._lock_listener = asyncio.create_task(
+                    self._listen_lock_releases(self._lock_listener_ready)
+                )
+        try:
+            return await asyncio.shield(self._lock_listener_ready)
+        except Exception:
+            return False
+
+    async def _listen_lock_releases(self, ready: asyncio.Future):
+        """Wake the waiters of the locks released, over a single pubsub connection.
+
+        Args:
+            ready: Resolved once the listener is subscribed.
+        """
+        try:
+            async with self.redis.pubsub() as pubsub:
+                await pubsub.psubscribe(f"__keyspace@{self._redis_db}__:*_lock")
+                ready.set_result(True)
+                async for message in pubsub.listen():
+                    if (
+                        message["type"] != "pmessage"
+                        or message["data"] not in self._redis_keyspace_lock_release_events
+                    ):
+                        continue
+                    lock_key = message["channel"].partition(b":")[2]
+                    for waiter in self._lock_waiters.pop(lock_key, ()):
+                        if not waiter.done():
+                            waiter.set_result(None)
+        except Exception as e:
+            console.debug(f"Redis lock release listener stopped: {e}")
+            if not ready.done():
+                ready.set_exception(e)
+        finally:
+            # Wake every waiter to retry the lock, a new listener is started if needed.
+            waiters, self._lock_waiters = self._lock_waiters, {}
+            for lock_waiters in waiters.values():
+                for waiter in lock_waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+    async def _wait_lock(self, lock_key: bytes, lock_id: bytes) -> None:
+        """Wait for a redis lock to be released.
+
+        The waiters of a worker share one pubsub connection listening to the
+        release events of all locks. Without keyspace notifications, the lock
+        is polled every lock_poll_interval instead.
+
+        Coroutine will not return until the lock is obtained.
+
+        Args:
+            lock_key: The redis key for the lock.
+            lock_id: The ID of the lock.
+        """
+        while True:
+            if await self._start_lock_listener():
+                # Register before trying the lock, so a release in between is not missed.
+                waiter = asyncio.get_running_loop().create_future()
+                self._lock_waiters.setdefault(lock_key, set()).add(waiter)
+                timeout = self.lock_expiration / 1000.0
+            else:
+                waiter = None
+                timeout = self.lock_poll_interval / 1000.0
+            try:
+                if await self._try_get_lock(lock_key, lock_id):
+                    return
+                if waiter is None:
+                    await asyncio.sleep(timeout)
+                else:
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(waiter, timeout=timeout)
+            finally:
+                if waiter is not None:
+                    waiters = self._lock_waiters.get(lock_key)
+                    if waiters is not None:
+                        waiters.discard(waiter)
+                        if not waiters:
+                            del self._lock_waiters[lock_key]
+
+    @contextlib.asynccontextmanager
+    async def _lock(self, token: str):
+        """Obtain a redis lock for a token.
+
+        Args:
+            token: The token to obtain a lock for.
+
+        Yields:
+            The ID of the lock (to be passed to set_state).
+
+        Raises:
+            LockExpiredError: If the lock has expired while processing the event.
+        """
+        lock_key = self._lock_key(token)
+        lock_id = uuid.uuid4().hex.encode()
+
+        if not await self._try_get_lock(lock_key, lock_id):
+            # Missed the fast-path to get lock, subscribe for lock delete/expire events
+            await self._wait_lock(lock_key, lock_id)
+        state_is_locked = True
+
+        try:
+            yield lock_id
+        except LockExpiredError:
+            state_is_locked = False
+            raise
+        finally:
+            if state_is_locked:
+                # only delete our lock
+                await self.redis.delete(lock_key)
+
+    async def close(self):
+        """Explicitly close the redis connection and connection_pool.
+
+        It is necessary in testing scenarios to close between asyncio test cases
+        to avoid having lingering redis connections associated with event loops
+        that will be closed (each test case uses its own event loop).
+
+        Note: Connections will be automatically reopened when needed.
+        """
+        if self._lock_listener is not None:
+            self._lock_listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError, RuntimeError):
+                await self._lock_listener
+            self._lock_listener = None
+        await self.redis.aclose(close_connection_pool=True)
+
+
+# The tables of the sqlite state manager.
+_SQLITE_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS states (
+    token TEXT NOT NULL,
+    substate TEXT NOT NULL,
+    data BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (token, substate)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS states_expires_at ON states (expires_at);
+CREATE TABLE IF NOT EXISTS locks (
+    token TEXT PRIMARY KEY,
+    lock_id TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class StateManagerSQLite(StateManager):
+    """A state manager that stores states in a SQLite database.
+
+    Each substate is a row keyed by (client token, substate full name) in a
+    single database in write-ahead logging mode under the states directory,
+    so several worker processes on a host can share states without redis.
+    Like `StateManagerRedis`, states are not cached between events, only the
+    states required by an event are read, and a per-client lock stored in
+    the database serializes the events of a client across processes.
+
+    Database access runs in a dedicated worker thread. Like redis keys, each
+    state expires `token_expiration` seconds after it was last written.
+    Expired states are deleted in small batches in the background, at most
+    every `purge_interval` seconds as states are read and written, using an
+    index on the expiration time.
+    """
+
+    # The token expiration time (s).
+    token_expiration: int = pydantic.Field(default_factory=_default_token_expiration)
+
+    # The maximum time to hold a lock (ms).
+    lock_expiration: int = pydantic.Field(default_factory=_default_lock_expiration)
 
-        This will always include potentially dirty substates that depend on vars
-        in the target_state_cls.
+    # The maximum number of expired states deleted per batch.
+    purge_batch_size: int = 1000
 
-        Args:
-            target_state_cls: The target state class being fetched.
-            subclasses: Whether to include subclasses of the target state.
-            required_state_classes: Recursive argument tracking state classes that have already been seen.
+    # The minimum time between purges of expired states (s).
+    purge_interval: int = 60
 
-        Returns:
-            The set of state classes required to fetch the target state.
-        """
-        if required_state_classes is None:
-            required_state_classes = set()
-        # Get the substates if requested.
-        if subclasses:
-            for substate in target_state_cls.get_substates():
-                self._get_required_state_classes(
-                    substate,
-                    subclasses=True,
-                    required_state_classes=required_state_classes,
-                )
-        if target_state_cls in required_state_classes:
-            return required_state_classes
-        required_state_classes.add(target_state_cls)
+    # The connection to the database, opened in the worker thread.
+    _connection: sqlite3.Connection | None = pydantic.PrivateAttr(None)
 
-        # Get dependent substates.
-        for pd_substates in target_state_cls._get_potentially_dirty_states():
-            self._get_required_state_classes(
-                pd_substates,
-                subclasses=False,
-                required_state_classes=required_state_classes,
-            )
+    # The worker thread running the database operations.
+    _executor: ThreadPoolExecutor | None = pydantic.PrivateAttr(None)
 
-        # Get the parent state if it exists.
-        if parent_state := target_state_cls.get_parent_state():
-            self._get_required_state_classes(
-                parent_state,
-                subclasses=False,
-                required_state_classes=required_state_classes,
-            )
-        return required_state_classes
+    # The last time a purge of expired states was started.
+    _last_purge: float = pydantic.PrivateAttr(0.0)
 
-    def _get_populated_states(
-        self,
-        target_state: BaseState,
-        populated_states: dict[str, BaseState] | None = None,
-    ) -> dict[str, BaseState]:
-        """Recursively determine which states from target_state are already fetched.
+    # The running purge of expired states.
+    _purge_task: asyncio.Task | None = pydantic.PrivateAttr(None)
 
-        Args:
-            target_state: The state to check for populated states.
-            populated_states: Recursive argument tracking states seen in previous calls.
+    class Config:  # pyright: ignore [reportIncompatibleVariableOverride]
+        """The Pydantic config."""
+
+        keep_untouched = (functools.cached_property,)
+
+    @functools.cached_property
+    def database_path(self) -> Path:
+        """Get the path of the states database.
 
         Returns:
-            A dictionary of state full name to state instance.
+            The path of the states database.
         """
-        if populated_states is None:
-            populated_states = {}
-        if target_state.get_full_name() in populated_states:
-            return populated_states
-        populated_states[target_state.get_full_name()] = target_state
-        for substate in target_state.substates.values():
-            self._get_populated_states(substate, populated_states=populated_states)
-        if target_state.parent_state is not None:
-            self._get_populated_states(
-                target_state.parent_state, populated_states=populated_states
-            )
-        return populated_states
+        return prerequisites.get_states_dir() / "states.sqlite3"
 
     @override
     async def get_state(
@@ -3323,77 +4636,54 @@ class StateManagerRedis(StateManager):
         """Get the state for a token.
 
         Args:
-            token: The token to get the state for.
+            token: The token to get the state for, optionally suffixed with the
+                full name of a substate.
             top_level: If true, return an instance of the top-level state (self.state).
             for_state_instance: If provided, attach the requested states to this existing state tree.
 
         Returns:
             The state for the token.
-
-        Raises:
-            RuntimeError: when the state_cls is not specified in the token, or when the parent state for a
-                requested state was not fetched.
         """
-        # Split the actual token from the fully qualified substate name.
-        token, state_path = _split_substate_key(token)
-        if state_path:
-            # Get the State class associated with the given path.
-            state_cls = self.state.get_class_substate(state_path)
-        else:
-            raise RuntimeError(
-                f"StateManagerRedis requires token to be specified in the form of {{token}}_{{state_full_name}}, but got {token}"
-            )
+        client_token, state_path = _split_substate_key(token)
+        state_cls = (
+            self.state.get_class_substate(state_path) if state_path else self.state
+        )
 
         # Determine which states we already have.
         flat_state_tree: dict[str, BaseState] = (
             self._get_populated_states(for_state_instance) if for_state_instance else {}
         )
 
-        # Determine which states from the tree need to be fetched.
+        # Determine which states from the tree need to be read.
         required_state_classes = sorted(
             self._get_required_state_classes(state_cls, subclasses=True)
             - {type(s) for s in flat_state_tree.values()},
             key=lambda x: x.get_full_name(),
         )
+        rows = await self._run(
+            self._read_states,
+            client_token,
+            [required_state_cls.get_full_name() for required_state_cls in required_state_classes],
+        )
 
-        redis_pipeline = self.redis.pipeline()
-        for state_cls in required_state_classes:
-            redis_pipeline.get(_substate_key(token, state_cls))
-
-        for state_cls, redis_state in zip(
-            required_state_classes,
-            await redis_pipeline.execute(),
-            strict=False,
-        ):
+        states = []
+        for required_state_cls in required_state_classes:
             state = None
-
-            if redis_state is not None:
-                # Deserialize the substate.
+            data = rows.get(required_state_cls.get_full_name())
+            if data is not None:
                 with contextlib.suppress(StateSchemaMismatchError):
-                    state = BaseState._deserialize(data=redis_state)
+                    state = required_state_cls._deserialize(data=data)
             if state is None:
-                # Key didn't exist or schema mismatch so create a new instance for this token.
-                state = state_cls(
+                # Row didn't exist or schema mismatch so create a new instance for this token.
+                state = required_state_cls(
                     init_substates=False,
                     _reflex_internal_init=True,
                 )
-            flat_state_tree[state.get_full_name()] = state
-            if state.get_parent_state() is not None:
-                parent_state_name, _dot, state_name = state.get_full_name().rpartition(
-                    "."
-                )
-                parent_state = flat_state_tree.get(parent_state_name)
-                if parent_state is None:
-                    raise RuntimeError(
-                        f"Parent state for {state.get_full_name()} was not found "
-                        "in the state tree, but should have already been fetched. "
-                        "This is a bug",
-                    )
-                parent_state.substates[state_name] = state
-                state.parent_state = parent_state
+            states.append(state)
+        self._attach_states(flat_state_tree, states)
+
+        self._schedule_purge()
 
-        # To retain compatibility with previous implementation, by default, we return
-        # the top-level state which should always be fetched or already cached.
         if top_level:
             return flat_state_tree[self.state.get_full_name()]
         return flat_state_tree[state_cls.get_full_name()]
@@ -3403,71 +4693,43 @@ class StateManagerRedis(StateManager):
         self,
         token: str,
         state: BaseState,
-        lock_id: bytes | None = None,
+        lock_id: str | None = None,
     ):
         """Set the state for a token.
 
+        The touched states of the tree are written in a single transaction,
+        which renews their expiration.
+
         Args:
             token: The token to set the state for.
             state: The state to set.
-            lock_id: If provided, the lock_key must be set to this value to set the state.
+            lock_id: If provided, the lock of the token must be held by this ID to set the state.
 
         Raises:
             LockExpiredError: If lock_id is provided and the lock for the token is not held by that ID.
-            RuntimeError: If the state instance doesn't match the state name in the token.
         """
-        # Check that we're holding the lock.
-        if (
-            lock_id is not None
-            and await self.redis.get(self._lock_key(token)) != lock_id
-        ):
+        client_token = _split_substate_key(token)[0]
+
+        rows = []
+        pending = [state]
+        while pending:
+            substate = pending.pop()
+            pending.extend(substate.substates.values())
+            if not substate._get_was_touched():
+                continue
+            substate._was_touched = False  # Reset the touched flag after serializing.
+            pickle_state = substate._serialize()
+            if pickle_state:
+                rows.append((substate.get_full_name(), pickle_state))
+
+        if not await self._run(self._write_states, client_token, rows, lock_id):
             raise LockExpiredError(
                 f"Lock expired for token {token} while processing. Consider increasing "
                 f"`app.state_manager.lock_expiration` (currently {self.lock_expiration}) "
                 "or use `@rx.event(background=True)` decorator for long-running tasks."
             )
-        elif lock_id is not None:
-            time_taken = self.lock_expiration / 1000 - (
-                await self.redis.ttl(self._lock_key(token))
-            )
-            if time_taken > self.lock_warning_threshold / 1000:
-                console.warn(
-                    f"Lock for token {token} was held too long {time_taken=}s, "
-                    f"use `@rx.event(background=True)` decorator for long-running tasks.",
-                    dedupe=True,
-                )
-
-        client_token, substate_name = _split_substate_key(token)
-        # If the substate name on the token doesn't match the instance name, it cannot have a parent.
-        if state.parent_state is not None and state.get_full_name() != substate_name:
-            raise RuntimeError(
-                f"Cannot `set_state` with mismatching token {token} and substate {state.get_full_name()}."
-            )
-
-        # Recursively set_state on all known substates.
-        tasks = [
-            asyncio.create_task(
-                self.set_state(
-                    _substate_key(client_token, substate),
-                    substate,
-                    lock_id,
-                )
-            )
-            for substate in state.substates.values()
-        ]
-        # Persist only the given state (parents or substates are excluded by BaseState.__getstate__).
-        if state._get_was_touched():
-            pickle_state = state._serialize()
-            if pickle_state:
-                await self.redis.set(
-                    _substate_key(client_token, state),
-                    pickle_state,
-                    ex=self.token_expiration,
-                )
 
-        # Wait for substates to be persisted.
-        for t in tasks:
-            await t
+        self._schedule_purge()
 
     @override
     @contextlib.asynccontextmanager
@@ -3485,174 +4747,283 @@ class StateManagerRedis(StateManager):
             yield state
             await self.set_state(token, state, lock_id)
 
-    @validator("lock_warning_threshold")
-    @classmethod
-    def validate_lock_warning_threshold(
-        cls, lock_warning_threshold: int, values: dict[str, int]
-    ):
-        """Validate the lock warning threshold.
+    async def close(self):
+        """Stop the purge of expired states and close the database."""
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._purge_task
+            self._purge_task = None
+        if self._executor is not None:
+            await self._run(self._close_connection)
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_client_states(self) -> dict[str, BaseState]:
+        """Read the top-level states of the clients with unexpired states.
+
+        The database is read with a separate connection, so this can be
+        called from any thread, like a test polling the states of a running app.
+
+        Returns:
+            A dictionary of client token to top-level state.
+        """
+        if not self.database_path.exists():
+            return {}
+        connection = sqlite3.connect(
+            self.database_path, timeout=self.lock_expiration / 1000
+        )
+        try:
+            rows = connection.execute(
+                "SELECT token, substate, data FROM states WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchall()
+        finally:
+            connection.close()
+
+        root_name = self.state.get_full_name()
+        root_rows = {
+            token: data for token, substate, data in rows if substate == root_name
+        }
+        states = {}
+        for token in sorted({token for token, _, _ in rows}):
+            state = None
+            if token in root_rows:
+                with contextlib.suppress(StateSchemaMismatchError):
+                    state = self.state._deserialize(data=root_rows[token])
+            if state is None:
+                # Only substates of the client were written.
+                state = self.state(init_substates=False, _reflex_internal_init=True)
+            states[token] = state
+        return states
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a database operation in the worker thread.
 
         Args:
-            lock_warning_threshold: The lock warning threshold.
-            values: The validated attributes.
+            function: The operation to run.
+            *args: The arguments of the operation.
 
         Returns:
-            The lock warning threshold.
-
-        Raises:
-            InvalidLockWarningThresholdError: If the lock warning threshold is invalid.
+            The result of the operation.
         """
-        if lock_warning_threshold >= (lock_expiration := values["lock_expiration"]):
-            raise InvalidLockWarningThresholdError(
-                f"The lock warning threshold({lock_warning_threshold}) must be less than the lock expiration time({lock_expiration})."
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="reflex_sqlite_state"
             )
-        return lock_warning_threshold
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, function, *args
+        )
 
-    @staticmethod
-    def _lock_key(token: str) -> bytes:
-        """Get the redis key for a token's lock.
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the connection to the database, creating the database if needed.
+
+        Returns:
+            The connection, in autocommit mode.
+        """
+        if self._connection is None:
+            path_ops.mkdir(self.database_path.parent)
+            connection = sqlite3.connect(
+                self.database_path,
+                # Wait for the write lock of other processes instead of failing.
+                timeout=self.lock_expiration / 1000,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SQLITE_STATE_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _close_connection(self):
+        """Close the connection to the database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _read_states(self, client_token: str, state_names: list[str]) -> dict[str, bytes]:
+        """Read the unexpired states of a client.
 
         Args:
-            token: The token to get the lock key for.
+            client_token: The client token.
+            state_names: The full names of the states to read.
 
         Returns:
-            The redis lock key for the token.
-        """
-        # All substates share the same lock domain, so ignore any substate path suffix.
-        client_token = _split_substate_key(token)[0]
-        return f"{client_token}_lock".encode()
+            A dictionary of state full name to serialized state.
+        """
+        connection = self._get_connection()
+        now = time.time()
+        rows = {}
+        # Stay below the maximum number of parameters of a query.
+        for start in range(0, len(state_names), 500):
+            batch = state_names[start : start + 500]
+            rows.update(
+                connection.execute(
+                    "SELECT substate, data FROM states "
+                    f"WHERE token = ? AND substate IN ({', '.join('?' * len(batch))}) "
+                    "AND expires_at > ?",
+                    (client_token, *batch, now),
+                )
+            )
+        return rows
 
-    async def _try_get_lock(self, lock_key: bytes, lock_id: bytes) -> bool | None:
-        """Try to get a redis lock for a token.
+    def _write_states(
+        self,
+        client_token: str,
+        rows: list[tuple[str, bytes]],
+        lock_id: str | None,
+    ) -> bool:
+        """Write states of a client in a single transaction.
 
         Args:
-            lock_key: The redis key for the lock.
-            lock_id: The ID of the lock.
+            client_token: The client token.
+            rows: Pairs of state full name and serialized state.
+            lock_id: If provided, only write if the lock of the client is held by this ID.
 
         Returns:
-            True if the lock was obtained.
+            False if the lock is not held by lock_id, True otherwise.
         """
-        return await self.redis.set(
-            lock_key,
-            lock_id,
-            px=self.lock_expiration,
-            nx=True,  # only set if it doesn't exist
-        )
+        connection = self._get_connection()
+        now = time.time()
+        expires_at = now + self.token_expiration
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if lock_id is not None:
+                lock = connection.execute(
+                    "SELECT lock_id FROM locks WHERE token = ? AND expires_at > ?",
+                    (client_token, now),
+                ).fetchone()
+                if lock is None or lock[0] != lock_id:
+                    connection.execute("ROLLBACK")
+                    return False
+            connection.executemany(
+                "INSERT INTO states (token, substate, data, expires_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (token, substate) DO UPDATE "
+                "SET data = excluded.data, expires_at = excluded.expires_at",
+                [(client_token, name, data, expires_at) for name, data in rows],
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT may already have rolled the transaction back.
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        return True
 
-    async def _get_pubsub_message(
-        self, pubsub: PubSub, timeout: float | None = None
-    ) -> None:
-        """Get lock release events from the pubsub.
+    def _try_get_lock(self, client_token: str, lock_id: str) -> bool:
+        """Try to get the lock of a client.
+
+        An expired lock is taken over.
 
         Args:
-            pubsub: The pubsub to get a message from.
-            timeout: Remaining time to wait for a message.
+            client_token: The client token.
+            lock_id: The ID of the lock.
 
         Returns:
-            The message.
+            True if the lock was obtained.
         """
-        if timeout is None:
-            timeout = self.lock_expiration / 1000.0
-
-        started = time.time()
-        message = await pubsub.get_message(
-            ignore_subscribe_messages=True,
-            timeout=timeout,
+        now = time.time()
+        cursor = self._get_connection().execute(
+            "INSERT INTO locks (token, lock_id, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (token) DO UPDATE "
+            "SET lock_id = excluded.lock_id, expires_at = excluded.expires_at "
+            "WHERE locks.expires_at <= ?",
+            (client_token, lock_id, now + self.lock_expiration / 1000, now),
         )
-        if (
-            message is None
-            or message["data"] not in self._redis_keyspace_lock_release_events
-        ):
-            remaining = timeout - (time.time() - started)
-            if remaining <= 0:
-                return
-            await self._get_pubsub_message(pubsub, timeout=remaining)
+        return cursor.rowcount == 1
 
-    async def _enable_keyspace_notifications(self):
-        """Enable keyspace notifications for the redis server.
+    def _is_locked(self, client_token: str) -> bool:
+        """Check if the lock of a client is held, without starting a write transaction.
 
-        Raises:
-            ResponseError: when the keyspace config cannot be set.
-        """
-        if self._redis_notify_keyspace_events_enabled:
-            return
-        # Find out which logical database index is being used.
-        self._redis_db = self.redis.get_connection_kwargs().get("db", self._redis_db)
+        Args:
+            client_token: The client token.
 
-        try:
-            await self.redis.config_set(
-                "notify-keyspace-events",
-                self._redis_notify_keyspace_events,
+        Returns:
+            True if the lock is held and not expired.
+        """
+        return (
+            self._get_connection()
+            .execute(
+                "SELECT 1 FROM locks WHERE token = ? AND expires_at > ?",
+                (client_token, time.time()),
             )
-        except ResponseError:
-            # Some redis servers only allow out-of-band configuration, so ignore errors here.
-            if not environment.REFLEX_IGNORE_REDIS_CONFIG_ERROR.get():
-                raise
-        self._redis_notify_keyspace_events_enabled = True
-
-    async def _wait_lock(self, lock_key: bytes, lock_id: bytes) -> None:
-        """Wait for a redis lock to be released via pubsub.
+            .fetchone()
+            is not None
+        )
 
-        Coroutine will not return until the lock is obtained.
+    def _release_lock(self, client_token: str, lock_id: str):
+        """Release the lock of a client, if it is still held by lock_id.
 
         Args:
-            lock_key: The redis key for the lock.
+            client_token: The client token.
             lock_id: The ID of the lock.
         """
-        # Enable keyspace notifications for the lock key, so we know when it is available.
-        await self._enable_keyspace_notifications()
-        lock_key_channel = f"__keyspace@{self._redis_db}__:{lock_key.decode()}"
-        async with self.redis.pubsub() as pubsub:
-            await pubsub.psubscribe(lock_key_channel)
-            # wait for the lock to be released
-            while True:
-                # fast path
-                if await self._try_get_lock(lock_key, lock_id):
-                    return
-                # wait for lock events
-                await self._get_pubsub_message(pubsub)
+        self._get_connection().execute(
+            "DELETE FROM locks WHERE token = ? AND lock_id = ?",
+            (client_token, lock_id),
+        )
 
     @contextlib.asynccontextmanager
     async def _lock(self, token: str):
-        """Obtain a redis lock for a token.
+        """Obtain the lock of a client, shared by all the processes using the database.
 
         Args:
             token: The token to obtain a lock for.
 
         Yields:
             The ID of the lock (to be passed to set_state).
-
-        Raises:
-            LockExpiredError: If the lock has expired while processing the event.
         """
-        lock_key = self._lock_key(token)
-        lock_id = uuid.uuid4().hex.encode()
+        # All substates share the same lock domain, so ignore any substate path suffix.
+        client_token = _split_substate_key(token)[0]
+        lock_id = uuid.uuid4().hex
 
-        if not await self._try_get_lock(lock_key, lock_id):
-            # Missed the fast-path to get lock, subscribe for lock delete/expire events
-            await self._wait_lock(lock_key, lock_id)
-        state_is_locked = True
+        delay = 0.005
+        while not await self._run(self._try_get_lock, client_token, lock_id):
+            # Poll with read queries and a bounded backoff until the holder releases
+            # the lock or it expires, so waiters do not contend with the writer.
+            while await self._run(self._is_locked, client_token):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.1)
 
         try:
             yield lock_id
-        except LockExpiredError:
-            state_is_locked = False
-            raise
         finally:
-            if state_is_locked:
-                # only delete our lock
-                await self.redis.delete(lock_key)
+            await self._run(self._release_lock, client_token, lock_id)
 
-    async def close(self):
-        """Explicitly close the redis connection and connection_pool.
+    def _purge_expired_batch(self) -> int:
+        """Delete a batch of expired states and locks.
 
-        It is necessary in testing scenarios to close between asyncio test cases
-        to avoid having lingering redis connections associated with event loops
-        that will be closed (each test case uses its own event loop).
+        Returns:
+            The number of deleted states.
+        """
+        connection = self._get_connection()
+        now = time.time()
+        cursor = connection.execute(
+            "DELETE FROM states WHERE (token, substate) IN ("
+            "SELECT token, substate FROM states WHERE expires_at <= ? LIMIT ?)",
+            (now, self.purge_batch_size),
+        )
+        connection.execute("DELETE FROM locks WHERE expires_at <= ?", (now,))
+        return cursor.rowcount
 
-        Note: Connections will be automatically reopened when needed.
+    async def _purge_expired_states(self):
+        """Delete the expired states, one batch at a time.
+
+        Database operations of events run between the batches.
         """
-        await self.redis.aclose(close_connection_pool=True)
+        while await self._run(self._purge_expired_batch) >= self.purge_batch_size:
+            await asyncio.sleep(0)
+
+    def _schedule_purge(self):
+        """Start a purge of expired states if the last one is old enough."""
+        now = time.monotonic()
+        if now - self._last_purge < self.purge_interval or (
+            self._purge_task is not None and not self._purge_task.done()
+        ):
+            return
+        self._last_purge = now
+        self._purge_task = asyncio.create_task(self._purge_expired_states())
 
 
 def get_state_manager() -> StateManager:
@@ -49,6 +49,8 @@ from reflex.state import (
     StateManagerDisk,
     StateManagerMemory,
     StateManagerRedis,
+    StateManagerSQLite,
+    StateManagerTiered,
     reload_state_module,
 )
 from reflex.utils import console
@@ -791,6 +793,9 @@ class AppHarness:
     def poll_for_clients(self, timeout: TimeoutType = None) -> dict[str, BaseState]:
         """Poll app state_manager for any connected clients.
 
+        The tiered state manager only reports the states it holds in memory,
+        and the SQLite state manager the clients with unexpired states.
+
         Args:
             timeout: how long to wait for client states
 
@@ -800,19 +805,31 @@ class AppHarness:
         Raises:
             RuntimeError: when the app hasn't started running
             TimeoutError: when the timeout expires before any states are seen
-            ValueError: when the state_manager is not a memory state manager
+            ValueError: when the state_manager does not run in the app process
         """
         if self.app_instance is None:
             raise RuntimeError("App is not running.")
         state_manager = self.app_instance.state_manager
-        if not isinstance(state_manager, (StateManagerMemory, StateManagerDisk)):
-            raise ValueError("Only works with memory or disk state manager")
-        if not self._poll_for(
-            target=lambda: state_manager.states,
-            timeout=timeout,
+        if isinstance(state_manager, StateManagerSQLite):
+            get_states = state_manager.get_client_states
+        elif isinstance(
+            state_manager, (StateManagerMemory, StateManagerDisk, StateManagerTiered)
         ):
+
+            def get_states() -> dict[str, BaseState]:
+                return state_manager.states
+
+        else:
+            raise ValueError(
+                "Only works with memory, disk, tiered or SQLite state manager"
+            )
+        states = self._poll_for(
+            target=get_states,
+            timeout=timeout,
+        )
+        if not states:
             raise TimeoutError("No states were observed while polling.")
-        return state_manager.states
+        return states
 
 
 class SimpleHTTPRequestHandlerCustomErrors(SimpleHTTPRequestHandler):
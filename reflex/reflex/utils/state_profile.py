@@ -0,0 +1,201 @@
+"""Profile of the serialized size of each state var.
+
+With REFLEX_PERF_MODE=profile, every time a state is serialized for a state
+manager, the pickled size of each of its own base vars and backend vars is
+recorded for its state class. Each var keeps its largest size and a bounded
+random sample of its sizes across sessions, so percentiles stay cheap to
+compute however long the app runs.
+
+Only serialized states are recorded: nothing is recorded with the memory
+state manager, and the tiered state manager only records the states it
+spills to disk.
+
+Every worker process periodically saves its samples to the backend directory,
+and once more when the app shuts down.
+`reflex run` deletes the samples of the previous run, and `reflex
+state-profile` merges the samples of all workers and prints the vars with the
+largest sizes: good candidates to move to backend vars, to trim, or to keep
+in shared storage instead of the state.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import random
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from reflex.utils import console, prerequisites
+
+if TYPE_CHECKING:
+    from reflex.state import BaseState
+
+# The prefix of the files holding the samples of each worker process.
+PROFILE_FILE_PREFIX = "state_profile."
+
+# The maximum number of sizes kept per var.
+MAX_SAMPLES = 1000
+
+# The minimum time between two saves of the samples of a worker (s).
+SAVE_INTERVAL = 10
+
+# The sizes sampled for each var of each state class: [number of sizes recorded, largest size, sampled sizes].
+_samples: dict[str, dict[str, list[Any]]] = {}
+
+# When the samples of this worker were last saved.
+_last_save = 0.0
+
+
+def record_state_sizes(state: BaseState):
+    """Record the serialized size of each var of a state.
+
+    Args:
+        state: The state being serialized.
+    """
+    from reflex.istate.codec import get_state_vars
+
+    state_samples = _samples.setdefault(state.get_full_name(), {})
+    for section in get_state_vars(state):
+        for name, value in section:
+            try:
+                size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            except Exception:
+                # The state serialization reports values that cannot be pickled.
+                continue
+            entry = state_samples.setdefault(name, [0, 0, []])
+            entry[0] += 1
+            entry[1] = max(entry[1], size)
+            _add_sample(entry, size)
+
+    if time.monotonic() - _last_save > SAVE_INTERVAL:
+        save_profile()
+
+
+def _add_sample(entry: list[Any], size: int):
+    """Add a size to the samples of a var, keeping a uniform sample of all the sizes recorded.
+
+    Args:
+        entry: The number of sizes recorded, the largest size and the sampled sizes of the var.
+        size: The size to add, already counted.
+    """
+    count, _max_size, sizes = entry
+    if len(sizes) < MAX_SAMPLES:
+        sizes.append(size)
+        return
+    index = random.randrange(count)
+    if index < MAX_SAMPLES:
+        sizes[index] = size
+
+
+def get_profile_dir() -> Path:
+    """Get the directory the workers save their samples to.
+
+    Returns:
+        The backend directory.
+    """
+    return prerequisites.get_backend_dir()
+
+
+def save_profile():
+    """Save the samples of this worker process."""
+    global _last_save
+    _last_save = time.monotonic()
+    profile_dir = get_profile_dir()
+    profile_path = profile_dir / f"{PROFILE_FILE_PREFIX}{os.getpid()}.json"
+    temp_path = profile_path.with_suffix(".tmp")
+    try:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(_samples))
+        temp_path.replace(profile_path)
+    except OSError as e:
+        console.debug(f"Failed to save the state profile to {profile_path}: {e}")
+
+
+def load_profiles() -> dict[str, dict[str, list[Any]]]:
+    """Load and merge the samples saved by all the worker processes.
+
+    Returns:
+        The number of sizes recorded, the largest size and the sampled sizes
+        of each var of each state class.
+    """
+    merged: dict[str, dict[str, list[Any]]] = {}
+    profile_dir = get_profile_dir()
+    if not profile_dir.exists():
+        return merged
+    for profile_path in sorted(profile_dir.glob(f"{PROFILE_FILE_PREFIX}*.json")):
+        try:
+            samples = json.loads(profile_path.read_text())
+        except (OSError, ValueError) as e:
+            console.warn(f"Ignoring unreadable state profile {profile_path}: {e}")
+            continue
+        for state_name, state_samples in samples.items():
+            merged_state = merged.setdefault(state_name, {})
+            for name, (count, max_size, sizes) in state_samples.items():
+                merged_entry = merged_state.setdefault(name, [0, 0, []])
+                merged_entry[0] += count
+                merged_entry[1] = max(merged_entry[1], max_size)
+                # Weight the samples of each worker by the number of sizes it recorded.
+                merged_entry[2].extend(
+                    random.choices(sizes, k=min(MAX_SAMPLES, count))
+                    if sizes
+                    else ()
+                )
+    return merged
+
+
+def clear_profiles():
+    """Delete the samples saved by all the worker processes."""
+    profile_dir = get_profile_dir()
+    if profile_dir.exists():
+        for profile_path in profile_dir.glob(f"{PROFILE_FILE_PREFIX}*.json"):
+            profile_path.unlink(missing_ok=True)
+
+
+def get_report(top: int = 20) -> list[dict[str, Any]]:
+    """Get the vars with the largest serialized sizes.
+
+    Args:
+        top: The number of vars to report.
+
+    Returns:
+        The state, var, kind (base or backend), number of sizes recorded,
+        size percentiles and largest size in bytes of each var, largest 90th
+        percentile first.
+    """
+    rows = []
+    for state_name, state_samples in load_profiles().items():
+        for name, (count, max_size, sizes) in state_samples.items():
+            if not sizes:
+                continue
+            sizes = sorted(sizes)
+            rows.append(
+                {
+                    "state": state_name,
+                    "var": name,
+                    "kind": "backend" if name.startswith("_") else "base",
+                    "count": count,
+                    "p50": _percentile(sizes, 50),
+                    "p90": _percentile(sizes, 90),
+                    "p99": _percentile(sizes, 99),
+                    "max": max_size,
+                }
+            )
+    rows.sort(key=lambda row: (row["p90"], row["max"]), reverse=True)
+    return rows[:top]
+
+
+def _percentile(sorted_sizes: list[int], percent: int) -> int:
+    """Get a percentile of sorted sizes, by the nearest rank.
+
+    Args:
+        sorted_sizes: The sizes, in ascending order.
+        percent: The percentile to get.
+
+    Returns:
+        The size at the percentile.
+    """
+    rank = max(1, -(-percent * len(sorted_sizes) // 100))
+    return sorted_sizes[rank - 1]
@@ -0,0 +1,119 @@
+"""Compare the size and speed of the state codecs.
+
+Encodes and decodes a substate holding table-like data with each codec and
+prints the size of the encoded state and the mean encode and decode times.
+
+    python scripts/benchmark_state_codec.py --rows 1000 --iterations 200
+"""
+
+import argparse
+import time
+from typing import Any
+
+import reflex as rx
+from reflex.istate.codec import (
+    CompactStateCodec,
+    PickleStateCodec,
+    StateCodec,
+    decode_state,
+)
+
+
+class CodecBenchmarkState(rx.State):
+    """A state with the kinds of vars apps usually store."""
+
+    rows: list[dict[str, Any]] = []
+    selected: list[int] = []
+    filters: dict[str, str] = {}
+    title: str = ""
+    page: int = 0
+    loading: bool = False
+    _cache: dict[str, list[float]] = {}
+
+
+def make_state(num_rows: int) -> CodecBenchmarkState:
+    """Create a state filled with synthetic data.
+
+    Args:
+        num_rows: The number of table rows.
+
+    Returns:
+        The state, detached from any parent state.
+    """
+    state = CodecBenchmarkState(init_substates=False, _reflex_internal_init=True)
+    state.rows = [
+        {
+            "id": i,
+            "name": f"Customer {i}",
+            "email": f"customer{i}@example.com",
+            "balance": i * 1.25,
+            "active": i % 3 != 0,
+            "tags": ["new", "priority"] if i % 5 == 0 else [],
+        }
+        for i in range(num_rows)
+    ]
+    state.selected = list(range(0, num_rows, 7))
+    state.filters = {"status": "active", "sort": "name"}
+    state.title = "Customers"
+    state.page = 3
+    state._cache = {f"series{i}": [i / 7] * 50 for i in range(20)}
+    return state
+
+
+def benchmark(
+    codec: StateCodec, state: CodecBenchmarkState, iterations: int
+) -> dict[str, float]:
+    """Time a codec.
+
+    Args:
+        codec: The codec to benchmark.
+        state: The state to encode.
+        iterations: The number of encodes and decodes to time.
+
+    Returns:
+        The size of the encoded state and the mean encode and decode times in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        data = codec.encode(state)
+    encode_time = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decoded = decode_state(data, type(state))
+    decode_time = (time.perf_counter() - start) / iterations
+
+    assert decoded.rows == state.rows and decoded._cache == state._cache
+    return {
+        "bytes": len(data),
+        "encode_us": encode_time * 1e6,
+        "decode_us": decode_time * 1e6,
+    }
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000, help="Number of table rows.")
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="Number of encodes and decodes."
+    )
+    args = parser.parse_args()
+
+    state = make_state(args.rows)
+    codecs = {
+        "pickle": PickleStateCodec(),
+        "compact": CompactStateCodec(),
+        "compact+zlib": CompactStateCodec(compression_threshold=0),
+    }
+    print(f"{'codec':<14}{'bytes':>10}{'encode (us)':>14}{'decode (us)':>14}")
+    for name, codec in codecs.items():
+        result = benchmark(codec, state, args.iterations)
+        print(
+            f"{name:<14}{result['bytes']:>10}"
+            f"{result['encode_us']:>14.1f}{result['decode_us']:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Root directory for tests."""
@@ -0,0 +1 @@
+"""Unit tests of reflex."""
@@ -0,0 +1 @@
+"""Unit tests of the state internals."""
@@ -0,0 +1,154 @@
+"""Test the state codecs."""
+
+from __future__ import annotations
+
+import pytest
+
+from reflex.istate.codec import (
+    COMPACT_MAGIC,
+    CompactStateCodec,
+    PickleStateCodec,
+    decode_state,
+    decode_value,
+    encode_value,
+)
+from reflex.state import BaseState
+from reflex.utils.exceptions import StateSchemaMismatchError
+
+
+class CodecState(BaseState):
+    """A state with vars of every encoded type."""
+
+    count: int = 0
+    ratio: float = 0.5
+    name: str = ""
+    flag: bool = False
+    data: bytes = b""
+    items: list[dict[str, int]] = []
+    label: str | None = None
+    _secret: int = 0
+
+
+class OtherCodecState(BaseState):
+    """A state with another schema."""
+
+    count: int = 0
+
+
+def _make_state() -> CodecState:
+    """Create a state with values different from the defaults.
+
+    Returns:
+        The state.
+    """
+    state = CodecState(_reflex_internal_init=True)  # pyright: ignore [reportCallIssue]
+    state.count = -300
+    state.ratio = 1.25
+    state.name = "héllo"
+    state.flag = True
+    state.data = b"\x00\xff"
+    state.items = [{"a": 1}, {"a": 2}]
+    state.label = None
+    state._secret = 42
+    # Like the states the managers store, without dirty vars.
+    state._clean()
+    return state
+
+
+def _assert_restored(restored: BaseState):
+    """Check that a state holds the values of `_make_state`.
+
+    Args:
+        restored: The decoded state.
+    """
+    assert isinstance(restored, CodecState)
+    assert restored.count == -300
+    assert restored.ratio == 1.25
+    assert restored.name == "héllo"
+    assert restored.flag is True
+    assert restored.data == b"\x00\xff"
+    assert restored.get_value("items") == [{"a": 1}, {"a": 2}]
+    assert restored.label is None
+    assert restored._secret == 42
+    assert not restored.dirty_vars
+
+
+@pytest.mark.parametrize("compression_threshold", [None, 0])
+def test_compact_codec_round_trip(compression_threshold: int | None):
+    """Test that the compact codec restores the var values of a state.
+
+    Args:
+        compression_threshold: The compression threshold of the codec.
+    """
+    codec = CompactStateCodec(compression_threshold)
+    data = codec.encode(_make_state())
+
+    assert data.startswith(COMPACT_MAGIC)
+    _assert_restored(codec.decode(data, CodecState))
+
+
+def test_compact_codec_compresses_large_states():
+    """Test that bodies over the threshold are compressed when it pays off."""
+    state = _make_state()
+    state.name = "reflex" * 1000
+
+    compressed = CompactStateCodec(1024).encode(state)
+    uncompressed = CompactStateCodec(None).encode(state)
+
+    assert len(compressed) < len(uncompressed)
+    restored = CompactStateCodec(None).decode(compressed, CodecState)
+    assert restored.name == "reflex" * 1000
+
+
+def test_compact_codec_schema_mismatch():
+    """Test that a state encoded for another class is rejected."""
+    data = CompactStateCodec().encode(_make_state())
+
+    with pytest.raises(StateSchemaMismatchError):
+        CompactStateCodec().decode(data, OtherCodecState)
+
+
+@pytest.mark.parametrize("codec", [PickleStateCodec(), CompactStateCodec()])
+def test_decode_state_detects_the_codec(codec):
+    """Test that states are decoded whatever codec encoded them.
+
+    Args:
+        codec: The codec encoding the state.
+    """
+    _assert_restored(decode_state(codec.encode(_make_state()), CodecState))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        False,
+        0,
+        -1,
+        63,
+        -64,
+        2**70,
+        -(2**70),
+        1.5,
+        "",
+        "☃",
+        b"",
+        b"\x00\x80",
+        [1, "two", None],
+        {"nested": {"values": (1, 2)}},
+    ],
+)
+def test_value_round_trip(value):
+    """Test the tagged encoding of a single value.
+
+    Args:
+        value: The value to encode.
+    """
+    encoded = bytearray()
+    encode_value(encoded, value)
+    decoded, pos = decode_value(memoryview(bytes(encoded)), 0)
+
+    assert decoded == value
+    assert type(decoded) is type(value)
+    assert pos == len(encoded)
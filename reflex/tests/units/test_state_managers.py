@@ -0,0 +1,445 @@
+"""Test the round trip and eviction of the state managers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from reflex.app import App
+from reflex.state import (
+    BaseState,
+    StateManagerMemory,
+    StateManagerRedis,
+    StateManagerSQLite,
+    StateManagerTiered,
+    _substate_key,
+)
+from reflex.testing import AppHarness
+from reflex.utils import prerequisites, state_profile
+
+
+class ManagedState(BaseState):
+    """A state stored by the state managers."""
+
+    count: int = 0
+    items: list[str] = []
+    _backend: dict[str, int] = {}
+
+
+class ManagedSubstate(ManagedState):
+    """A substate stored by the state managers."""
+
+    value: str = ""
+
+
+# The number of vars of WideState, more than the redis fields script sets with each HSET.
+_WIDE_VARS = 600
+
+WideState = type(
+    "WideState",
+    (ManagedState,),
+    {
+        "__module__": __name__,
+        "__annotations__": {f"var_{index}": int for index in range(_WIDE_VARS)},
+        **{f"var_{index}": 0 for index in range(_WIDE_VARS)},
+    },
+)
+
+
+def _key(token: str) -> str:
+    """Get the substate key of the root state of a token.
+
+    Args:
+        token: The client token.
+
+    Returns:
+        The substate key.
+    """
+    return _substate_key(token, ManagedState)
+
+
+async def _modify(manager, token: str, count: int):
+    """Set the vars of the state of a token.
+
+    Args:
+        manager: The state manager.
+        token: The client token.
+        count: The count to set.
+    """
+    async with manager.modify_state(_key(token)) as state:
+        state.count = count
+        state.items[:] = [f"item-{count}"]
+        state._backend = {"count": count}
+        (await state.get_state(ManagedSubstate)).value = f"value-{count}"
+        # Like the app, clean the state once the delta of the event is computed.
+        state._clean()
+
+
+async def _assert_stored(manager, token: str, count: int):
+    """Check the vars of the state of a token.
+
+    Args:
+        manager: The state manager.
+        token: The client token.
+        count: The expected count.
+    """
+    state = await manager.get_state(_key(token))
+    assert state.count == count
+    assert state.get_value("items") == [f"item-{count}"]
+    assert state._backend == {"count": count}
+    assert (await state.get_state(ManagedSubstate)).value == f"value-{count}"
+
+
+@pytest.fixture
+def states_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Store the states of the disk based managers in a temporary directory.
+
+    Args:
+        tmp_path: The temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+
+    Returns:
+        The states directory.
+    """
+    monkeypatch.setenv("REFLEX_STATES_WORKDIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_memory_round_trip():
+    """Test that the memory manager serves the same state to the next event."""
+    manager = StateManagerMemory(state=ManagedState)
+    await _modify(manager, "token-a", 1)
+    await _assert_stored(manager, "token-a", 1)
+
+
+@pytest.mark.asyncio
+async def test_memory_evicts_least_recently_used_sessions():
+    """Test that sessions over max_sessions are evicted, least recently used first."""
+    manager = StateManagerMemory(state=ManagedState, max_sessions=2)
+    for count, token in enumerate(("token-a", "token-b", "token-c")):
+        await _modify(manager, token, count)
+
+    assert list(manager.states) == ["token-b", "token-c"]
+    assert manager.get_metrics()["evictions"]["max_sessions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_keeps_the_session_being_set():
+    """Test that set_state never evicts the session it sets, even if it is not the most recent one."""
+    manager = StateManagerMemory(state=ManagedState, max_bytes=1)
+    state_a = await manager.get_state("token-a")
+    await manager.get_state("token-b")
+
+    state_a.count = 1
+    await manager.set_state("token-a", state_a)
+
+    assert list(manager.states) == ["token-a"]
+    assert manager.get_metrics()["evictions"]["max_bytes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_evicts_expired_sessions():
+    """Test that idle sessions are evicted after the token expiration."""
+    manager = StateManagerMemory(state=ManagedState, token_expiration=0)
+    await manager.get_state("token-a")
+    await asyncio.sleep(0.01)
+    await manager.get_state("token-b")
+
+    assert list(manager.states) == ["token-b"]
+    assert manager.get_metrics()["evictions"]["expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tiered_round_trip_through_disk(states_dir: Path):
+    """Test that the tiered manager only writes idle states, and loads them back.
+
+    Args:
+        states_dir: The states directory.
+    """
+    manager = StateManagerTiered(state=ManagedState)
+    manager.idle_threshold = 0
+    await _modify(manager, "token-a", 1)
+    assert not list(states_dir.glob("*.pkl"))
+
+    await asyncio.sleep(0.01)
+    await manager._spill_idle_states()
+    assert "token-a" not in manager.states
+    assert list(states_dir.glob("*.pkl"))
+
+    await _assert_stored(manager, "token-a", 1)
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_tiered_close_writes_active_states(states_dir: Path):
+    """Test that closing the tiered manager writes the states still in memory.
+
+    Args:
+        states_dir: The states directory.
+    """
+    manager = StateManagerTiered(state=ManagedState)
+    await _modify(manager, "token-a", 2)
+    await manager.close()
+    assert not manager.states
+
+    restarted = StateManagerTiered(state=ManagedState)
+    await _assert_stored(restarted, "token-a", 2)
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_app_closes_the_state_manager_on_shutdown(states_dir: Path):
+    """Test that the app registers the close of its state manager once, and runs it on shutdown.
+
+    Args:
+        states_dir: The states directory.
+    """
+    app = App(_state=ManagedState)
+    app._setup_state()
+    close_tasks = [
+        task
+        for task in app.lifespan_tasks
+        if getattr(task, "__name__", None) == "_close_state_manager"
+    ]
+    assert len(close_tasks) == 1
+
+    app._state_manager = StateManagerTiered(state=ManagedState)
+    async with app._run_lifespan_tasks(app._api):
+        await _modify(app._state_manager, "token-a", 3)
+        assert not list(states_dir.glob("*.pkl"))
+    assert list(states_dir.glob("*.pkl"))
+
+    restarted = StateManagerTiered(state=ManagedState)
+    await _assert_stored(restarted, "token-a", 3)
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_app_saves_the_state_profile_on_shutdown(
+    states_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the sizes profiled since the last periodic save are saved on shutdown.
+
+    Args:
+        states_dir: The states directory.
+        tmp_path: The temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    profile_dir = tmp_path / "profile"
+    monkeypatch.setenv("REFLEX_PERF_MODE", "profile")
+    monkeypatch.setattr(state_profile, "get_profile_dir", lambda: profile_dir)
+    monkeypatch.setattr(state_profile, "_samples", {})
+    # Like a worker which saved its samples just before.
+    monkeypatch.setattr(state_profile, "_last_save", time.monotonic())
+
+    app = App(_state=ManagedState)
+    app._setup_state()
+    app._state_manager = StateManagerTiered(state=ManagedState)
+    async with app._run_lifespan_tasks(app._api):
+        await _modify(app._state_manager, "token-a", 4)
+        assert not profile_dir.exists()
+
+    [profile_path] = profile_dir.glob(f"{state_profile.PROFILE_FILE_PREFIX}*.json")
+    samples = json.loads(profile_path.read_text())
+    assert samples[ManagedState.get_full_name()]["count"][0] == 1
+    assert state_profile.get_report()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_round_trip(states_dir: Path):
+    """Test that the SQLite manager stores the states of each client.
+
+    Args:
+        states_dir: The states directory.
+    """
+    manager = StateManagerSQLite(state=ManagedState)
+    await _modify(manager, "token-a", 1)
+    await _modify(manager, "token-b", 2)
+
+    await _assert_stored(manager, "token-a", 1)
+    await _assert_stored(manager, "token-b", 2)
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_serializes_events_of_a_client(states_dir: Path):
+    """Test that the lock of a client serializes concurrent modifications.
+
+    Args:
+        states_dir: The states directory.
+    """
+    manager = StateManagerSQLite(state=ManagedState)
+
+    async def increment():
+        async with manager.modify_state(_key("token-a")) as state:
+            count = state.count
+            await asyncio.sleep(0.01)
+            state.count = count + 1
+
+    await asyncio.gather(*(increment() for _ in range(5)))
+
+    assert (await manager.get_state(_key("token-a"))).count == 5
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_purges_expired_states(states_dir: Path):
+    """Test that expired states are not read and are purged.
+
+    Args:
+        states_dir: The states directory.
+    """
+    manager = StateManagerSQLite(state=ManagedState, token_expiration=0)
+    await _modify(manager, "token-a", 1)
+
+    assert (await manager.get_state(_key("token-a"))).count == 0
+    await manager._run(manager._purge_expired_batch)
+
+    def count_rows() -> int:
+        connection = manager._get_connection()
+        return connection.execute("SELECT COUNT(*) FROM states").fetchone()[0]
+
+    assert await manager._run(count_rows) == 0
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_failed_write_is_rolled_back(states_dir: Path):
+    """Test that a failed write leaves neither rows nor an open transaction.
+
+    Args:
+        states_dir: The states directory.
+    """
+    manager = StateManagerSQLite(state=ManagedState)
+    await _modify(manager, "token-a", 1)
+
+    rows = [
+        (ManagedState.get_full_name(), b"new"),
+        (ManagedSubstate.get_full_name(), object()),
+    ]
+    with pytest.raises(sqlite3.Error):
+        await manager._run(manager._write_states, "token-a", rows, None)
+
+    assert not manager._get_connection().in_transaction
+    await _assert_stored(manager, "token-a", 1)
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_poll_for_clients_reads_sqlite_states(
+    states_dir: Path, tmp_path: Path
+):
+    """Test that the app harness finds the clients of the SQLite state manager.
+
+    Args:
+        states_dir: The states directory.
+        tmp_path: The temporary directory.
+    """
+    manager = StateManagerSQLite(state=ManagedState)
+    harness = AppHarness(
+        app_name="app",
+        app_source=None,
+        app_path=tmp_path,
+        app_module_path=tmp_path / "app.py",
+        app_instance=SimpleNamespace(state_manager=manager),  # pyright: ignore [reportArgumentType]
+    )
+    assert manager.get_client_states() == {}
+
+    await _modify(manager, "token-a", 1)
+    async with manager.modify_state(_substate_key("token-b", ManagedSubstate)) as state:
+        (await state.get_state(ManagedSubstate)).value = "only-substate"
+
+    states = harness.poll_for_clients(timeout=1)
+    assert sorted(states) == ["token-a", "token-b"]
+    assert states["token-a"].count == 1
+    assert states["token-b"].count == 0
+    await manager.close()
+
+
+@pytest_asyncio.fixture(params=["pickle", "near_cache", "hash_fields"])
+async def redis_state_manager(request: pytest.FixtureRequest):
+    """Create a redis state manager in each of its storage modes.
+
+    Args:
+        request: The pytest request, with the storage mode as param.
+
+    Yields:
+        The state manager.
+    """
+    redis = prerequisites.get_redis()
+    if redis is None:
+        pytest.skip("Test requires redis")
+    manager = StateManagerRedis(
+        state=ManagedState,
+        redis=redis,
+        near_cache_size=10 if request.param == "near_cache" else 0,
+        hash_fields=request.param == "hash_fields",
+    )
+    yield manager
+    keys = [key async for key in redis.scan_iter("token-*")]
+    if keys:
+        await redis.delete(*keys)
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_round_trip(redis_state_manager: StateManagerRedis):
+    """Test that the redis manager stores the states of each client.
+
+    Args:
+        redis_state_manager: The state manager.
+    """
+    await _modify(redis_state_manager, "token-a", 1)
+    await _modify(redis_state_manager, "token-a", 2)
+
+    await _assert_stored(redis_state_manager, "token-a", 2)
+
+
+@pytest.mark.asyncio
+async def test_redis_read_only_events_do_not_write(
+    redis_state_manager: StateManagerRedis,
+):
+    """Test that events which do not change a state do not write it again.
+
+    Args:
+        redis_state_manager: The state manager.
+    """
+    await _modify(redis_state_manager, "token-a", 1)
+    key = _key("token-a")
+    version = await redis_state_manager.redis.get(key + ":version")
+
+    for _ in range(3):
+        async with redis_state_manager.modify_state(key) as state:
+            assert state.count == 1
+
+    assert await redis_state_manager.redis.get(key + ":version") == version
+
+
+@pytest.mark.asyncio
+async def test_redis_writes_states_with_many_vars(
+    redis_state_manager: StateManagerRedis,
+):
+    """Test that states with more vars than a single HSET sets are written whole.
+
+    Args:
+        redis_state_manager: The state manager.
+    """
+    key = _substate_key("token-wide", WideState)
+    async with redis_state_manager.modify_state(key) as state:
+        wide_state = await state.get_state(WideState)
+        for index in range(_WIDE_VARS):
+            setattr(wide_state, f"var_{index}", index + 1)
+        wide_state._clean()
+
+    state = await redis_state_manager.get_state(key)
+    wide_state = await state.get_state(WideState)
+    values = [getattr(wide_state, f"var_{index}") for index in range(_WIDE_VARS)]
+    assert values == list(range(1, _WIDE_VARS + 1))
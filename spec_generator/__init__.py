@@ -6,15 +6,28 @@ Reflex codebase. The specifications are saved as JSON files that can be used
 for documentation, code generation, and IDE integrations.
 """
 
-__version__ = "0.1.0"
+__version__ = "0.6.3"
 
 from spec_generator.cli import main
 from spec_generator.discovery import find_all_components
-from spec_generator.output import generate_spec_files, generate_common_props_spec
+from spec_generator.docs_index import build_docs_index
+from spec_generator.output import (
+    generate_spec_files,
+    generate_common_props_spec,
+    iter_component_specs,
+    generate_component_specs,
+    SpecBundle,
+    SpecLoader,
+)
 
 __all__ = [
     "main",
     "find_all_components",
+    "build_docs_index",
     "generate_spec_files",
     "generate_common_props_spec",
+    "iter_component_specs",
+    "generate_component_specs",
+    "SpecBundle",
+    "SpecLoader",
 ]
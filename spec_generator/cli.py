@@ -2,11 +2,24 @@
 Command-line interface for the specification generator.
 """
 import os
+import json
 import argparse
 from typing import Optional
 from pathlib import Path
 
 from spec_generator.output import generate_spec_files, generate_common_props_spec
+from spec_generator.output.bundle import get_bundle_path
+from spec_generator.output.manifest import get_manifest_path
+from spec_generator.docs_index import get_docs_index_path
+from spec_generator.extraction.runtime import get_runtime_cache_path
+from spec_generator.extraction.literal_aliases import (
+    collect_literal_aliases,
+    get_components_dir,
+    get_literal_aliases_path,
+    get_type_mappings,
+)
+from spec_generator.mapping import get_component_index_path
+from spec_generator.utils.profiling import start_profile, stop_profile, save_profile_report
 
 def main(args: Optional[argparse.Namespace] = None) -> None:
     """Main entry point for the specification generator.
@@ -33,6 +46,65 @@ def main(args: Optional[argparse.Namespace] = None) -> None:
             action="store_true",
             help="Clean the specs directory before generating new specs"
         )
+        parser.add_argument(
+            "--force", 
+            action="store_true",
+            help="Regenerate every spec, even if its sources did not change since the last run"
+        )
+        parser.add_argument(
+            "--jobs", 
+            type=int,
+            default=1,
+            help="Number of worker processes to extract specs with"
+        )
+        parser.add_argument(
+            "--normalized", 
+            action="store_true",
+            help="Refer to shared prop and event groups and type mappings instead of repeating them in every spec"
+        )
+        parser.add_argument(
+            "--watch", 
+            action="store_true",
+            help="Keep running and regenerate the specs of components whose source files change"
+        )
+        parser.add_argument(
+            "--watch-interval", 
+            type=float,
+            default=0.5,
+            help="Seconds between checks of the source files in watch mode"
+        )
+        parser.add_argument(
+            "--runtime", 
+            action="store_true",
+            help="Import the component modules in a separate process to find the fields created at runtime"
+        )
+        parser.add_argument(
+            "--profile", 
+            nargs="?",
+            const="spec_profile.json",
+            default=None,
+            metavar="REPORT",
+            help="Time the generation phases per component and save the report as JSON (default: spec_profile.json)"
+        )
+        parser.add_argument(
+            "--diff", 
+            nargs=2,
+            default=None,
+            metavar=("OLD", "NEW"),
+            help="Compare two specs directories or bundles and print the changes as JSON instead of generating specs"
+        )
+        parser.add_argument(
+            "--changelog", 
+            action="store_true",
+            help="Print the changes found with --diff as a Markdown changelog"
+        )
+        parser.add_argument(
+            "--diff-output", 
+            type=str,
+            default=None,
+            metavar="PATH",
+            help="Save the changes found with --diff to a file instead of printing them"
+        )
         parser.add_argument(
             "--only-common-props", 
             action="store_true",
@@ -40,6 +112,24 @@ def main(args: Optional[argparse.Namespace] = None) -> None:
         )
         args = parser.parse_args()
     
+    # Compare two generated spec sets, nothing is generated
+    if getattr(args, "diff", None):
+        from spec_generator.diff import diff_spec_sets, format_changelog
+        try:
+            diff = diff_spec_sets(*args.diff)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+        text = format_changelog(diff) if getattr(args, "changelog", False) else json.dumps(diff, indent=2) + "\n"
+        diff_output = getattr(args, "diff_output", None)
+        if diff_output:
+            with open(diff_output, 'w') as f:
+                f.write(text)
+            print(f"Spec changes saved to: {os.path.abspath(diff_output)}")
+        else:
+            print(text, end="")
+        return
+    
     base_dir = args.base_dir
     specs_dir = args.specs_dir
     
@@ -51,16 +141,55 @@ def main(args: Optional[argparse.Namespace] = None) -> None:
         print(f"Cleaning specs directory: {specs_dir}")
         for file in Path(specs_dir).glob("*.json"):
             file.unlink()
+        for generated_path in (
+            get_manifest_path(specs_dir),
+            get_bundle_path(specs_dir),
+            get_docs_index_path(specs_dir),
+            get_component_index_path(specs_dir),
+            get_literal_aliases_path(specs_dir),
+            get_runtime_cache_path(specs_dir),
+        ):
+            if os.path.exists(generated_path):
+                os.remove(generated_path)
     
     # Generate specs
     if args.only_common_props:
         print("Generating only common props specification...")
-        generate_common_props_spec(specs_dir)
+        literal_aliases = collect_literal_aliases(get_components_dir(base_dir), get_literal_aliases_path(specs_dir))
+        generate_common_props_spec(specs_dir, type_mappings=get_type_mappings(literal_aliases))
+    elif getattr(args, "watch", False):
+        from spec_generator.watch import watch_spec_files
+        print(f"Watching component specifications...")
+        print(f"Base directory: {base_dir}")
+        print(f"Specs directory: {specs_dir}")
+        watch_spec_files(
+            base_dir,
+            specs_dir,
+            interval=getattr(args, "watch_interval", 0.5),
+            jobs=getattr(args, "jobs", 1),
+            normalized=getattr(args, "normalized", False),
+            runtime=getattr(args, "runtime", False),
+            incremental=not getattr(args, "force", False),
+        )
     else:
         print(f"Generating component specifications...")
         print(f"Base directory: {base_dir}")
         print(f"Specs directory: {specs_dir}")
-        generate_spec_files(base_dir, specs_dir)
+        profile_path = getattr(args, "profile", None)
+        if profile_path:
+            start_profile()
+        generate_spec_files(
+            base_dir,
+            specs_dir,
+            incremental=not getattr(args, "force", False),
+            jobs=getattr(args, "jobs", 1),
+            normalized=getattr(args, "normalized", False),
+            runtime=getattr(args, "runtime", False),
+        )
+        if profile_path:
+            report = stop_profile()
+            save_profile_report(report, profile_path)
+            print(f"Profile report saved to: {os.path.abspath(profile_path)}")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,260 @@
+"""
+Differences between two sets of component specs.
+
+Either side can be a specs directory or a spec bundle. The hash of every
+spec is read from the manifest of a directory or from the header of a
+bundle, so the specs that did not change are never loaded; only the specs
+whose hashes differ are decoded and compared prop by prop.
+
+The delta of a changed component lists its added and removed props, the
+props whose type or enum values changed, its added and removed events, and
+the names of the other spec fields that changed.
+"""
+import os
+from typing import Dict, Any, List, Optional
+
+from spec_generator.output.bundle import SpecBundle, PROP_FIELDS, EVENT_FIELDS, get_spec_event_names
+from spec_generator.output.manifest import load_manifest, hash_spec
+from spec_generator.output.normalize import SpecLoader
+
+# Spec fields compared through the props and events deltas
+_COMPARED_FIELDS = set(PROP_FIELDS) | set(EVENT_FIELDS)
+
+# Files of a specs directory that are not component specs
+_NON_SPEC_FILES = {"common_props.json", "shared_groups.json"}
+
+
+class _SpecSource:
+    """The hashes and specs of a specs directory or a bundle."""
+
+    def __init__(self, path: str):
+        """Read the spec hashes of a specs directory or a bundle."""
+        self.path = path
+        self._bundle: Optional[SpecBundle] = None
+        self._loader: Optional[SpecLoader] = None
+        self._spec_files: Dict[str, str] = {}
+        self._specs: Dict[str, Dict[str, Any]] = {}
+        self.hashes: Dict[str, str] = {}
+
+        if os.path.isfile(path):
+            self._bundle = SpecBundle(path)
+            self.hashes = {name: self._bundle.get_hash(name) for name in self._bundle.components()}
+            return
+
+        if not os.path.isdir(path):
+            raise ValueError(f"Not a specs directory or bundle: {path}")
+
+        self._loader = SpecLoader(path)
+        manifest = load_manifest(path)
+        if manifest:
+            for component_name, entry in manifest.items():
+                self._spec_files[component_name] = entry["spec_file"]
+                spec_hash = entry.get("spec_hash")
+                if spec_hash is None:
+                    # Manifests written before the hashes were added
+                    spec_hash = self._hash_loaded(component_name)
+                if spec_hash is not None:
+                    self.hashes[component_name] = spec_hash
+            return
+
+        # Without a manifest, every JSON file is assumed to be a spec
+        for spec_file in sorted(os.listdir(path)):
+            if not spec_file.endswith(".json") or spec_file in _NON_SPEC_FILES:
+                continue
+            spec = self._loader.load_file(spec_file)
+            if isinstance(spec, dict) and "name" in spec:
+                self._spec_files[spec["name"]] = spec_file
+                self._specs[spec["name"]] = spec
+                self.hashes[spec["name"]] = hash_spec(spec)
+
+    def get(self, component_name: str) -> Optional[Dict[str, Any]]:
+        """Load the full spec of a component."""
+        if self._bundle is not None:
+            return self._bundle.get(component_name)
+        if component_name not in self._specs:
+            spec_file = self._spec_files.get(component_name)
+            self._specs[component_name] = self._loader.load_file(spec_file) if spec_file else None
+        return self._specs[component_name]
+
+    def close(self) -> None:
+        """Close the bundle, if the source is one."""
+        if self._bundle is not None:
+            self._bundle.close()
+
+    def _hash_loaded(self, component_name: str) -> Optional[str]:
+        """Hash the spec of a component by loading it."""
+        spec = self.get(component_name)
+        return hash_spec(spec) if spec is not None else None
+
+
+def diff_spec_sets(old_path: str, new_path: str) -> Dict[str, Any]:
+    """Compare two sets of component specs.
+
+    Args:
+        old_path: The specs directory or bundle of the previous run
+        new_path: The specs directory or bundle of the new run
+
+    Returns:
+        A dictionary with the "added" and "removed" component names, the
+        number of "unchanged" components and the delta of each "changed"
+        component (see `diff_specs`)
+
+    Raises:
+        ValueError: If a path is neither a specs directory nor a spec bundle
+    """
+    old = _SpecSource(old_path)
+    try:
+        new = _SpecSource(new_path)
+    except Exception:
+        old.close()
+        raise
+
+    try:
+        changed = {}
+        unchanged = 0
+        for component_name in sorted(set(old.hashes) & set(new.hashes)):
+            if old.hashes[component_name] == new.hashes[component_name]:
+                unchanged += 1
+                continue
+            delta = diff_specs(old.get(component_name), new.get(component_name))
+            if delta:
+                changed[component_name] = delta
+            else:
+                unchanged += 1
+
+        return {
+            "old": old_path,
+            "new": new_path,
+            "added": sorted(set(new.hashes) - set(old.hashes)),
+            "removed": sorted(set(old.hashes) - set(new.hashes)),
+            "changed": changed,
+            "unchanged": unchanged,
+        }
+    finally:
+        old.close()
+        new.close()
+
+
+def diff_specs(old_spec: Dict[str, Any], new_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Compare two specs of a component.
+
+    Props are compared by name across own and inherited props, so a prop
+    moving between a class and its bases is not a change.
+
+    Args:
+        old_spec: The previous spec
+        new_spec: The new spec
+
+    Returns:
+        The delta, with only the parts that changed: "props" with the
+        "added" and "removed" names, "type_changed" and "values_changed"
+        props; "events" with the "added" and "removed" names; and the names
+        of the other "fields" that changed. Empty if the specs are equivalent.
+    """
+    delta: Dict[str, Any] = {}
+
+    old_props = _get_props(old_spec)
+    new_props = _get_props(new_spec)
+    props: Dict[str, Any] = {}
+    added = sorted(set(new_props) - set(old_props))
+    removed = sorted(set(old_props) - set(new_props))
+    if added:
+        props["added"] = added
+    if removed:
+        props["removed"] = removed
+
+    type_changed = {}
+    values_changed = {}
+    for prop_name in sorted(set(old_props) & set(new_props)):
+        old_prop, new_prop = old_props[prop_name], new_props[prop_name]
+        if old_prop.get("type") != new_prop.get("type"):
+            type_changed[prop_name] = {"old": old_prop.get("type"), "new": new_prop.get("type")}
+        old_values, new_values = old_prop.get("values") or [], new_prop.get("values") or []
+        if old_values != new_values:
+            values_changed[prop_name] = {
+                "added": [value for value in new_values if value not in old_values],
+                "removed": [value for value in old_values if value not in new_values],
+            }
+    if type_changed:
+        props["type_changed"] = type_changed
+    if values_changed:
+        props["values_changed"] = values_changed
+    if props:
+        delta["props"] = props
+
+    old_events = get_spec_event_names(old_spec)
+    new_events = get_spec_event_names(new_spec)
+    events = {}
+    if new_events - old_events:
+        events["added"] = sorted(new_events - old_events)
+    if old_events - new_events:
+        events["removed"] = sorted(old_events - new_events)
+    if events:
+        delta["events"] = events
+
+    fields = sorted(
+        field
+        for field in set(old_spec) | set(new_spec)
+        if field not in _COMPARED_FIELDS and old_spec.get(field) != new_spec.get(field)
+    )
+    if fields:
+        delta["fields"] = fields
+
+    return delta
+
+
+def format_changelog(diff: Dict[str, Any]) -> str:
+    """Format the result of `diff_spec_sets` as a Markdown changelog.
+
+    Args:
+        diff: The result of `diff_spec_sets`
+
+    Returns:
+        The changelog text
+    """
+    lines = [f"# Spec changes from {diff['old']} to {diff['new']}", ""]
+    if diff["added"]:
+        lines.append(f"Added components: {', '.join(diff['added'])}")
+    if diff["removed"]:
+        lines.append(f"Removed components: {', '.join(diff['removed'])}")
+    lines.append(f"Changed components: {len(diff['changed'])}, unchanged: {diff['unchanged']}")
+
+    for component_name, delta in diff["changed"].items():
+        lines.extend(["", f"## {component_name}", ""])
+        props = delta.get("props", {})
+        for prop_name in props.get("added", []):
+            lines.append(f"- Added prop `{prop_name}`")
+        for prop_name in props.get("removed", []):
+            lines.append(f"- Removed prop `{prop_name}`")
+        for prop_name, change in props.get("type_changed", {}).items():
+            lines.append(f"- Prop `{prop_name}` type changed from `{change['old']}` to `{change['new']}`")
+        for prop_name, change in props.get("values_changed", {}).items():
+            parts = []
+            if change["added"]:
+                parts.append(f"added {_format_values(change['added'])}")
+            if change["removed"]:
+                parts.append(f"removed {_format_values(change['removed'])}")
+            lines.append(f"- Prop `{prop_name}` values: {'; '.join(parts) or 'reordered'}")
+        events = delta.get("events", {})
+        for event_name in events.get("added", []):
+            lines.append(f"- Added event `{event_name}`")
+        for event_name in events.get("removed", []):
+            lines.append(f"- Removed event `{event_name}`")
+        if delta.get("fields"):
+            lines.append(f"- Changed fields: {', '.join(delta['fields'])}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _get_props(spec: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Get the props of a spec by name, own props first."""
+    props: Dict[str, Dict[str, Any]] = {}
+    for field in PROP_FIELDS:
+        for prop in spec.get(field, []):
+            props.setdefault(prop["name"], prop)
+    return props
+
+
+def _format_values(values: List[Any]) -> str:
+    """Format enum values for the changelog."""
+    return ", ".join(f"`{value}`" for value in values)
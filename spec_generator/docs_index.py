@@ -0,0 +1,262 @@
+"""
+Index of the documentation page of each component.
+
+The library docs declare the components they document in their frontmatter:
+
+    ---
+    components:
+      - rx.button
+    ---
+
+Entries name what users write, so the class names of the namespace packages
+(`rx.recharts.AreaChart`, `rx.el.A`) are converted to the names their specs
+are saved under (`recharts.area_chart`, `el.a`). Only the frontmatter block of each page is read, pages are read over a
+thread pool, and the components found in each page are cached on disk
+together with the page's modification time and size, so unchanged pages are
+not read again.
+"""
+import os
+import re
+import json
+import keyword
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+DOCS_INDEX_FILENAME = ".docs_index.json"
+
+# A list item naming a component, like `- rx.alert_dialog.root` or `- rx.el.A`
+_COMPONENT_ITEM = re.compile(r'-\s*rx\.([a-zA-Z_]\w*(?:\.[a-zA-Z_]\w*)*)')
+
+# Word boundaries of a CamelCase class name, like `Area|Chart` and `X|Axis`
+_CAMEL_CASE_BOUNDARY = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+
+
+def get_docs_dir(base_dir: str) -> str:
+    """Get the library documentation directory of the Reflex codebase.
+
+    Args:
+        base_dir: Base directory of the Reflex codebase
+
+    Returns:
+        The path of the library docs directory
+    """
+    return f"{base_dir}/reflex/docs/library"
+
+
+def get_docs_index_path(specs_dir: str) -> str:
+    """Get the path of the docs index cache of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        The path to the docs index cache file
+    """
+    return os.path.join(specs_dir, DOCS_INDEX_FILENAME)
+
+
+def read_frontmatter(doc_path: str) -> Optional[str]:
+    """Read the frontmatter block at the start of a markdown file.
+
+    The file is read line by line and reading stops at the end of the block.
+
+    Args:
+        doc_path: The path of the markdown file
+
+    Returns:
+        The text between the `---` delimiters, or None if the file does not
+        start with a frontmatter block
+    """
+    with open(doc_path, 'r') as f:
+        if f.readline().strip() != '---':
+            return None
+
+        lines = []
+        for line in f:
+            if line.strip() == '---':
+                return ''.join(lines)
+            lines.append(line)
+
+    # Unterminated block
+    return None
+
+
+def parse_frontmatter_components(frontmatter: str) -> List[str]:
+    """Get the names of the components a frontmatter block documents.
+
+    Args:
+        frontmatter: The text of the frontmatter block
+
+    Returns:
+        The dotted names of the entries, without the `rx.` prefix and
+        converted with `get_component_name`, in order
+    """
+    components = []
+    in_components = False
+
+    for line in frontmatter.split('\n'):
+        stripped = line.strip()
+        if not in_components:
+            in_components = stripped == 'components:'
+            continue
+        if not stripped:
+            continue
+        if not stripped.startswith('-'):
+            break
+
+        match = _COMPONENT_ITEM.match(stripped)
+        if match:
+            component_name = get_component_name(match.group(1))
+            if component_name not in components:
+                components.append(component_name)
+
+    return components
+
+
+def get_component_name(path: str) -> str:
+    """Get the spec name of a component named in the docs.
+
+    Class names are converted to the snake_case names they are exported as,
+    keeping the trailing underscore of the names that are Python keywords.
+
+    Args:
+        path: The dotted path after `rx.`, like `recharts.AreaChart`
+
+    Returns:
+        The spec name, like `recharts.area_chart` (`el.Del` is `el.del_`)
+    """
+    parts = []
+    for part in path.split('.'):
+        if part[:1].isupper():
+            part = _CAMEL_CASE_BOUNDARY.sub('_', part).lower()
+            if keyword.iskeyword(part):
+                part += '_'
+        parts.append(part)
+    return '.'.join(parts)
+
+
+def scan_doc_file(doc_path: str) -> List[str]:
+    """Get the names of the components a documentation page documents.
+
+    Args:
+        doc_path: The path of the markdown file
+
+    Returns:
+        The component names, empty if the page has no frontmatter or cannot
+        be read
+    """
+    try:
+        frontmatter = read_frontmatter(doc_path)
+    except (OSError, UnicodeDecodeError):
+        return []
+    return parse_frontmatter_components(frontmatter) if frontmatter else []
+
+
+def build_docs_index(
+    docs_dir: str,
+    cache_path: Optional[str] = None,
+    max_workers: int = 8,
+    relative_to: Optional[str] = None,
+) -> Dict[str, str]:
+    """Map each documented component to its documentation page.
+
+    Args:
+        docs_dir: The library documentation directory
+        cache_path: Optional path of the on-disk cache of the scanned pages
+        max_workers: The number of threads reading the pages
+        relative_to: Optional directory the returned paths are made relative
+            to, so specs do not depend on where the codebase is checked out
+
+    Returns:
+        A dictionary of component names to documentation file paths. Entries
+        of namespace members also document their namespace, so
+        `rx.alert_dialog.root` documents `alert_dialog`, unless a page
+        names the namespace itself. When a component is documented by several
+        pages, the last one in path order wins.
+    """
+    doc_files: List[Tuple[str, int, int]] = []
+    for root, dirs, files in os.walk(docs_dir):
+        for file in files:
+            if file.endswith('.md'):
+                doc_path = os.path.join(root, file)
+                stat = os.stat(doc_path)
+                doc_files.append((doc_path, stat.st_mtime_ns, stat.st_size))
+    doc_files.sort()
+
+    cached = load_docs_index_cache(cache_path) if cache_path else {}
+    entries: Dict[str, Dict[str, Any]] = {}
+    stale = []
+
+    for doc_path, mtime_ns, size in doc_files:
+        entry = cached.get(doc_path)
+        if entry and entry.get("mtime_ns") == mtime_ns and entry.get("size") == size:
+            entries[doc_path] = entry
+        else:
+            entries[doc_path] = {"mtime_ns": mtime_ns, "size": size, "components": []}
+            stale.append(doc_path)
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(stale)))) as executor:
+            for doc_path, components in zip(stale, executor.map(scan_doc_file, stale)):
+                entries[doc_path]["components"] = components
+
+    if cache_path and (stale or set(entries) != set(cached)):
+        save_docs_index_cache(cache_path, entries)
+
+    documented = {}
+    namespaces = {}
+    for doc_path, _, _ in doc_files:
+        indexed_path = os.path.relpath(doc_path, relative_to) if relative_to else doc_path
+        for component_name in entries[doc_path]["components"]:
+            documented[component_name] = indexed_path
+            parts = component_name.split('.')
+            for length in range(1, len(parts)):
+                namespaces['.'.join(parts[:length])] = indexed_path
+
+    return {**namespaces, **documented}
+
+
+def load_docs_index_cache(cache_path: str) -> Dict[str, Dict[str, Any]]:
+    """Load the scanned pages cached by a previous run.
+
+    Args:
+        cache_path: The path of the cache file
+
+    Returns:
+        A dictionary of page paths to their modification time, size and
+        components, empty if there is no readable cache or it was saved by
+        another generator version
+    """
+    from spec_generator import __version__
+
+    if not os.path.exists(cache_path):
+        return {}
+
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable docs index {cache_path}: {e}")
+        return {}
+    if cached.get("generator_version") != __version__:
+        return {}
+    return cached.get("docs", {})
+
+
+def save_docs_index_cache(cache_path: str, entries: Dict[str, Dict[str, Any]]) -> str:
+    """Save the scanned pages for the next run.
+
+    Args:
+        cache_path: The path of the cache file
+        entries: A dictionary of page paths to their modification time, size
+            and components
+
+    Returns:
+        The path to the saved cache file
+    """
+    from spec_generator import __version__
+
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    with open(cache_path, 'w') as f:
+        json.dump({"generator_version": __version__, "docs": dict(sorted(entries.items()))}, f, indent=2)
+    return cache_path
@@ -2,20 +2,30 @@
 
 __all__ = [
     "extract_properties_from_class_body",
+    "extract_properties_from_class_info",
     "should_skip_property",
     "extract_event_handlers",
     "extract_common_events",
     "extract_component_info",
-    "extract_class_body",
     "check_supports_common_props",
-    "TYPE_MAPPINGS",
+    "parse_module",
+    "find_component_class",
+    "load_module",
+    "get_class_fields",
+    "get_inherited_fields",
+    "collect_literal_aliases",
+    "resolve_literal_values",
     "COMMON_EVENT_HANDLERS",
 ]
 
 from .properties import (
     extract_properties_from_class_body,
+    extract_properties_from_class_info,
     should_skip_property,
-    TYPE_MAPPINGS,
 )
+from .literal_aliases import collect_literal_aliases, resolve_literal_values
 from .events import extract_event_handlers, extract_common_events, COMMON_EVENT_HANDLERS
-from .component import extract_component_info, extract_class_body, check_supports_common_props
+from .module_index import parse_module, find_component_class
+from .module_cache import load_module, get_class_fields
+from .inheritance import get_inherited_fields
+from .component import extract_component_info, check_supports_common_props
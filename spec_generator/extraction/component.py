@@ -1,10 +1,11 @@
 import os
-import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set
 
-from spec_generator.extraction.properties import extract_properties_from_class_body
-from spec_generator.utils import print_debug
+from spec_generator.extraction.module_cache import ModuleCache, load_module, get_class_fields
+from spec_generator.extraction.module_index import find_component_class
+from spec_generator.extraction.inheritance import get_inherited_fields, add_inherited_fields
+from spec_generator.utils.profiling import profile_phase
 
 # Common Reflex event handlers that should be included in all component specs
 COMMON_EVENT_HANDLERS: List[str] = [
@@ -14,7 +15,15 @@ COMMON_EVENT_HANDLERS: List[str] = [
 ]
 
 
-def extract_component_info(component_name: str, component_data: Dict[str, str], doc_path: Optional[Path] = None) -> Dict[str, Any]:
+def extract_component_info(
+    component_name: str,
+    component_data: Dict[str, str],
+    doc_path: Optional[Path] = None,
+    module_cache: Optional[ModuleCache] = None,
+    dependencies: Optional[Set[str]] = None,
+    runtime_classes: Optional[Dict[str, Dict[str, Any]]] = None,
+    literal_aliases: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+) -> Dict[str, Any]:
     """
     Extract component information from a file.
     
@@ -22,6 +31,13 @@ def extract_component_info(component_name: str, component_data: Dict[str, str],
         component_name: The name of the component.
         component_data: The component data from the mappings.
         doc_path: The path to the documentation file.
+        module_cache: Cache of parsed modules shared between components of a run.
+        dependencies: Optional set that collects the resolved paths of the
+            source files the spec was extracted from.
+        runtime_classes: The runtime introspection results of the classes of
+            the module, to complete the statically extracted fields with.
+        literal_aliases: The table returned by `collect_literal_aliases` the
+            enum values of the props are taken from.
     
     Returns:
         A dictionary with the component information.
@@ -43,68 +59,40 @@ def extract_component_info(component_name: str, component_data: Dict[str, str],
         "properties": [],
         "event_names": [],  # Change from 'events' to 'event_names' - just a list of names
         "styling_props": [],
+        "inherited_properties": [],  # Props declared by base classes, with the class they come from
+        "inherited_event_names": [],
+        "inherited_styling_props": [],
         "subcomponents": {}  # New field to store subcomponent specs
     }
     
+    if module_cache is None:
+        module_cache = {}
+    if dependencies is None:
+        dependencies = set()
+    
     # Check if file exists
     if not os.path.exists(file_path):
+        dependencies.add(str(Path(file_path).resolve()))
         print(f"  Warning: File {file_path} does not exist")
         spec["error"] = f"File not found: {file_path}"
         return spec
     
     # Extract information from the file
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
-        # Check for both the exact module name and a capitalized version
-        class_names_to_try = [
-            module_name,  # Original name
-            module_name.capitalize(),  # Capitalized (first letter only)
-            ''.join(word.capitalize() for word in module_name.split('_')),  # CamelCase
-            module_name.upper()  # ALL_CAPS
-        ]
-        
-        class_match = None
-        class_name = None
-        
-        # Try different class name patterns
-        for name in class_names_to_try:
-            class_pattern = rf"class\s+{name}\b[^:]*:"
-            class_match = re.search(class_pattern, content)
-            if class_match:
-                class_name = name
-                print(f"  Found class {class_name}")
-                break
-        
-        # If still not found, look for any class with a create method
-        if not class_match:
-            create_pattern = r"class\s+(\w+)[^:]*:.*?\n\s+@classmethod\s+def\s+create\s*\("
-            create_match = re.search(create_pattern, content, re.DOTALL)
-            
-            if create_match:
-                class_name = create_match.group(1)
-                print(f"  Found class {class_name} with create method")
-                class_pattern = rf"class\s+{class_name}\b[^:]*:"
-                class_match = re.search(class_pattern, content)
+        # Parse the module once and index all of its classes
+        module = load_module(file_path, module_cache)
+        dependencies.add(module["path"])
+        classes = module["classes"]
+        with profile_phase("class_lookup"):
+            class_name = component_data.get('class_name')
+            if class_name:
+                class_info = classes.get(class_name)
+            else:
+                class_info = find_component_class(classes, module_name)
         
-        if class_match:
-            # Extract the entire class definition
-            class_start = class_match.start()
-            
-            # Find the class body by balancing braces and indentation
-            class_body = extract_class_body(content, class_start)
-            
-            # Extract docstring
-            docstring_match = re.search(r'"""(.*?)"""', class_body, re.DOTALL)
-            if docstring_match:
-                spec["docstring"] = docstring_match.group(1).strip()
-            
-            # Extract base classes
-            bases_match = re.search(rf"class\s+{class_name}\s*\((.*?)\)\s*:", class_body)
-            if bases_match:
-                bases = bases_match.group(1)
-                spec["bases"] = [base.strip() for base in bases.split(',')]
+        if class_info:
+            spec["docstring"] = class_info["docstring"]
+            spec["bases"] = list(class_info["bases"])
             
             # Check if component supports common prop categories
             spec["supports_common_props"] = check_supports_common_props(spec["bases"])
@@ -116,73 +104,42 @@ def extract_component_info(component_name: str, component_data: Dict[str, str],
                     if event_name not in spec["event_names"]:
                         spec["event_names"].append(event_name)
             
-            # Check if this is a ComponentNamespace or contains other component classes
-            if "ComponentNamespace" in spec["bases"]:
+            # Check if this is a ComponentNamespace or contains other component classes.
+            # Callable namespaces are mapped to the class their __call__ creates,
+            # so their members are read from the namespace class.
+            namespace_info = class_info
+            if component_data.get('namespace_class'):
+                namespace_info = classes.get(component_data['namespace_class'], class_info)
+            if "ComponentNamespace" in namespace_info["bases"]:
                 print(f"  This is a ComponentNamespace, looking for member components...")
                 
-                # Extract subcomponent class names
-                subcomponent_pattern = r"(\w+)\s*=\s*staticmethod\((\w+)\.create\)"
-                subcomponents = re.finditer(subcomponent_pattern, class_body, re.MULTILINE)
-                
-                subcomponent_classes = []
-                for sc_match in subcomponents:
-                    subcomponent_classes.append(sc_match.group(2))
+                subcomponent_classes = namespace_info["members"]
                 
                 if subcomponent_classes:
                     print(f"  Found subcomponents: {', '.join(subcomponent_classes)}")
                     
                     # Look for each subcomponent class and extract its properties
                     for sc_class in subcomponent_classes:
-                        sc_pattern = rf"class\s+{sc_class}\b[^:]*:"
-                        sc_match = re.search(sc_pattern, content)
+                        sc_info = classes.get(sc_class)
                         
-                        if sc_match:
+                        if sc_info:
                             print(f"  Extracting info from {sc_class}")
-                            sc_start = sc_match.start()
-                            
-                            # Find the subcomponent class body
-                            sc_body = extract_class_body(content, sc_start)
-                            
-                            # Extract subcomponent base classes to check if it supports common props
-                            sc_bases_match = re.search(rf"class\s+{sc_class}\s*\((.*?)\)\s*:", sc_body)
-                            sc_bases = []
-                            
-                            if sc_bases_match:
-                                sc_bases = [base.strip() for base in sc_bases_match.group(1).split(',')]
-                            
-                            # Check if supports common props
-                            sc_supports_common_props = check_supports_common_props(sc_bases)
-                            
-                            # Extract subcomponent docstring
-                            sc_docstring = ""
-                            sc_docstring_match = re.search(r'"""(.*?)"""', sc_body, re.DOTALL)
-                            if sc_docstring_match:
-                                sc_docstring = sc_docstring_match.group(1).strip()
-                            
-                            # Create a subcomponent spec
-                            sc_spec = {
-                                "name": sc_class,
-                                "docstring": sc_docstring,
-                                "bases": sc_bases,
-                                "supports_common_props": sc_supports_common_props,
-                                "properties": [],
-                                "event_names": [],
-                                "styling_props": []
-                            }
-                            
-                            # Add common event handlers if this component supports common props
-                            if sc_supports_common_props:
-                                for event_name in COMMON_EVENT_HANDLERS:
-                                    sc_spec["event_names"].append(event_name)
-                            
-                            # Extract properties from the subcomponent
-                            extract_properties_from_class_body(sc_body, sc_spec)
-                            
-                            # Add the subcomponent spec to the main spec
-                            spec["subcomponents"][sc_class] = sc_spec
+                            spec["subcomponents"][sc_class] = extract_subcomponent_spec(
+                                module, sc_info, module_cache, dependencies, runtime_classes, literal_aliases
+                            )
             
-            # Extract properties from the main component class
-            extract_properties_from_class_body(class_body, spec)
+            with profile_phase("property_extraction"):
+                # Extract properties from the main component class
+                merge_class_fields(spec, get_class_fields(module, class_info["name"], literal_aliases))
+                
+                # Add the properties inherited from its base classes
+                inherited = get_inherited_fields(module, class_info["name"], module_cache, literal_aliases)
+                add_inherited_fields(spec, inherited)
+                
+                if runtime_classes is not None:
+                    from spec_generator.extraction.runtime import merge_runtime_fields
+                    merge_runtime_fields(spec, runtime_classes.get(class_info["name"]))
+            dependencies.update(inherited["sources"])
         
         else:
             print(f"  Warning: No suitable class found in {file_path}")
@@ -195,41 +152,78 @@ def extract_component_info(component_name: str, component_data: Dict[str, str],
     return spec
 
 
-def extract_class_body(content: str, class_start: int) -> str:
-    """Extract the class body from the file content.
+def extract_subcomponent_spec(
+    module: Dict[str, Any],
+    class_info: Dict[str, Any],
+    module_cache: ModuleCache,
+    dependencies: Set[str],
+    runtime_classes: Optional[Dict[str, Dict[str, Any]]] = None,
+    literal_aliases: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+) -> Dict[str, Any]:
+    """Build the spec of a ComponentNamespace member class.
     
     Args:
-        content: The file content.
-        class_start: The start position of the class.
+        module: The loaded module the member is defined in.
+        class_info: The indexed class information of the member.
+        module_cache: Cache of parsed modules shared between components of a run.
+        dependencies: Set that collects the paths of the source files used.
+        runtime_classes: The runtime introspection results of the classes of
+            the module, if any.
+        literal_aliases: The table returned by `collect_literal_aliases`.
         
     Returns:
-        The class body.
+        The subcomponent spec.
     """
-    class_body = ""
-    open_braces = 0
-    in_class = True
-    
-    for i in range(class_start, len(content)):
-        if content[i] == '{':
-            open_braces += 1
-        elif content[i] == '}':
-            open_braces -= 1
-        elif content[i] == '\n':
-            # Check if next line is part of the class (has indentation)
-            next_line_start = i + 1
-            if next_line_start < len(content):
-                # If we're out of braces and the next line is not indented, we're out of the class
-                if open_braces == 0 and next_line_start < len(content) and not content[next_line_start].isspace():
-                    in_class = False
+    # Check if supports common props
+    sc_supports_common_props = check_supports_common_props(class_info["bases"])
+    
+    # Create a subcomponent spec
+    sc_spec = {
+        "name": class_info["name"],
+        "docstring": class_info["docstring"],
+        "bases": list(class_info["bases"]),
+        "supports_common_props": sc_supports_common_props,
+        "properties": [],
+        "event_names": [],
+        "styling_props": [],
+        "inherited_properties": [],
+        "inherited_event_names": [],
+        "inherited_styling_props": []
+    }
+    
+    # Add common event handlers if this component supports common props
+    if sc_supports_common_props:
+        for event_name in COMMON_EVENT_HANDLERS:
+            sc_spec["event_names"].append(event_name)
+    
+    with profile_phase("property_extraction"):
+        # Extract properties from the subcomponent
+        merge_class_fields(sc_spec, get_class_fields(module, class_info["name"], literal_aliases))
         
-        if not in_class and open_braces == 0:
-            class_body = content[class_start:i]
-            break
+        # Add the properties inherited from its base classes
+        inherited = get_inherited_fields(module, class_info["name"], module_cache, literal_aliases)
+        add_inherited_fields(sc_spec, inherited)
+        
+        if runtime_classes is not None:
+            from spec_generator.extraction.runtime import merge_runtime_fields
+            merge_runtime_fields(sc_spec, runtime_classes.get(class_info["name"]))
+    dependencies.update(inherited["sources"])
     
-    if not class_body:
-        class_body = content[class_start:]
+    return sc_spec
+
+
+def merge_class_fields(spec: Dict[str, Any], fields: Dict[str, Any]) -> None:
+    """Add the fields extracted from a class to a spec.
     
-    return class_body
+    Args:
+        spec: The specification dictionary to update.
+        fields: The fields returned by `get_class_fields`.
+    """
+    spec["properties"].extend(fields["properties"])
+    spec["styling_props"].extend(fields["styling_props"])
+    for event_name in fields["event_names"]:
+        if event_name not in spec["event_names"]:
+            spec["event_names"].append(event_name)
 
 
 def check_supports_common_props(bases: List[str]) -> bool:
@@ -0,0 +1,319 @@
+"""
+Resolution of the props components inherit from their base classes.
+
+Base classes are resolved statically across modules by following the import
+indexes of the parsed modules (including the `.pyi` stubs of lazily loaded
+packages). The flattened fields of each class are computed once per run and
+memoized on its module, so walking deep hierarchies stays linear in the
+number of classes.
+"""
+import os
+import copy
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from spec_generator.extraction.module_cache import ModuleCache, load_module, get_class_fields
+from spec_generator.utils.profiling import profile_phase
+
+# Framework base classes whose attributes are internals rather than props
+FRAMEWORK_BASE_CLASSES: Set[str] = {
+    "Base",
+    "BaseComponent",
+    "Component",
+    "ComponentNamespace",
+    "NoSSRComponent",
+}
+
+
+def get_inherited_fields(
+    module: Dict[str, Any],
+    class_name: str,
+    module_cache: ModuleCache,
+    literal_aliases: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+    _resolving: Optional[Set[Tuple[str, str]]] = None,
+) -> Dict[str, Any]:
+    """Get the properties, styling props and events a class inherits.
+
+    Bases are walked depth-first from left to right and the first definition
+    of a name wins, like attribute lookup along the MRO.
+
+    Args:
+        module: The module the class is defined in, from `load_module`.
+        class_name: The name of the class.
+        module_cache: The cache used to load the modules of base classes.
+        literal_aliases: The table returned by `collect_literal_aliases` the
+            enum values of the props are taken from.
+
+    Returns:
+        A dictionary with the inherited "properties", "styling_props" and
+        "event_names" (each prop has an "inherited_from" key with the
+        qualified name of the class declaring it) and the "sources" set of
+        module paths the fields were resolved from. The result is shared,
+        callers must copy it before modifying it.
+    """
+    memo = module["inherited_fields"]
+    if class_name in memo:
+        return memo[class_name]
+
+    key = (module["path"], class_name)
+    if _resolving is None:
+        _resolving = set()
+    if key in _resolving:
+        # Cyclic inheritance, which Python would reject anyway
+        return {"properties": [], "styling_props": [], "event_names": [], "sources": set()}
+    _resolving.add(key)
+
+    fields = {"properties": [], "styling_props": [], "event_names": [], "sources": {module["path"]}}
+    seen_props: Set[str] = set()
+
+    for base in module["classes"][class_name]["bases"]:
+        with profile_phase("class_lookup"):
+            resolved = resolve_class(module, base, module_cache)
+        if resolved is None:
+            continue
+        base_module, base_name = resolved
+        if base_name in FRAMEWORK_BASE_CLASSES:
+            continue
+
+        # The fields declared by the base itself come before the ones it inherits
+        declared = get_class_fields(base_module, base_name, literal_aliases)
+        origin = f"{get_module_name(base_module)}.{base_name}"
+        for prop in declared["properties"] + declared["styling_props"]:
+            prop["inherited_from"] = origin
+        inherited = get_inherited_fields(base_module, base_name, module_cache, literal_aliases, _resolving)
+        fields["sources"] |= inherited["sources"]
+
+        for field in ("properties", "styling_props"):
+            for prop in declared[field] + inherited[field]:
+                if prop["name"] not in seen_props:
+                    seen_props.add(prop["name"])
+                    fields[field].append(prop)
+
+        for event_name in declared["event_names"] + inherited["event_names"]:
+            if event_name not in fields["event_names"]:
+                fields["event_names"].append(event_name)
+
+    _resolving.discard(key)
+    memo[class_name] = fields
+    return fields
+
+
+def add_inherited_fields(spec: Dict[str, Any], inherited: Dict[str, Any]) -> None:
+    """Add the fields a class inherits to its spec.
+
+    Props and events the class declares itself are not repeated.
+
+    Args:
+        spec: The specification dictionary to update.
+        inherited: The fields returned by `get_inherited_fields`.
+    """
+    own_props = {prop["name"] for prop in spec["properties"] + spec["styling_props"]}
+    for field in ("properties", "styling_props"):
+        spec[f"inherited_{field}"] = [
+            copy.deepcopy(prop) for prop in inherited[field] if prop["name"] not in own_props
+        ]
+    spec["inherited_event_names"] = [
+        event_name for event_name in inherited["event_names"] if event_name not in spec["event_names"]
+    ]
+
+
+def resolve_class(
+    module: Dict[str, Any],
+    expression: str,
+    module_cache: ModuleCache,
+) -> Optional[Tuple[Dict[str, Any], str]]:
+    """Resolve a base class expression to the module and name of the class.
+
+    Args:
+        module: The module the expression appears in.
+        expression: The base class expression, e.g. `elements.Button` or
+            `Generic[T]`.
+        module_cache: The cache used to load the modules.
+
+    Returns:
+        The module defining the class and its name, or None if the class
+        could not be found in the sources.
+    """
+    # Drop type arguments and ignore keywords like `metaclass=...`
+    expression = expression.split('[', 1)[0].strip()
+    if '=' in expression or not expression:
+        return None
+
+    first, *rest = expression.split('.')
+    target = lookup_name(module, first, module_cache)
+
+    for part in rest:
+        if target is None or target[1] is not None:
+            # Attributes of classes are not followed
+            return None
+        target = lookup_name(target[0], part, module_cache)
+
+    if target is None or target[1] is None:
+        return None
+    return target
+
+
+def lookup_name(
+    module: Dict[str, Any],
+    name: str,
+    module_cache: ModuleCache,
+    _depth: int = 0,
+) -> Optional[Tuple[Dict[str, Any], Optional[str]]]:
+    """Look up a name in the namespace of a module.
+
+    Args:
+        module: The module to look in.
+        name: The name to look up.
+        module_cache: The cache used to load the modules.
+
+    Returns:
+        A (module, class name) pair when the name is a class, a (module, None)
+        pair when the name is a module, or None if it cannot be resolved.
+    """
+    # Re-exports rarely chain more than a couple of times
+    if _depth > 20:
+        return None
+
+    if name in module["classes"]:
+        return module, name
+
+    imported = module["imports"].get(name)
+    if imported is None:
+        stub = load_stub(module, module_cache)
+        if stub is not None:
+            imported = stub["imports"].get(name)
+
+    if imported is not None:
+        target_name = resolve_import_module(module, imported)
+        if imported["name"] is None:
+            target_module = load_module_by_name(module, target_name, module_cache)
+            return (target_module, None) if target_module is not None else None
+
+        target_module = load_module_by_name(module, target_name, module_cache)
+        if target_module is not None:
+            found = lookup_name(target_module, imported["name"], module_cache, _depth + 1)
+            if found is not None:
+                return found
+        # `from package import submodule`
+        submodule = load_module_by_name(module, f"{target_name}.{imported['name']}", module_cache)
+        return (submodule, None) if submodule is not None else None
+
+    # Submodules of a package are reachable as attributes
+    if os.path.basename(module["path"]).startswith("__init__."):
+        submodule = load_module_by_name(module, f"{get_module_name(module)}.{name}", module_cache)
+        if submodule is not None:
+            return submodule, None
+
+    return None
+
+
+def resolve_import_module(module: Dict[str, Any], imported: Dict[str, Any]) -> str:
+    """Get the absolute name of the module an import refers to.
+
+    Args:
+        module: The module containing the import.
+        imported: The import entry from the module's import index.
+
+    Returns:
+        The absolute dotted module name.
+    """
+    if not imported["level"]:
+        return imported["module"]
+
+    package = get_module_name(module)
+    if not os.path.basename(module["path"]).startswith("__init__."):
+        package = package.rpartition('.')[0]
+    for _ in range(imported["level"] - 1):
+        package = package.rpartition('.')[0]
+
+    return f"{package}.{imported['module']}" if imported["module"] else package
+
+
+def get_module_name(module: Dict[str, Any]) -> str:
+    """Get the dotted name of a loaded module.
+
+    The name is derived from the file path by walking up the package
+    directories (the ones with an `__init__.py`).
+
+    Args:
+        module: The module from `load_module`.
+
+    Returns:
+        The dotted module name.
+    """
+    if "name" not in module:
+        root, parts = split_module_path(module["path"])
+        module["name"] = '.'.join(parts)
+        module["root"] = root
+    return module["name"]
+
+
+def split_module_path(file_path: str) -> Tuple[str, List[str]]:
+    """Split a module file path into its import root and dotted name parts.
+
+    Args:
+        file_path: The path of the module file.
+
+    Returns:
+        The directory the top-level package lives in, and the parts of the
+        module name.
+    """
+    directory, filename = os.path.split(file_path)
+    stem = filename.split('.', 1)[0]
+    parts = [] if stem == "__init__" else [stem]
+
+    while os.path.exists(os.path.join(directory, "__init__.py")):
+        directory, package = os.path.split(directory)
+        parts.insert(0, package)
+
+    return directory, parts
+
+
+def load_module_by_name(
+    module: Dict[str, Any],
+    module_name: str,
+    module_cache: ModuleCache,
+) -> Optional[Dict[str, Any]]:
+    """Load a module of the same source tree as another module.
+
+    Args:
+        module: A module of the source tree, used to find its root.
+        module_name: The dotted name of the module to load.
+        module_cache: The cache used to load the module.
+
+    Returns:
+        The loaded module, or None if it is not part of the source tree.
+    """
+    get_module_name(module)
+    base_path = os.path.join(module["root"], *module_name.split('.'))
+
+    for candidate in (f"{base_path}.py", os.path.join(base_path, "__init__.py")):
+        if os.path.isfile(candidate):
+            try:
+                return load_module(candidate, module_cache)
+            except (OSError, SyntaxError, UnicodeDecodeError):
+                return None
+
+    return None
+
+
+def load_stub(module: Dict[str, Any], module_cache: ModuleCache) -> Optional[Dict[str, Any]]:
+    """Load the `.pyi` stub next to a module, if there is one.
+
+    Lazily loaded packages only declare their exports in their stubs.
+
+    Args:
+        module: The module to load the stub of.
+        module_cache: The cache used to load the stub.
+
+    Returns:
+        The loaded stub, or None if the module has none.
+    """
+    if not module["path"].endswith(".py"):
+        return None
+    stub_path = module["path"] + "i"
+    if not os.path.isfile(stub_path):
+        return None
+    try:
+        return load_module(stub_path, module_cache)
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
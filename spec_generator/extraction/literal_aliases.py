@@ -0,0 +1,364 @@
+"""
+Table of the `Literal` type aliases of the component modules.
+
+Props are often annotated with module-level aliases like
+`LiteralRadius = Literal["none", "small", "medium", "large", "full"]`. The
+aliases of every module under `reflex/components` are collected in a single
+pass, and the table maps each alias name to its values in the module that
+defines it, so the values of a prop are a dictionary lookup per name of its
+annotation.
+
+Some names are defined differently by several modules (`LiteralPosition`),
+so the lookup resolves a name in the module of the annotation: its own
+definition, then the module it imports the name from. The aliases found in
+each file are cached on disk with the file's hash, so only changed files are
+parsed again.
+"""
+import os
+import re
+import ast
+import json
+import hashlib
+from typing import Dict, Any, List, Optional, Set
+
+LITERAL_ALIASES_FILENAME = ".literal_aliases.json"
+
+# Identifiers of an annotation, like `Var`, `Responsive` and `LiteralRadius`
+_IDENTIFIER = re.compile(r'[A-Za-z_]\w*')
+
+
+def get_components_dir(base_dir: str) -> str:
+    """Get the directory of the component modules of the Reflex codebase.
+
+    Args:
+        base_dir: Base directory of the Reflex codebase
+
+    Returns:
+        The path of the components package
+    """
+    return f"{base_dir}/reflex/reflex/components"
+
+
+def get_literal_aliases_path(specs_dir: str) -> str:
+    """Get the path of the literal alias cache of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        The path to the cache file
+    """
+    return os.path.join(specs_dir, LITERAL_ALIASES_FILENAME)
+
+
+def collect_literal_aliases(
+    components_dir: str,
+    cache_path: Optional[str] = None,
+) -> Dict[str, Dict[str, List[Any]]]:
+    """Collect the `Literal` type aliases of every component module.
+
+    Args:
+        components_dir: The directory of the component modules
+        cache_path: Optional path of the on-disk cache of the scanned files
+
+    Returns:
+        A dictionary of alias names to the dotted names of the modules
+        defining them, to the values of the alias in that module
+    """
+    from spec_generator import __version__
+    from spec_generator.output.manifest import hash_source_file
+    from spec_generator.extraction.inheritance import split_module_path
+
+    cached = load_literal_aliases_cache(cache_path) if cache_path else {}
+    if cached.get("generator_version") != __version__:
+        cached = {}
+    cached_files = cached.get("files", {})
+
+    files: Dict[str, Dict[str, Any]] = {}
+    changed = False
+    for root, dirs, filenames in os.walk(components_dir):
+        dirs.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith('.py'):
+                continue
+            file_path = os.path.join(root, filename)
+            digest = hash_source_file(file_path)
+            entry = cached_files.get(file_path)
+            if entry is None or entry["hash"] != digest:
+                _, parts = split_module_path(file_path)
+                module_name = '.'.join(parts)
+                aliases = scan_literal_aliases(file_path)
+                for items in aliases.values():
+                    for item in items:
+                        if "ref" in item:
+                            _absolute_reference(item, module_name, filename == "__init__.py")
+                entry = {"hash": digest, "module": module_name, "aliases": aliases}
+                changed = True
+            files[file_path] = entry
+
+    if cache_path and (changed or set(files) != set(cached_files)):
+        save_literal_aliases_cache(cache_path, {"generator_version": __version__, "files": files})
+
+    definitions = {
+        entry["module"]: entry["aliases"] for entry in files.values() if entry["aliases"]
+    }
+    aliases: Dict[str, Dict[str, List[Any]]] = {}
+    for module_name, module_aliases in definitions.items():
+        for name in module_aliases:
+            values = _resolve_alias(definitions, module_name, name, set())
+            if values is not None:
+                aliases.setdefault(name, {})[module_name] = values
+
+    return {name: dict(sorted(modules.items())) for name, modules in sorted(aliases.items())}
+
+
+def scan_literal_aliases(file_path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Find the module-level `Literal` type aliases of a source file.
+
+    Args:
+        file_path: The path of the module file
+
+    Returns:
+        A dictionary of alias names to their items: a literal "value", or a
+        "ref" to another alias with the "module" it is imported from, as
+        written, and the relative import "level" (None and 0 for the module
+        itself)
+    """
+    try:
+        with open(file_path, 'r') as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return {}
+
+    # Most modules do not define any alias, skip parsing them
+    if "Literal[" not in content:
+        return {}
+
+    try:
+        tree = ast.parse(content, filename=file_path)
+    except SyntaxError:
+        return {}
+
+    from spec_generator.extraction.module_index import index_imports
+    imports = index_imports(tree)
+
+    aliases = {}
+    for stmt in tree.body:
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+            name, value = stmt.targets[0].id, stmt.value
+        elif isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name) and stmt.value is not None:
+            name, value = stmt.target.id, stmt.value
+        else:
+            continue
+
+        items = _literal_items(value, imports)
+        if items is not None:
+            aliases[name] = items
+
+    # Plain aliases of other aliases, like `LiteralSize = LiteralButtonSize`
+    for stmt in tree.body:
+        if (
+            isinstance(stmt, ast.Assign)
+            and len(stmt.targets) == 1
+            and isinstance(stmt.targets[0], ast.Name)
+            and isinstance(stmt.value, ast.Name)
+            and (stmt.value.id in aliases or stmt.value.id in imports)
+            and stmt.targets[0].id not in aliases
+        ):
+            aliases[stmt.targets[0].id] = [_reference(stmt.value.id, imports)]
+
+    return aliases
+
+
+def resolve_literal_values(
+    type_annotation: str,
+    aliases: Dict[str, Dict[str, List[Any]]],
+    module: Optional[Dict[str, Any]] = None,
+) -> Optional[List[Any]]:
+    """Get the values of the `Literal` aliases named in an annotation.
+
+    Args:
+        type_annotation: The type annotation text, like `Var[LiteralRadius]`
+        aliases: The table returned by `collect_literal_aliases`
+        module: The module from `load_module` the annotation appears in, used
+            to pick the definition of names defined by several modules
+
+    Returns:
+        The values of the aliases in the annotation, in order, or None if it
+        does not name any known alias
+    """
+    values = None
+    for name in _IDENTIFIER.findall(type_annotation):
+        definitions = aliases.get(name)
+        if not definitions:
+            continue
+        alias_values = _pick_definition(definitions, name, module)
+        if alias_values is None:
+            continue
+        if values is None:
+            values = []
+        values.extend(value for value in alias_values if value not in values)
+    return values
+
+
+def get_type_mappings(aliases: Dict[str, Dict[str, List[Any]]]) -> Dict[str, Dict[str, Any]]:
+    """Build the `type_mappings` of `common_props.json` from an alias table.
+
+    Args:
+        aliases: The table returned by `collect_literal_aliases`
+
+    Returns:
+        A dictionary of alias names to their "values". Names with different
+        values in several modules are qualified with the module name.
+    """
+    type_mappings = {}
+    for name, definitions in aliases.items():
+        distinct = {tuple(values) for values in definitions.values()}
+        if len(distinct) == 1:
+            type_mappings[name] = {"values": list(next(iter(definitions.values())))}
+        else:
+            for module_name, values in definitions.items():
+                type_mappings[f"{module_name}.{name}"] = {"values": list(values)}
+    return type_mappings
+
+
+def get_literal_aliases_digest(aliases: Dict[str, Dict[str, List[Any]]]) -> str:
+    """Get a hash of an alias table, to tell when specs need new values.
+
+    Args:
+        aliases: The table returned by `collect_literal_aliases`
+
+    Returns:
+        The SHA-256 hex digest of the table
+    """
+    return hashlib.sha256(json.dumps(aliases, sort_keys=True).encode()).hexdigest()
+
+
+def load_literal_aliases_cache(cache_path: str) -> Dict[str, Any]:
+    """Load the scanned files cached by a previous run.
+
+    Args:
+        cache_path: The path of the cache file
+
+    Returns:
+        The cache with its generator version and the hash, module name and
+        aliases of each file, empty if there is no readable cache
+    """
+    if not os.path.exists(cache_path):
+        return {}
+
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable literal alias cache {cache_path}: {e}")
+        return {}
+
+
+def save_literal_aliases_cache(cache_path: str, cached: Dict[str, Any]) -> str:
+    """Save the scanned files for the next run.
+
+    Args:
+        cache_path: The path of the cache file
+        cached: The generator version and the hash, module name and aliases
+            of each file
+
+    Returns:
+        The path to the saved cache file
+    """
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    with open(cache_path, 'w') as f:
+        json.dump(cached, f, indent=2)
+    return cache_path
+
+
+def _literal_items(value: ast.expr, imports: Dict[str, Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """Get the items of a `Literal[...]` expression, or None if it is not one."""
+    if not isinstance(value, ast.Subscript):
+        return None
+    subscripted = value.value
+    if not (
+        (isinstance(subscripted, ast.Name) and subscripted.id == "Literal")
+        or (isinstance(subscripted, ast.Attribute) and subscripted.attr == "Literal")
+    ):
+        return None
+
+    elements = value.slice.elts if isinstance(value.slice, ast.Tuple) else [value.slice]
+    items = []
+    for element in elements:
+        if isinstance(element, ast.Constant):
+            items.append({"value": element.value})
+        elif isinstance(element, ast.Name):
+            # Literals can nest other literal aliases
+            items.append(_reference(element.id, imports))
+        else:
+            return None
+    return items
+
+
+def _reference(name: str, imports: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the item referring to another alias, local or imported."""
+    imported = imports.get(name)
+    if imported and imported["name"]:
+        return {"ref": imported["name"], "module": imported["module"], "level": imported["level"]}
+    return {"ref": name, "module": None, "level": 0}
+
+
+def _resolve_alias(
+    definitions: Dict[str, Dict[str, List[Dict[str, Any]]]],
+    module_name: str,
+    name: str,
+    seen: Set[Any],
+) -> Optional[List[Any]]:
+    """Get the values of an alias, following references to other aliases."""
+    items = definitions.get(module_name, {}).get(name)
+    if items is None or (module_name, name) in seen:
+        return None
+    seen.add((module_name, name))
+
+    values = []
+    for item in items:
+        if "value" in item:
+            values.append(item["value"])
+            continue
+        resolved = _resolve_alias(definitions, item["module"] or module_name, item["ref"], seen)
+        if resolved is None:
+            return None
+        values.extend(resolved)
+    return values
+
+
+def _absolute_reference(item: Dict[str, Any], module_name: str, is_package: bool) -> None:
+    """Replace the relative module of a reference with the absolute one."""
+    level = item.pop("level")
+    if not level or item["module"] is None:
+        return
+    package = module_name if is_package else module_name.rpartition('.')[0]
+    for _ in range(level - 1):
+        package = package.rpartition('.')[0]
+    item["module"] = f"{package}.{item['module']}" if item["module"] else package
+
+
+def _pick_definition(
+    definitions: Dict[str, List[Any]],
+    name: str,
+    module: Optional[Dict[str, Any]],
+) -> Optional[List[Any]]:
+    """Pick the definition of an alias that applies in a module."""
+    if module is not None:
+        from spec_generator.extraction.inheritance import get_module_name, resolve_import_module
+
+        module_name = get_module_name(module)
+        if module_name in definitions:
+            return definitions[module_name]
+        imported = module["imports"].get(name)
+        if imported and imported["name"] == name:
+            imported_module = resolve_import_module(module, imported)
+            if imported_module in definitions:
+                return definitions[imported_module]
+
+    # Without a definition in scope, only an unambiguous name is resolved
+    distinct = {tuple(values) for values in definitions.values()}
+    if len(distinct) == 1:
+        return next(iter(definitions.values()))
+    return None
@@ -0,0 +1,83 @@
+"""
+Per-run cache of parsed component modules.
+
+Many components map to the same source file (the recharts modules, the
+stack layouts, the react player...). The cache makes sure each file is read,
+parsed and its classes extracted only once per generation run.
+"""
+import copy
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from spec_generator.extraction.module_index import index_module
+from spec_generator.extraction.properties import extract_properties_from_class_info
+from spec_generator.utils.profiling import profile_phase
+
+ModuleCache = Dict[str, Dict[str, Any]]
+
+
+def load_module(file_path: str, module_cache: Optional[ModuleCache] = None) -> Dict[str, Any]:
+    """Read and parse a module, reusing the cached result if there is one.
+
+    Args:
+        file_path: The path of the module file.
+        module_cache: The cache to use, keyed by resolved path. When None the
+            module is parsed without caching.
+
+    Returns:
+        A dictionary with the module path, text, class and import indexes,
+        and caches of the fields extracted from and inherited by each class.
+    """
+    key = str(Path(file_path).resolve())
+    if module_cache is not None and key in module_cache:
+        return module_cache[key]
+
+    with profile_phase("file_read"):
+        with open(file_path, 'r') as f:
+            content = f.read()
+
+    with profile_phase("parse"):
+        index = index_module(content)
+    module = {
+        "path": key,
+        "content": content,
+        "classes": index["classes"],
+        "imports": index["imports"],
+        "class_fields": {},
+        "inherited_fields": {},
+    }
+
+    if module_cache is not None:
+        module_cache[key] = module
+
+    return module
+
+
+def get_class_fields(
+    module: Dict[str, Any],
+    class_name: str,
+    literal_aliases: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+) -> Dict[str, Any]:
+    """Get the properties, styling props and events declared by a class.
+
+    The fields are extracted on first use and kept on the module, so callers
+    get a deep copy they are free to modify. Modules are cached for a single
+    run, which has a single alias table.
+
+    Args:
+        module: The module returned by `load_module`.
+        class_name: The name of a class indexed in the module.
+        literal_aliases: The table returned by `collect_literal_aliases` the
+            enum values of the props are taken from.
+
+    Returns:
+        A dictionary with the "properties", "styling_props" and "event_names"
+        lists of the class.
+    """
+    fields = module["class_fields"].get(class_name)
+    if fields is None:
+        fields = {"properties": [], "event_names": [], "styling_props": []}
+        with profile_phase("property_extraction"):
+            extract_properties_from_class_info(module["classes"][class_name], fields, module, literal_aliases)
+        module["class_fields"][class_name] = fields
+    return copy.deepcopy(fields)
@@ -0,0 +1,285 @@
+"""
+Single-pass AST index of the classes defined in a component module.
+
+The module is parsed once with ``ast`` and every class definition is visited
+exactly once, recording everything the spec extraction needs (bases,
+docstring, class attributes with their descriptions and namespace members).
+"""
+import ast
+from typing import Dict, Any, List, Optional
+
+
+def parse_module(content: str) -> Dict[str, Dict[str, Any]]:
+    """Parse a module and index the classes it defines.
+
+    Args:
+        content: The module source code.
+
+    Returns:
+        A dictionary of class names to class information, in source order.
+        When a name is defined more than once the first definition wins.
+    """
+    return index_module(content)["classes"]
+
+
+def index_module(content: str) -> Dict[str, Any]:
+    """Parse a module and index its classes and module-level imports.
+
+    Args:
+        content: The module source code.
+
+    Returns:
+        A dictionary with the "classes" index (see `parse_module`) and the
+        "imports" index (see `index_imports`).
+    """
+    content = content.replace('\r\n', '\n')
+    lines = content.split('\n')
+    tree = ast.parse(content)
+
+    classes: Dict[str, Dict[str, Any]] = {}
+
+    # Pre-order walk so that classes are indexed in source order
+    stack: List[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.ClassDef) and node.name not in classes:
+            classes[node.name] = index_class(node, lines)
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+    return {"classes": classes, "imports": index_imports(tree)}
+
+
+def index_imports(tree: ast.Module) -> Dict[str, Dict[str, Any]]:
+    """Index the names bound by the module-level imports of a module.
+
+    Imports nested in module-level `if` and `try` blocks (such as
+    `if TYPE_CHECKING:`) are included.
+
+    Args:
+        tree: The parsed module.
+
+    Returns:
+        A dictionary of bound names to the imported "module" (as written,
+        without the leading dots), the imported "name" (None for
+        `import x.y` statements) and the relative import "level".
+    """
+    imports: Dict[str, Dict[str, Any]] = {}
+
+    statements = list(tree.body)
+    while statements:
+        stmt = statements.pop(0)
+        if isinstance(stmt, ast.If):
+            statements[:0] = stmt.body + stmt.orelse
+        elif isinstance(stmt, ast.Try):
+            statements[:0] = stmt.body + stmt.orelse + stmt.finalbody
+        elif isinstance(stmt, ast.Import):
+            for alias in stmt.names:
+                if alias.asname:
+                    imports[alias.asname] = {"module": alias.name, "name": None, "level": 0}
+                else:
+                    # `import a.b` binds `a`
+                    top = alias.name.split('.')[0]
+                    imports[top] = {"module": top, "name": None, "level": 0}
+        elif isinstance(stmt, ast.ImportFrom):
+            for alias in stmt.names:
+                if alias.name == '*':
+                    continue
+                imports[alias.asname or alias.name] = {
+                    "module": stmt.module or "",
+                    "name": alias.name,
+                    "level": stmt.level,
+                }
+
+    return imports
+
+
+def index_class(node: ast.ClassDef, lines: List[str]) -> Dict[str, Any]:
+    """Collect the information needed for a spec from a class definition.
+
+    Args:
+        node: The class definition node.
+        lines: The module source split into lines.
+
+    Returns:
+        A dictionary with the class name, bases, docstring, attributes,
+        namespace members and whether the class defines ``create``.
+    """
+    bases = [source_segment(lines, base) for base in node.bases]
+    bases.extend(source_segment(lines, keyword) for keyword in node.keywords)
+
+    docstring = ""
+    body = node.body
+    if body and _is_string_statement(body[0]):
+        docstring = string_literal_text(lines, body[0].value)
+
+    attributes = []
+    members = []
+    has_create = False
+
+    for i, stmt in enumerate(body):
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if stmt.name == "create" and any(
+                isinstance(d, ast.Name) and d.id == "classmethod" for d in stmt.decorator_list
+            ):
+                has_create = True
+            continue
+
+        if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
+            names = [stmt.target.id]
+            type_annotation = source_segment(lines, stmt.annotation)
+            value = None
+        elif isinstance(stmt, ast.Assign):
+            # Chained assignments like `root = __call__ = ...` declare every name
+            names = [target.id for target in stmt.targets if isinstance(target, ast.Name)]
+            type_annotation = None
+            value = source_segment(lines, stmt.value)
+
+            # Namespace members look like `root = staticmethod(AccordionRoot.create)`
+            # or `root = Upload.create`
+            member = _staticmethod_create_target(stmt.value)
+            if member:
+                members.append(member)
+        else:
+            continue
+
+        next_stmt = body[i + 1] if i + 1 < len(body) else None
+        description = attribute_description(lines, stmt, next_stmt)
+        for name in names:
+            attributes.append({
+                "name": name,
+                "type": type_annotation,
+                "value": value,
+                "description": description,
+            })
+
+    return {
+        "name": node.name,
+        "bases": bases,
+        "docstring": docstring,
+        "attributes": attributes,
+        "members": members,
+        "has_create": has_create,
+    }
+
+
+def find_component_class(classes: Dict[str, Dict[str, Any]], module_name: str) -> Optional[Dict[str, Any]]:
+    """Find the class that defines a component in an indexed module.
+
+    Args:
+        classes: The class index returned by `parse_module`.
+        module_name: The last part of the component module path.
+
+    Returns:
+        The class information, or None if no suitable class was found.
+    """
+    # Check for both the exact module name and a capitalized version
+    class_names_to_try = [
+        module_name,  # Original name
+        module_name.capitalize(),  # Capitalized (first letter only)
+        ''.join(word.capitalize() for word in module_name.split('_')),  # CamelCase
+        module_name.upper()  # ALL_CAPS
+    ]
+
+    for name in class_names_to_try:
+        if name in classes:
+            print(f"  Found class {name}")
+            return classes[name]
+
+    # If still not found, look for any class with a create method
+    for class_info in classes.values():
+        if class_info["has_create"]:
+            print(f"  Found class {class_info['name']} with create method")
+            return class_info
+
+    return None
+
+
+def attribute_description(lines: List[str], stmt: ast.stmt, next_stmt: Optional[ast.stmt]) -> str:
+    """Get the description of a class attribute.
+
+    The description is the attribute docstring if there is one, otherwise the
+    comment at the end of the attribute line, otherwise the comment on the
+    line directly above it.
+
+    Args:
+        lines: The module source split into lines.
+        stmt: The attribute statement.
+        next_stmt: The statement following the attribute, if any.
+
+    Returns:
+        The description, or an empty string.
+    """
+    if next_stmt is not None and _is_string_statement(next_stmt):
+        return string_literal_text(lines, next_stmt.value)
+
+    trailing = lines[stmt.end_lineno - 1].encode()[stmt.end_col_offset:].decode()
+    if '#' in trailing:
+        return trailing.split('#', 1)[1].strip()
+
+    if stmt.lineno >= 2:
+        previous = lines[stmt.lineno - 2].strip()
+        if previous.startswith('#'):
+            return previous[1:].strip()
+
+    return ""
+
+
+def string_literal_text(lines: List[str], node: ast.Constant) -> str:
+    """Get the text of a triple-quoted string literal as written in the source.
+
+    Args:
+        lines: The module source split into lines.
+        node: The string constant node.
+
+    Returns:
+        The stripped literal text, without unescaping.
+    """
+    segment = source_segment(lines, node)
+    if len(segment) >= 6 and segment.startswith('"""') and segment.endswith('"""'):
+        return segment[3:-3].strip()
+    return node.value.strip()
+
+
+def source_segment(lines: List[str], node: ast.AST) -> str:
+    """Get the source text of a node.
+
+    Unlike `ast.get_source_segment`, this does not re-split the source on
+    every call.
+
+    Args:
+        lines: The module source split into lines.
+        node: The node to get the source of.
+
+    Returns:
+        The source text of the node.
+    """
+    # Column offsets are UTF-8 byte offsets
+    start, end = node.lineno - 1, node.end_lineno - 1
+    if start == end:
+        return lines[start].encode()[node.col_offset:node.end_col_offset].decode()
+    first = lines[start].encode()[node.col_offset:].decode()
+    last = lines[end].encode()[:node.end_col_offset].decode()
+    return '\n'.join([first, *lines[start + 1:end], last])
+
+
+def _is_string_statement(stmt: ast.stmt) -> bool:
+    """Check whether a statement is a bare string literal."""
+    return (
+        isinstance(stmt, ast.Expr)
+        and isinstance(stmt.value, ast.Constant)
+        and isinstance(stmt.value.value, str)
+    )
+
+
+def _staticmethod_create_target(value: ast.expr) -> Optional[str]:
+    """Get `X` from a `staticmethod(X.create)` or `X.create` expression, if it is one."""
+    if (
+        isinstance(value, ast.Call)
+        and isinstance(value.func, ast.Name)
+        and value.func.id == "staticmethod"
+        and len(value.args) == 1
+    ):
+        value = value.args[0]
+    if isinstance(value, ast.Attribute) and value.attr == "create" and isinstance(value.value, ast.Name):
+        return value.value.id
+    return None
@@ -1,34 +1,9 @@
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from spec_generator.extraction.literal_aliases import resolve_literal_values
 from spec_generator.utils import extract_enum_values_from_description
 
-# Enum type mappings for standardized property values
-TYPE_MAPPINGS = {
-    "LiteralRadius": {
-        "values": ["none", "small", "medium", "large", "full"]
-    },
-    "LiteralButtonSize": {
-        "values": ["1", "2", "3", "4"]
-    },
-    "LiteralVariant": {
-        "values": ["solid", "soft", "outline", "ghost"]
-    },
-    "LiteralAccentColor": {
-        "values": ["gray", "tomato", "red", "ruby", "crimson", "pink", "plum", "purple", "violet", "iris", "indigo", "blue", "cyan", "teal", "jade", "green", "grass", "brown", "orange", "sky", "mint", "lime", "yellow", "amber", "gold", "bronze"]
-    },
-    "LiteralAccordionType": {
-        "values": ["single", "multiple"]
-    },
-    "LiteralAccordionDir": {
-        "values": ["ltr", "rtl"]
-    },
-    "LiteralAccordionOrientation": {
-        "values": ["vertical", "horizontal"]
-    }
-}
-
-
 def should_skip_property(name: str) -> bool:
     """Check if a property should be skipped from extraction.
     
@@ -62,43 +37,11 @@ def extract_properties_from_class_body(class_body: str, spec: Dict[str, Any], cl
         spec: The specification dictionary to update with extracted properties
         class_prefix: Optional prefix for class names
     """
-    # Identify method definitions to avoid capturing their parameters as properties
+    # Everything from the first method definition onwards is method code,
+    # so only attributes declared before it are considered
     method_pattern = re.compile(r'(?:^|\n)\s*def\s+([\w_]+)\s*\(', re.MULTILINE)
-    method_sections = []
-    
-    # Find all method definitions and mark their sections
-    for method_match in re.finditer(method_pattern, class_body):
-        method_name = method_match.group(1)
-        method_start = method_match.start()
-        
-        # Find the end of the method by tracking indentation
-        lines = class_body[method_start:].split('\n')
-        method_end = method_start
-        method_indent = None
-        
-        for i, line in enumerate(lines):
-            if i == 0:
-                # First line defines the method, get its indentation level
-                method_indent = len(line) - len(line.lstrip())
-                continue
-                
-            line_stripped = line.lstrip()
-            if not line_stripped:  # Skip empty lines
-                continue
-                
-            current_indent = len(line) - len(line_stripped)
-            
-            # If we find a line with same or less indentation than the method definition,
-            # we've reached the end of the method
-            if current_indent <= method_indent:
-                method_end += len('\n'.join(lines[:i]))
-                break
-        
-        # If we didn't find the end, assume it goes to the end of the class
-        if method_end == method_start:
-            method_end = len(class_body)
-        
-        method_sections.append((method_start, method_end))
+    first_method = method_pattern.search(class_body)
+    methods_start = first_method.start() if first_method else len(class_body) + 1
     
     # First get class attributes with type annotations
     type_pattern = re.compile(r'(?:^|\n)\s*([\w]+)\s*:\s*([^=\n]+)(?:=|$|\n)', re.MULTILINE)
@@ -108,129 +51,199 @@ def extract_properties_from_class_body(class_body: str, spec: Dict[str, Any], cl
             continue
         
         # Skip if property is in a method section
-        if any(start <= match.start() <= end for start, end in method_sections):
+        if match.start() >= methods_start:
             continue
         
-        # Check if this is a property or an event handler
-        is_event = name.startswith('on_')
-        
         # Get the type annotation
         type_annotation = match.group(2).strip()
         
         # Extract docstring or comment
         docstring = extract_docstring_or_comment(class_body, match.end())
         
-        # Create simplified property data
-        property_data = {
-            "name": name,
-            "type": type_annotation,
-            "description": docstring
-        }
-        
-        # Fix property name for "as_" to "_as"
-        if name == "as_":
-            property_data["name"] = "_as"
-        
-        # Try to extract enum values from type or description
-        enum_type = None
-        
-        # Check if the type or a part of it matches a known enum type
-        for enum_type_name, enum_info in TYPE_MAPPINGS.items():
-            if enum_type_name in type_annotation:
-                enum_type = enum_type_name
-                # Add the enum values from our mapping
-                property_data["values"] = enum_info["values"]
-                break
-        
-        # If we didn't find a match in known types, try to extract from description
-        if "values" not in property_data:
-            enum_values = extract_enum_values_from_description(docstring)
-            if enum_values:
-                property_data["values"] = enum_values
-                
-                # Clean up the description to remove the enum format text
-                # Remove patterns like: "value1" | "value2" | "value3"
-                cleaned_desc = re.sub(r'(?::\s*)?"[^"]+"\s*(?:\|\s*"[^"]+")+', '', docstring).strip()
-                # Remove patterns like: "1" - "9"
-                cleaned_desc = re.sub(r'(?::\s*)?"[^"]+"\s*-\s*"[^"]+"', '', cleaned_desc).strip()
-                
-                # If we end up with trailing colon, remove it
-                if cleaned_desc.endswith(':'):
-                    cleaned_desc = cleaned_desc[:-1].strip()
-                
-                # Remove trailing pipe characters that might be left
-                cleaned_desc = re.sub(r'\|\s*$', '', cleaned_desc).strip()
-                
-                property_data["description"] = cleaned_desc
-        
-        # Add to the appropriate list, but for events just track the name
-        if is_event:
-            if "event_names" not in spec:
-                spec["event_names"] = []
-            if name not in spec["event_names"]:
-                spec["event_names"].append(name)
-        elif name in ["size", "variant", "color_scheme", "radius"] or name.endswith("_style"):
-            if "styling_props" not in spec:
-                spec["styling_props"] = []
-            spec["styling_props"].append(property_data)
-        else:
-            if "properties" not in spec:
-                spec["properties"] = []
-            spec["properties"].append(property_data)
+        add_property_to_spec(spec, name, build_typed_property(name, type_annotation, docstring))
     
     # Then get class attributes with assignments but no type annotations
     assign_pattern = re.compile(r'(?:^|\n)\s*([\w]+)\s*=\s*([^:\n]+)(?:$|\n)', re.MULTILINE)
     for match in re.finditer(assign_pattern, class_body):
         name = match.group(1)
-        if should_skip_property(name):
-            continue
-        
-        # Skip if already processed with type annotation
-        if "properties" in spec and any(p.get("name") == name for p in spec["properties"]):
-            continue
-        if "styling_props" in spec and any(p.get("name") == name for p in spec["styling_props"]):
+        if should_skip_property(name) or is_known_property(spec, name):
             continue
             
         # Skip if property is in a method section
-        if any(start <= match.start() <= end for start, end in method_sections):
+        if match.start() >= methods_start:
             continue
         
-        # Check if this is a property or an event handler
-        is_event = name.startswith('on_')
-        
         # Try to infer the type from the assignment
         value = match.group(2).strip()
-        inferred_type = infer_type_from_value(value)
         
         # Extract docstring or comment
         docstring = extract_docstring_or_comment(class_body, match.end())
         
-        # Create simplified property data
-        property_data = {
-            "name": name,
-            "type": inferred_type,
-            "description": docstring
-        }
+        add_property_to_spec(spec, name, build_assigned_property(name, value, docstring))
+
+
+def extract_properties_from_class_info(
+    class_info: Dict[str, Any],
+    spec: Dict[str, Any],
+    module: Optional[Dict[str, Any]] = None,
+    literal_aliases: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+) -> None:
+    """Extract properties from a class indexed by `module_index.parse_module`.
+    
+    Args:
+        class_info: The indexed class information
+        spec: The specification dictionary to update with extracted properties
+        module: The module from `load_module` defining the class, used to
+            resolve the `Literal` aliases of its annotations
+        literal_aliases: The table returned by `collect_literal_aliases` the
+            enum values of the props are taken from
+    """
+    attributes = [attr for attr in class_info["attributes"] if not should_skip_property(attr["name"])]
+    
+    # First get class attributes with type annotations
+    for attr in attributes:
+        if attr["type"] is not None:
+            property_data = build_typed_property(
+                attr["name"], attr["type"], attr["description"], module, literal_aliases
+            )
+            add_property_to_spec(spec, attr["name"], property_data)
+    
+    # Then get class attributes with assignments but no type annotations
+    for attr in attributes:
+        if attr["type"] is None and not is_known_property(spec, attr["name"]):
+            # Multi-line values are typed from their first line only
+            value = attr["value"].split('\n', 1)[0].strip()
+            if ':' in value:
+                continue
+            property_data = build_assigned_property(attr["name"], value, attr["description"])
+            add_property_to_spec(spec, attr["name"], property_data)
+
+
+def build_typed_property(
+    name: str,
+    type_annotation: str,
+    docstring: str,
+    module: Optional[Dict[str, Any]] = None,
+    literal_aliases: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+) -> Dict[str, Any]:
+    """Build the property data for an attribute with a type annotation.
+    
+    Args:
+        name: The attribute name
+        type_annotation: The type annotation text
+        docstring: The attribute docstring or comment
+        module: The module the attribute is declared in, if known
+        literal_aliases: The table returned by `collect_literal_aliases`, if
+            the enum values should be taken from the `Literal` aliases
         
-        # Try to extract enum values from description
+    Returns:
+        The property data
+    """
+    # Create simplified property data
+    property_data = {
+        "name": name,
+        "type": type_annotation,
+        "description": docstring
+    }
+    
+    # Fix property name for "as_" to "_as"
+    if name == "as_":
+        property_data["name"] = "_as"
+    
+    # Take the enum values from the Literal aliases named by the type
+    values = resolve_literal_values(type_annotation, literal_aliases or {}, module)
+    if values:
+        property_data["values"] = values
+    
+    # If we didn't find a match in known types, try to extract from description
+    if "values" not in property_data:
         enum_values = extract_enum_values_from_description(docstring)
         if enum_values:
             property_data["values"] = enum_values
+            
+            # Clean up the description to remove the enum format text
+            # Remove patterns like: "value1" | "value2" | "value3"
+            cleaned_desc = re.sub(r'(?::\s*)?"[^"]+"\s*(?:\|\s*"[^"]+")+', '', docstring).strip()
+            # Remove patterns like: "1" - "9"
+            cleaned_desc = re.sub(r'(?::\s*)?"[^"]+"\s*-\s*"[^"]+"', '', cleaned_desc).strip()
+            
+            # If we end up with trailing colon, remove it
+            if cleaned_desc.endswith(':'):
+                cleaned_desc = cleaned_desc[:-1].strip()
+            
+            # Remove trailing pipe characters that might be left
+            cleaned_desc = re.sub(r'\|\s*$', '', cleaned_desc).strip()
+            
+            property_data["description"] = cleaned_desc
+    
+    return property_data
+
+
+def build_assigned_property(name: str, value: str, docstring: str) -> Dict[str, Any]:
+    """Build the property data for an attribute with an assignment but no type annotation.
+    
+    Args:
+        name: The attribute name
+        value: The assigned value text
+        docstring: The attribute docstring or comment
+        
+    Returns:
+        The property data
+    """
+    # Create simplified property data
+    property_data = {
+        "name": name,
+        "type": infer_type_from_value(value),
+        "description": docstring
+    }
+    
+    # Try to extract enum values from description
+    enum_values = extract_enum_values_from_description(docstring)
+    if enum_values:
+        property_data["values"] = enum_values
+    
+    return property_data
+
+
+def is_known_property(spec: Dict[str, Any], name: str) -> bool:
+    """Check if a property was already added to a spec.
+    
+    Args:
+        spec: The specification dictionary
+        name: The property name
         
-        # Add to the appropriate list, but for events just track the name
-        if is_event:
-            if "event_names" not in spec:
-                spec["event_names"] = []
-            if name not in spec["event_names"]:
-                spec["event_names"].append(name)
-        elif name in ["size", "variant", "color_scheme", "radius"] or name.endswith("_style"):
-            if "styling_props" not in spec:
-                spec["styling_props"] = []
-            spec["styling_props"].append(property_data)
-        else:
-            if "properties" not in spec:
-                spec["properties"] = []
-            spec["properties"].append(property_data)
+    Returns:
+        True if the spec already has a property or styling prop with that name
+    """
+    if "properties" in spec and any(p.get("name") == name for p in spec["properties"]):
+        return True
+    if "styling_props" in spec and any(p.get("name") == name for p in spec["styling_props"]):
+        return True
+    return False
+
+
+def add_property_to_spec(spec: Dict[str, Any], name: str, property_data: Dict[str, Any]) -> None:
+    """Add a property to the appropriate list of a spec.
+    
+    Args:
+        spec: The specification dictionary
+        name: The attribute name the property was declared with
+        property_data: The property data
+    """
+    # Add to the appropriate list, but for events just track the name
+    if name.startswith('on_'):
+        if "event_names" not in spec:
+            spec["event_names"] = []
+        if name not in spec["event_names"]:
+            spec["event_names"].append(name)
+    elif name in ["size", "variant", "color_scheme", "radius"] or name.endswith("_style"):
+        if "styling_props" not in spec:
+            spec["styling_props"] = []
+        spec["styling_props"].append(property_data)
+    else:
+        if "properties" not in spec:
+            spec["properties"] = []
+        spec["properties"].append(property_data)
 
 
 def extract_docstring_or_comment(class_body: str, match_end: int) -> str:
@@ -0,0 +1,344 @@
+"""
+Runtime introspection of component classes.
+
+Some props only exist once the classes are created (fields added by
+metaclasses or `__init_subclass__` hooks), so they cannot be found in the
+source. This mode imports the component modules in a separate Python
+process and reads `get_fields()` and `get_event_triggers()` of every
+component class they define.
+
+All the modules of a run are introspected in a single batch, so `reflex` is
+imported once per run. The worker is a subprocess: an import that fails, or
+even crashes the interpreter, only costs the runtime fields of the affected
+modules, and the static extraction is used as is. Results are cached per
+module, keyed by the hashes of the source files of the classes' MROs.
+"""
+import os
+import re
+import sys
+import json
+import importlib
+import subprocess
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from spec_generator.extraction.inheritance import split_module_path
+
+RUNTIME_CACHE_FILENAME = ".runtime_cache.json"
+
+# Seconds the worker may take to import and introspect every module
+WORKER_TIMEOUT = 600
+
+
+def get_runtime_cache_path(specs_dir: str) -> str:
+    """Get the path of the runtime introspection cache of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        The path to the cache file
+    """
+    return os.path.join(specs_dir, RUNTIME_CACHE_FILENAME)
+
+
+def introspect_component_files(
+    file_paths: List[str],
+    cache_path: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Introspect the component classes defined in source files.
+
+    Args:
+        file_paths: The paths of the component source files
+        cache_path: Optional path of the on-disk cache of the results
+
+    Returns:
+        A dictionary of resolved file paths to the introspection result of
+        their module: the "classes" (see `introspect_class`) and the
+        "sources" the classes were created from. Modules that could not be
+        introspected are left out.
+    """
+    from spec_generator import __version__
+    from spec_generator.output.manifest import hash_source_file
+
+    modules: Dict[str, Dict[str, str]] = {}
+    for file_path in file_paths:
+        resolved = str(Path(file_path).resolve())
+        if resolved in modules or not os.path.isfile(resolved):
+            continue
+        root, parts = split_module_path(resolved)
+        if parts:
+            modules[resolved] = {"name": '.'.join(parts), "root": root}
+
+    cache = load_runtime_cache(cache_path) if cache_path else {}
+    file_hashes: Dict[str, Optional[str]] = {}
+    results: Dict[str, Dict[str, Any]] = {}
+    stale: Dict[str, Dict[str, str]] = {}
+
+    for resolved, module in modules.items():
+        entry = cache.get(module["name"])
+        if (
+            entry
+            and entry.get("generator_version") == __version__
+            and all(hash_source_file(path, file_hashes) == digest for path, digest in entry["sources"].items())
+        ):
+            results[resolved] = entry
+        else:
+            stale[resolved] = module
+
+    if stale:
+        roots = sorted({module["root"] for module in stale.values()})
+        names = [module["name"] for module in stale.values()]
+        print(f"Introspecting {len(names)} modules at runtime...")
+        introspected = run_introspection_worker(names, roots)
+        if not introspected:
+            # The worker failed as a whole and already said why
+            return results
+
+        for resolved, module in stale.items():
+            result = introspected.get(module["name"])
+            if result is None or "error" in result:
+                reason = result["error"] if result else "no result"
+                print(f"  Warning: Runtime introspection of {module['name']} failed: {reason}")
+                continue
+            sources = sorted(set(result["sources"]) | {resolved})
+            entry = {
+                "generator_version": __version__,
+                "classes": result["classes"],
+                "sources": {path: hash_source_file(path, file_hashes) for path in sources},
+            }
+            cache[module["name"]] = entry
+            results[resolved] = entry
+
+        if cache_path:
+            save_runtime_cache(cache_path, cache)
+
+    return results
+
+
+def run_introspection_worker(module_names: List[str], sys_paths: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Introspect modules in a separate Python process.
+
+    Args:
+        module_names: The dotted names of the modules to introspect
+        sys_paths: Directories to add to the import path of the worker
+
+    Returns:
+        A dictionary of module names to their introspection result, or to a
+        dictionary with an "error". Empty if the worker failed as a whole.
+    """
+    # The directory containing the spec_generator package
+    package_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([package_root, env.get("PYTHONPATH", "")]).rstrip(os.pathsep)
+
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-m", "spec_generator.extraction.runtime"],
+            input=json.dumps({"modules": module_names, "sys_path": sys_paths}),
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=WORKER_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"  Warning: Runtime introspection worker failed: {e}")
+        return {}
+
+    try:
+        # Modules may print while they are imported, the result is the last line
+        output = json.loads(completed.stdout.strip().rsplit('\n', 1)[-1])
+    except (ValueError, IndexError):
+        stderr = completed.stderr.strip().rsplit('\n', 1)[-1] if completed.stderr.strip() else ""
+        print(f"  Warning: Runtime introspection worker exited with code {completed.returncode}: {stderr}")
+        return {}
+
+    if "error" in output:
+        print(f"  Warning: Runtime introspection unavailable: {output['error']}")
+        return {}
+    return output["modules"]
+
+
+def introspect_modules(module_names: List[str]) -> Dict[str, Any]:
+    """Introspect the component classes of modules in this process.
+
+    This is what the worker process runs.
+
+    Args:
+        module_names: The dotted names of the modules to introspect
+
+    Returns:
+        A dictionary with the results of each module under "modules", or an
+        "error" if `reflex` itself cannot be imported
+    """
+    try:
+        from reflex.components.component import Component
+    except Exception as e:
+        return {"error": f"Cannot import reflex: {type(e).__name__}: {e}"}
+
+    modules = {}
+    for module_name in module_names:
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            modules[module_name] = {"error": f"{type(e).__name__}: {e}"}
+            continue
+
+        classes = {}
+        sources = set()
+        for name, obj in vars(module).items():
+            if not (isinstance(obj, type) and issubclass(obj, Component) and obj.__module__ == module_name):
+                continue
+            try:
+                classes[name] = introspect_class(obj)
+            except Exception as e:
+                classes[name] = {"error": f"{type(e).__name__}: {e}"}
+            for base in obj.__mro__:
+                source = getattr(sys.modules.get(base.__module__), "__file__", None)
+                if source:
+                    sources.add(str(Path(source).resolve()))
+
+        modules[module_name] = {"classes": classes, "sources": sorted(sources)}
+
+    return {"modules": modules}
+
+
+def introspect_class(cls: type) -> Dict[str, Any]:
+    """Read the props and event triggers of a component class.
+
+    Args:
+        cls: A subclass of `reflex.components.component.Component`
+
+    Returns:
+        A dictionary with the "properties" (name, type and whether the prop
+        is required) declared by the class or its bases, excluding the
+        fields of `Component` itself, and the "event_triggers" names
+    """
+    from reflex.event import EventHandler
+
+    fields = cls.get_fields()
+    props = []
+    event_fields = []
+
+    for name in sorted(cls.get_props()):
+        field = fields[name]
+        outer_type = getattr(field, "outer_type_", None)
+        if isinstance(outer_type, type) and issubclass(outer_type, EventHandler):
+            event_fields.append(name)
+            continue
+        props.append({
+            "name": name,
+            "type": format_type(getattr(field, "annotation", None) or outer_type),
+            "required": bool(getattr(field, "required", False)),
+        })
+
+    try:
+        # The triggers only depend on the fields, so an unvalidated instance is enough
+        event_triggers = list(cls.construct().get_event_triggers())
+    except Exception:
+        event_triggers = event_fields
+
+    return {"properties": props, "event_triggers": event_triggers}
+
+
+def format_type(annotation: Any) -> str:
+    """Format a type annotation without module prefixes.
+
+    Args:
+        annotation: The annotation of a field
+
+    Returns:
+        The annotation as written in the source, approximately
+    """
+    if isinstance(annotation, type):
+        return annotation.__name__
+    return re.sub(r"\b(?:[a-z_]\w*\.)+(?=[A-Za-z_])", "", str(annotation))
+
+
+def merge_runtime_fields(spec: Dict[str, Any], runtime_class: Optional[Dict[str, Any]]) -> None:
+    """Add the fields only found at runtime to a spec.
+
+    Props and events missing from the static extraction are added, marked
+    with `"runtime": true`, and props the runtime reports as required are
+    flagged with `"required": true`.
+
+    Args:
+        spec: The specification dictionary to update
+        runtime_class: The introspection result of the class, if any
+    """
+    if not runtime_class or "error" in runtime_class:
+        return
+
+    known = {}
+    for field in ("properties", "styling_props", "inherited_properties", "inherited_styling_props"):
+        for prop in spec.get(field, []):
+            known.setdefault(prop["name"], prop)
+
+    for runtime_prop in runtime_class["properties"]:
+        prop = known.get(runtime_prop["name"])
+        if prop is None:
+            prop = {
+                "name": runtime_prop["name"],
+                "type": runtime_prop["type"],
+                "description": "",
+                "runtime": True,
+            }
+            spec["properties"].append(prop)
+        if runtime_prop["required"]:
+            prop["required"] = True
+
+    known_events = set(spec["event_names"]) | set(spec.get("inherited_event_names", []))
+    for event_name in runtime_class["event_triggers"]:
+        if event_name not in known_events:
+            spec["event_names"].append(event_name)
+
+
+def load_runtime_cache(cache_path: str) -> Dict[str, Dict[str, Any]]:
+    """Load the introspection results cached by a previous run.
+
+    Args:
+        cache_path: The path of the cache file
+
+    Returns:
+        A dictionary of module names to cached results, empty if there is no
+        readable cache
+    """
+    if not os.path.exists(cache_path):
+        return {}
+
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f).get("modules", {})
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable runtime cache {cache_path}: {e}")
+        return {}
+
+
+def save_runtime_cache(cache_path: str, modules: Dict[str, Dict[str, Any]]) -> str:
+    """Save the introspection results for the next run.
+
+    Args:
+        cache_path: The path of the cache file
+        modules: A dictionary of module names to results
+
+    Returns:
+        The path to the saved cache file
+    """
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    with open(cache_path, 'w') as f:
+        json.dump({"modules": dict(sorted(modules.items()))}, f, indent=2)
+    return cache_path
+
+
+def _worker_main() -> None:
+    """Read a batch of modules from stdin and write their introspection to stdout."""
+    request = json.loads(sys.stdin.read())
+    for path in reversed(request.get("sys_path", [])):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    result = introspect_modules(request["modules"])
+    sys.stdout.write("\n" + json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    _worker_main()
@@ -1,16 +1,13 @@
 """Mapping modules for component path discovery."""
 
 __all__ = [
-    "extract_component_mappings",
-    "get_base_mappings",
-    "get_specialized_mappings",
+    "build_component_index",
+    "get_component_index_path",
     "get_ag_grid_mappings",
-    "get_radix_mappings",
-    "get_core_mappings",
+    "get_current_component_name",
+    "LEGACY_COMPONENT_NAMES",
 ]
 
-from .base import extract_component_mappings, get_base_mappings
-from .specialized import get_specialized_mappings
+from .index import build_component_index, get_component_index_path
 from .ag_grid import get_ag_grid_mappings
-from .radix import get_radix_mappings
-from .core import get_core_mappings
+from .legacy import LEGACY_COMPONENT_NAMES, get_current_component_name
@@ -4,6 +4,9 @@ from typing import Dict, Any
 def get_ag_grid_mappings(base_dir: str) -> Dict[str, Dict[str, str]]:
     """Get mappings for AG Grid components.
     
+    AG Grid is not exported by the `reflex` package, so the component index
+    does not find it.
+    
     Args:
         base_dir: Base directory of the Reflex codebase
         
@@ -0,0 +1,538 @@
+"""
+Index of the components exposed by the Reflex package.
+
+The names users write (`rx.button`, `rx.recharts.area_chart`) are declared
+by the lazy-loader maps of `reflex/__init__.py` (`_MAPPING` and the
+`RADIX_THEMES_MAPPING`-style maps it is built from) and, for the namespace
+packages such as `rx.el` and `rx.recharts`, by the re-exports of their
+`__init__.pyi` stubs. Every name is resolved statically to the component
+class it creates, following `X.create`, namespace instances, aliases and
+imports, so the extraction reads the right class of the right file.
+
+Names that do not create a component (event helpers, vars, classes) are left
+out. The index is cached on disk together with the hashes of every file it
+was built from, so discovery is a dictionary load until one of them changes.
+"""
+import os
+import ast
+import json
+from typing import Dict, Any, List, Optional, Tuple
+
+COMPONENT_INDEX_FILENAME = ".component_index.json"
+
+# Base classes every component class or component namespace derives from
+COMPONENT_ROOTS = {"Component", "ComponentNamespace"}
+
+# Base classes of namespaces only grouping component factories, like
+# `rx.segmented_control`, which count when one of their members creates a component
+NAMESPACE_ROOTS = {"SimpleNamespace"}
+
+# How many aliases, imports or base classes are followed to resolve a name
+MAX_RESOLVE_DEPTH = 20
+
+
+def get_component_index_path(specs_dir: str) -> str:
+    """Get the path of the component index cache of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        The path to the component index cache file
+    """
+    return os.path.join(specs_dir, COMPONENT_INDEX_FILENAME)
+
+
+def build_component_index(base_dir: str, cache_path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Map each component exposed by the Reflex package to its class.
+
+    Args:
+        base_dir: Base directory of the Reflex codebase
+        cache_path: Optional path of the on-disk cache of the index
+
+    Returns:
+        A dictionary of component names to their module path, file path and
+        class name. Members of namespace packages are named after the
+        namespace, like `recharts.area_chart`. The class name is None for
+        factory functions, whose class is found from the module name.
+    """
+    from spec_generator import __version__
+    from spec_generator.output.manifest import hash_source_file
+
+    if cache_path:
+        cached = load_component_index_cache(cache_path)
+        file_hashes: Dict[str, Optional[str]] = {}
+        if (
+            cached
+            and cached.get("generator_version") == __version__
+            and cached.get("base_dir") == base_dir
+            and all(hash_source_file(path, file_hashes) == digest for path, digest in cached["sources"].items())
+        ):
+            return cached["components"]
+
+    resolver = ComponentResolver(f"{base_dir}/reflex/reflex")
+    components: Dict[str, Dict[str, Any]] = {}
+    exported = set()
+
+    init_file = resolver.module_file("")
+    if init_file:
+        resolver.sources.add(init_file)
+    mapping = read_lazy_loader_map(init_file, "_MAPPING") if init_file else None
+    if mapping is None:
+        print(f"Warning: Could not read the lazy-loader maps of {base_dir}/reflex/reflex/__init__.py")
+        return components
+
+    for name, (module_path, attribute) in _exported_names(mapping).items():
+        if not module_path.startswith("components.") or name != name.lower():
+            continue
+        entry = resolver.resolve(module_path, attribute)
+        if entry:
+            components[name] = entry
+            exported.add((module_path, attribute))
+
+    # Namespace packages exposed as a whole, like `rx.el` and `rx.recharts`
+    for package in mapping.get("components", []):
+        for name, (module_path, attribute) in read_package_exports(resolver, f"components.{package}").items():
+            if (module_path, attribute) in exported or name != name.lower():
+                continue
+            entry = resolver.resolve(module_path, attribute)
+            if entry:
+                components[f"{package}.{name}"] = entry
+                exported.add((module_path, attribute))
+
+    components = dict(sorted(components.items()))
+    if cache_path:
+        sources = {path: hash_source_file(path) for path in sorted(resolver.sources)}
+        save_component_index_cache(cache_path, {
+            "generator_version": __version__,
+            "base_dir": base_dir,
+            "components": components,
+            "sources": sources,
+        })
+
+    return components
+
+
+def read_lazy_loader_map(init_file: str, variable: str) -> Optional[Dict[str, List[Any]]]:
+    """Read a lazy-loader map of a package `__init__` file.
+
+    The maps are built from literals, comprehensions and other maps of the
+    same file, so only the assignments of names ending in `_MAPPING` or
+    `_SUBMOD_ATTRS` are evaluated, without builtins or imports.
+
+    Args:
+        init_file: The path of the `__init__.py` file
+        variable: The name of the map to read
+
+    Returns:
+        The map of module paths to the names they export, or None if the
+        file does not define it
+    """
+    with open(init_file, 'r') as f:
+        tree = ast.parse(f.read(), filename=init_file)
+
+    body = []
+    for stmt in tree.body:
+        if isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+            targets = [stmt.target]
+        elif isinstance(stmt, ast.Assign):
+            targets = stmt.targets
+        else:
+            continue
+        names = [t.id for t in targets if isinstance(t, ast.Name)]
+        if names and all(n.endswith(("_MAPPING", "_SUBMOD_ATTRS")) for n in names):
+            assign = ast.Assign(targets=[ast.Name(id=n, ctx=ast.Store()) for n in names], value=stmt.value)
+            body.append(ast.copy_location(assign, stmt))
+
+    namespace: Dict[str, Any] = {"__builtins__": {}}
+    try:
+        exec(compile(ast.fix_missing_locations(ast.Module(body=body, type_ignores=[])), init_file, 'exec'), namespace)
+    except Exception as e:
+        print(f"Warning: Could not evaluate the lazy-loader maps of {init_file}: {e}")
+        return None
+    return namespace.get(variable)
+
+
+def read_package_exports(resolver: "ComponentResolver", package_path: str) -> Dict[str, Tuple[str, str]]:
+    """Get the names a namespace package re-exports from its modules.
+
+    The `__init__.pyi` stub is read if there is one, otherwise the
+    `_SUBMOD_ATTRS` lazy-loader map of the `__init__.py` file.
+
+    Args:
+        resolver: The resolver recording the files read
+        package_path: The dotted path of the package, relative to `reflex`
+
+    Returns:
+        A dictionary of the exported names to their module path and the
+        name of the module attribute
+    """
+    init_file = resolver.module_file(package_path)
+    if not init_file or not init_file.endswith("__init__.py"):
+        return {}
+
+    stub_file = init_file + "i"
+    if not os.path.exists(stub_file):
+        resolver.sources.add(init_file)
+        submod_attrs = read_lazy_loader_map(init_file, "_SUBMOD_ATTRS") or {}
+        return _exported_names({f"{package_path}.{module}": names for module, names in submod_attrs.items()})
+
+    resolver.sources.add(stub_file)
+    with open(stub_file, 'r') as f:
+        tree = ast.parse(f.read(), filename=stub_file)
+    exports = {}
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ImportFrom) and stmt.level == 1 and stmt.module:
+            for alias in stmt.names:
+                exports[alias.asname or alias.name] = (f"{package_path}.{stmt.module}", alias.name)
+    return exports
+
+
+class ComponentResolver:
+    """Resolve exported names to the component classes they create.
+
+    Modules are parsed once per resolver, and every file read is recorded in
+    `sources` so the index can be invalidated when one of them changes.
+    """
+
+    def __init__(self, package_dir: str):
+        """Initialize the resolver.
+
+        Args:
+            package_dir: The directory of the `reflex` package
+        """
+        self.package_dir = package_dir
+        self.sources = set()
+        self._modules: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def module_file(self, module_path: str) -> Optional[str]:
+        """Get the source file of a module.
+
+        Args:
+            module_path: The dotted path of the module, relative to `reflex`
+
+        Returns:
+            The path of the module file or package `__init__.py`, or None if
+            there is neither
+        """
+        base = os.path.join(self.package_dir, *module_path.split('.')) if module_path else self.package_dir
+        for file_path in (f"{base}.py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(file_path):
+                return file_path
+        return None
+
+    def resolve(self, module_path: str, attribute: str) -> Optional[Dict[str, Any]]:
+        """Resolve an exported name to the component it creates.
+
+        Args:
+            module_path: The dotted path of the module exporting the name
+            attribute: The name of the module attribute
+
+        Returns:
+            The module path, file path and class name of the component, or
+            None if the name does not create a component
+        """
+        target = self._resolve_name(module_path, attribute, MAX_RESOLVE_DEPTH)
+        if target is None:
+            return None
+
+        kind, module_path, class_name = target
+        if kind == "class" and not (
+            self._is_component_class(module_path, class_name, MAX_RESOLVE_DEPTH)
+            or self._is_namespace_class(module_path, class_name, MAX_RESOLVE_DEPTH)
+        ):
+            return None
+
+        # Calling a namespace like `rx.checkbox` creates the component its
+        # `__call__` is bound to; the namespace is kept for its members.
+        namespace_class = None
+        if kind == "class" and self._has_base(module_path, class_name, "ComponentNamespace"):
+            created = self._resolve_call_target(module_path, class_name, MAX_RESOLVE_DEPTH)
+            if created:
+                if created[1] == module_path:
+                    namespace_class = class_name
+                kind, module_path, class_name = created
+
+        entry = {
+            "module_path": module_path,
+            "file_path": self._modules[module_path]["file_path"],
+            "class_name": class_name,
+        }
+        if namespace_class:
+            entry["namespace_class"] = namespace_class
+        return entry
+
+    def _load(self, module_path: str) -> Optional[Dict[str, Any]]:
+        """Parse a module and index its top-level bindings."""
+        if module_path in self._modules:
+            return self._modules[module_path]
+
+        file_path = self.module_file(module_path)
+        module = None
+        if file_path:
+            self.sources.add(file_path)
+            try:
+                with open(file_path, 'r') as f:
+                    tree = ast.parse(f.read(), filename=file_path)
+            except (OSError, SyntaxError, UnicodeDecodeError) as e:
+                print(f"Warning: Could not parse {file_path}: {e}")
+            else:
+                module = {"file_path": file_path, "bindings": _module_bindings(tree), "classes": {}}
+                for stmt in tree.body:
+                    if isinstance(stmt, ast.ClassDef):
+                        module["classes"][stmt.name] = stmt
+
+        self._modules[module_path] = module
+        return module
+
+    def _resolve_name(self, module_path: str, name: str, depth: int) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Resolve a name bound in a module.
+
+        Returns:
+            ("class", module, class name) for a component class, created with
+            `X.create` or instantiated for namespaces, ("function", module,
+            None) for a function returning a component, or None
+        """
+        module = self._load(module_path)
+        if module is None or depth <= 0:
+            return None
+
+        binding = module["bindings"].get(name)
+        if binding is None:
+            return None
+        kind, node = binding
+
+        if kind == "import":
+            stmt, alias = node
+            imported = self._import_path(module_path, stmt)
+            return self._resolve_name(imported, alias.name, depth - 1) if imported is not None else None
+        if kind == "function":
+            return ("function", module_path, None) if _returns_component(node.returns) else None
+        if kind == "class":
+            # A bare class is not something users call to create a component
+            return None
+        return self._resolve_value(module_path, node, depth - 1)
+
+    def _resolve_value(self, module_path: str, value: ast.expr, depth: int) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Resolve the value assigned to an exported name."""
+        if depth <= 0:
+            return None
+
+        # staticmethod(X.create), inside namespaces
+        if isinstance(value, ast.Call) and isinstance(value.func, ast.Name) and value.func.id == "staticmethod" and value.args:
+            return self._resolve_value(module_path, value.args[0], depth - 1)
+
+        # X.create
+        if isinstance(value, ast.Attribute) and value.attr == "create" and isinstance(value.value, ast.Name):
+            return self._find_class(module_path, value.value.id, depth - 1)
+
+        # X(), a namespace instance
+        if isinstance(value, ast.Call) and isinstance(value.func, ast.Name):
+            found = self._find_class(module_path, value.func.id, depth - 1)
+            if found and (
+                self._has_base(found[1], found[2], "ComponentNamespace")
+                or self._is_namespace_class(found[1], found[2], depth - 1)
+            ):
+                return found
+            return None
+
+        # ns.member, a member of a namespace instance
+        if isinstance(value, ast.Attribute) and isinstance(value.value, ast.Name):
+            namespace = self._resolve_name(module_path, value.value.id, depth - 1)
+            if namespace and namespace[0] == "class":
+                class_def = self._modules[namespace[1]]["classes"][namespace[2]]
+                for stmt in class_def.body:
+                    if (
+                        isinstance(stmt, ast.Assign)
+                        and any(isinstance(t, ast.Name) and t.id == value.attr for t in stmt.targets)
+                    ):
+                        return self._resolve_value(namespace[1], stmt.value, depth - 1)
+            return None
+
+        # An alias of another exported name
+        if isinstance(value, ast.Name):
+            return self._resolve_name(module_path, value.id, depth - 1)
+
+        return None
+
+    def _find_class(self, module_path: str, name: str, depth: int) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Find the module defining a class used in a module."""
+        module = self._load(module_path)
+        if module is None or depth <= 0:
+            return None
+        if name in module["classes"]:
+            return ("class", module_path, name)
+
+        binding = module["bindings"].get(name)
+        if binding and binding[0] == "import":
+            stmt, alias = binding[1]
+            imported = self._import_path(module_path, stmt)
+            if imported is not None:
+                return self._find_class(imported, alias.name, depth - 1)
+        return None
+
+    def _resolve_call_target(self, module_path: str, class_name: str, depth: int) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Resolve the component class the `__call__` of a namespace creates, if it has one."""
+        class_def = self._modules[module_path]["classes"][class_name]
+        for stmt in class_def.body:
+            if (
+                isinstance(stmt, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "__call__" for t in stmt.targets)
+            ):
+                created = self._resolve_value(module_path, stmt.value, depth - 1)
+                if (
+                    created
+                    and created[0] == "class"
+                    and not self._has_base(created[1], created[2], "ComponentNamespace")
+                    and self._is_component_class(created[1], created[2], depth - 1)
+                ):
+                    return created
+        return None
+
+    def _has_base(self, module_path: str, class_name: str, base_name: str) -> bool:
+        """Check if a class directly derives from a base class name."""
+        class_def = self._modules[module_path]["classes"][class_name]
+        return any(_base_name(base) == base_name for base in class_def.bases)
+
+    def _is_namespace_class(self, module_path: str, class_name: str, depth: int) -> bool:
+        """Check if a class is a `SimpleNamespace` with a member creating a component."""
+        if depth <= 0 or not any(
+            self._has_base(module_path, class_name, base_name) for base_name in NAMESPACE_ROOTS
+        ):
+            return False
+        class_def = self._modules[module_path]["classes"][class_name]
+        for stmt in class_def.body:
+            if not isinstance(stmt, ast.Assign):
+                continue
+            member = self._resolve_value(module_path, stmt.value, depth - 1)
+            if member and (
+                member[0] == "function" or self._is_component_class(member[1], member[2], depth - 1)
+            ):
+                return True
+        return False
+
+    def _is_component_class(self, module_path: str, class_name: str, depth: int) -> bool:
+        """Check if a class derives from `Component` or `ComponentNamespace`."""
+        if depth <= 0:
+            return False
+        class_def = self._modules[module_path]["classes"][class_name]
+        for base in class_def.bases:
+            base_name = _base_name(base)
+            if base_name in COMPONENT_ROOTS:
+                return True
+            found = self._find_class(module_path, base_name, depth - 1) if base_name else None
+            if found and self._is_component_class(found[1], found[2], depth - 1):
+                return True
+        return False
+
+    def _import_path(self, module_path: str, stmt: ast.ImportFrom) -> Optional[str]:
+        """Get the module path an import statement reads from, if it is in `reflex`."""
+        if stmt.level:
+            package = module_path.split('.') if module_path else []
+            if not self._modules[module_path]["file_path"].endswith("__init__.py"):
+                package = package[:-1]
+            if stmt.level > 1:
+                package = package[:len(package) - (stmt.level - 1)]
+            parts = package + (stmt.module.split('.') if stmt.module else [])
+        elif stmt.module and (stmt.module == "reflex" or stmt.module.startswith("reflex.")):
+            parts = stmt.module.split('.')[1:]
+        else:
+            return None
+        return '.'.join(parts)
+
+
+def _module_bindings(tree: ast.Module) -> Dict[str, Tuple[str, Any]]:
+    """Index the top-level names of a module, the last binding of a name wins."""
+    bindings: Dict[str, Tuple[str, Any]] = {}
+    for stmt in tree.body:
+        if isinstance(stmt, ast.ImportFrom):
+            for alias in stmt.names:
+                bindings[alias.asname or alias.name] = ("import", (stmt, alias))
+        elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            bindings[stmt.name] = ("function", stmt)
+        elif isinstance(stmt, ast.ClassDef):
+            bindings[stmt.name] = ("class", stmt)
+        elif isinstance(stmt, ast.Assign):
+            for target in stmt.targets:
+                if isinstance(target, ast.Name):
+                    bindings[target.id] = ("value", stmt.value)
+        elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None and isinstance(stmt.target, ast.Name):
+            bindings[stmt.target.id] = ("value", stmt.value)
+    return bindings
+
+
+def _base_name(base: ast.expr) -> Optional[str]:
+    """Get the name of a base class expression, like `Base` or `module.Base`."""
+    if isinstance(base, ast.Subscript):
+        base = base.value
+    if isinstance(base, ast.Name):
+        return base.id
+    if isinstance(base, ast.Attribute):
+        return base.attr
+    return None
+
+
+def _returns_component(annotation: Optional[ast.expr]) -> bool:
+    """Check if a return annotation is `Component` or a union including it."""
+    if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+        try:
+            annotation = ast.parse(annotation.value, mode='eval').body
+        except SyntaxError:
+            return False
+    if isinstance(annotation, ast.Name):
+        return annotation.id == "Component"
+    if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+        return _returns_component(annotation.left) or _returns_component(annotation.right)
+    return False
+
+
+def _exported_names(mapping: Dict[str, List[Any]]) -> Dict[str, Tuple[str, str]]:
+    """Map each name of a lazy-loader map to its module and attribute.
+
+    Like the lazy loader, the last module listing a name wins. Entries can be
+    `(attribute, name)` pairs exporting an attribute under another name.
+    """
+    names = {}
+    for module_path, attributes in mapping.items():
+        for attribute in attributes:
+            attribute, name = attribute if isinstance(attribute, tuple) else (attribute, attribute)
+            names[name] = (module_path, attribute)
+    return names
+
+
+def load_component_index_cache(cache_path: str) -> Optional[Dict[str, Any]]:
+    """Load the component index cached by a previous run.
+
+    Args:
+        cache_path: The path of the cache file
+
+    Returns:
+        The cached index with its generator version, base directory and
+        source hashes, or None if there is no readable cache
+    """
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable component index {cache_path}: {e}")
+        return None
+
+
+def save_component_index_cache(cache_path: str, cached: Dict[str, Any]) -> str:
+    """Save the component index for the next run.
+
+    Args:
+        cache_path: The path of the cache file
+        cached: The index with its generator version, base directory and
+            source hashes
+
+    Returns:
+        The path to the saved cache file
+    """
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    with open(cache_path, 'w') as f:
+        json.dump(cached, f, indent=2)
+    return cache_path
@@ -0,0 +1,45 @@
+"""
+Names of the specs generated before components were discovered from the
+exports of the Reflex package.
+
+The hand-written mappings the index replaced named some specs after their
+module, like `areachart`, instead of the name users write, like
+`rx.recharts.area_chart`. Readers of a specs directory or bundle still find
+the spec under its old name, but the files are only saved under the new one.
+`el` and `recharts` are not mapped: they named whole packages, which are not
+components.
+"""
+from typing import Dict
+
+LEGACY_COMPONENT_NAMES: Dict[str, str] = {
+    "Fragment": "fragment",
+    "Script": "script",
+    "areachart": "recharts.area_chart",
+    "axis": "recharts.x_axis",
+    "barchart": "recharts.bar_chart",
+    "brush": "recharts.brush",
+    "cartesiangrid": "recharts.cartesian_grid",
+    "composedchart": "recharts.composed_chart",
+    "errorbar": "recharts.error_bar",
+    "funnelchart": "recharts.funnel_chart",
+    "html_embed": "el.embed",
+    "legend": "recharts.legend",
+    "linechart": "recharts.line_chart",
+    "piechart": "recharts.pie_chart",
+    "radarchart": "recharts.radar_chart",
+    "radialbarchart": "recharts.radial_bar_chart",
+    "reference": "recharts.reference_line",
+    "scatterchart": "recharts.scatter_chart",
+}
+
+
+def get_current_component_name(component_name: str) -> str:
+    """Get the name a component is saved under.
+
+    Args:
+        component_name: The name of the component, possibly a legacy one
+
+    Returns:
+        The current name of a legacy component name, or the name itself
+    """
+    return LEGACY_COMPONENT_NAMES.get(component_name, component_name)
@@ -1,5 +1,19 @@
 """Output module for saving specification files."""
 
-__all__ = ["generate_spec_files", "generate_common_props_spec"]
+__all__ = [
+    "generate_spec_files",
+    "generate_common_props_spec",
+    "iter_component_specs",
+    "generate_component_specs",
+    "FileSpecSink",
+    "NDJSONSpecSink",
+    "MemorySpecSink",
+    "write_spec_bundle",
+    "SpecBundle",
+    "SpecLoader",
+]
 
 from .writer import generate_spec_files, generate_common_props_spec
+from .stream import iter_component_specs, generate_component_specs, FileSpecSink, NDJSONSpecSink, MemorySpecSink
+from .bundle import write_spec_bundle, SpecBundle
+from .normalize import SpecLoader
@@ -0,0 +1,249 @@
+"""
+Single-file bundle of all component specs, with an index for lazy loading.
+
+The bundle starts with a magic string and the length of a compact JSON
+header. The header maps each component to the offset and length of its spec
+in the data section that follows and to the hash of the spec, and indexes
+which components have each prop and each event. Readers can answer index queries from the header alone
+and decode a single spec on demand from a memory map.
+
+Layout::
+
+    b"RXSPECB1" | header length (uint32, little endian) | header JSON | specs
+"""
+import os
+import json
+import mmap
+import struct
+from typing import Dict, Any, List, Optional
+
+from spec_generator.output.manifest import hash_spec
+from spec_generator.mapping.legacy import get_current_component_name
+
+BUNDLE_FILENAME = "specs.bundle"
+BUNDLE_MAGIC = b"RXSPECB1"
+BUNDLE_FORMAT_VERSION = 1
+
+_HEADER_LENGTH = struct.Struct("<I")
+
+# Spec fields that hold prop dictionaries, own and inherited
+PROP_FIELDS = ["properties", "styling_props", "inherited_properties", "inherited_styling_props"]
+EVENT_FIELDS = ["event_names", "inherited_event_names"]
+
+
+def get_bundle_path(specs_dir: str) -> str:
+    """Get the path of the bundle file of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        The path to the bundle file
+    """
+    return os.path.join(specs_dir, BUNDLE_FILENAME)
+
+
+def write_spec_bundle(specs: Dict[str, Dict[str, Any]], bundle_path: str) -> str:
+    """Write component specs to a bundle file.
+
+    Args:
+        specs: A dictionary of component names to specs
+        bundle_path: The path of the bundle file to write
+
+    Returns:
+        The path to the saved bundle file
+    """
+    components = {}
+    hashes = {}
+    props: Dict[str, List[str]] = {}
+    events: Dict[str, List[str]] = {}
+    payloads = []
+    offset = 0
+
+    for component_name in sorted(specs):
+        spec = specs[component_name]
+        payload = json.dumps(spec, separators=(",", ":")).encode("utf-8")
+        components[component_name] = [offset, len(payload)]
+        hashes[component_name] = hash_spec(spec)
+        payloads.append(payload)
+        offset += len(payload)
+
+        for prop_name in sorted(get_spec_prop_names(spec)):
+            props.setdefault(prop_name, []).append(component_name)
+        for event_name in sorted(get_spec_event_names(spec)):
+            events.setdefault(event_name, []).append(component_name)
+
+    header = {
+        "version": BUNDLE_FORMAT_VERSION,
+        "components": components,
+        "hashes": hashes,
+        "props": dict(sorted(props.items())),
+        "events": dict(sorted(events.items())),
+    }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+
+    os.makedirs(os.path.dirname(bundle_path) or ".", exist_ok=True)
+    with open(bundle_path, "wb") as f:
+        f.write(BUNDLE_MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        for payload in payloads:
+            f.write(payload)
+
+    return bundle_path
+
+
+def get_spec_prop_names(spec: Dict[str, Any]) -> set:
+    """Get the names of all props of a spec, own and inherited.
+
+    Args:
+        spec: The specification dictionary
+
+    Returns:
+        The set of prop names
+    """
+    return {prop["name"] for field in PROP_FIELDS for prop in spec.get(field, [])}
+
+
+def get_spec_event_names(spec: Dict[str, Any]) -> set:
+    """Get the names of all events of a spec, own and inherited.
+
+    Args:
+        spec: The specification dictionary
+
+    Returns:
+        The set of event names
+    """
+    return {event_name for field in EVENT_FIELDS for event_name in spec.get(field, [])}
+
+
+class SpecBundle:
+    """Read-only access to a spec bundle.
+
+    Only the header is decoded when the bundle is opened; specs are decoded
+    from a memory map when they are requested.
+
+    Example:
+        with SpecBundle("specs/specs.bundle") as bundle:
+            for name in bundle.components_with_prop("high_contrast"):
+                print(bundle.get(name)["docstring"])
+    """
+
+    def __init__(self, bundle_path: str):
+        """Open a bundle.
+
+        Args:
+            bundle_path: The path of the bundle file
+
+        Raises:
+            ValueError: If the file is not a spec bundle of a supported version
+        """
+        self.bundle_path = bundle_path
+        self._file = open(bundle_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        prefix_length = len(BUNDLE_MAGIC) + _HEADER_LENGTH.size
+        if self._map[:len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            self.close()
+            raise ValueError(f"Not a spec bundle: {bundle_path}")
+        (header_length,) = _HEADER_LENGTH.unpack(self._map[len(BUNDLE_MAGIC):prefix_length])
+        header = json.loads(self._map[prefix_length:prefix_length + header_length])
+        if header.get("version") != BUNDLE_FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported spec bundle version {header.get('version')}: {bundle_path}")
+
+        self._data_offset = prefix_length + header_length
+        self._components: Dict[str, List[int]] = header["components"]
+        # Bundles written before the hashes were added do not have them
+        self._hashes: Dict[str, str] = header.get("hashes", {})
+        self._props: Dict[str, List[str]] = header["props"]
+        self._events: Dict[str, List[str]] = header["events"]
+
+    def __enter__(self) -> "SpecBundle":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __contains__(self, component_name: str) -> bool:
+        return component_name in self._components
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    def close(self) -> None:
+        """Release the memory map and the file."""
+        self._map.close()
+        self._file.close()
+
+    def components(self) -> List[str]:
+        """Get the names of the components in the bundle.
+
+        Returns:
+            The sorted component names
+        """
+        return list(self._components)
+
+    def get(self, component_name: str) -> Optional[Dict[str, Any]]:
+        """Decode the spec of a component.
+
+        Args:
+            component_name: The name of the component, or a legacy name, see
+                `LEGACY_COMPONENT_NAMES`
+
+        Returns:
+            The specification dictionary, or None if the component is not in
+            the bundle
+        """
+        location = self._components.get(component_name)
+        if location is None:
+            location = self._components.get(get_current_component_name(component_name))
+        if location is None:
+            return None
+        offset, length = location
+        start = self._data_offset + offset
+        return json.loads(self._map[start:start + length])
+
+    def get_hash(self, component_name: str) -> Optional[str]:
+        """Get the hash of the spec of a component, see `hash_spec`.
+
+        The hash is read from the header, the spec is only decoded if the
+        bundle does not record it.
+
+        Args:
+            component_name: The name of the component
+
+        Returns:
+            The hash of the spec, or None if the component is not in the
+            bundle
+        """
+        spec_hash = self._hashes.get(component_name)
+        if spec_hash is None and component_name in self._components:
+            spec_hash = hash_spec(self.get(component_name))
+        return spec_hash
+
+    def components_with_prop(self, prop_name: str) -> List[str]:
+        """Get the components that have a prop, declared or inherited.
+
+        Args:
+            prop_name: The name of the prop
+
+        Returns:
+            The sorted component names
+        """
+        return list(self._props.get(prop_name, []))
+
+    def components_with_event(self, event_name: str) -> List[str]:
+        """Get the components that have an event, declared or inherited.
+
+        Args:
+            event_name: The name of the event
+
+        Returns:
+            The sorted component names
+        """
+        return list(self._events.get(event_name, []))
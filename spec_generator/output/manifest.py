@@ -0,0 +1,208 @@
+"""
+Manifest of the inputs each spec file was generated from.
+
+The manifest is saved next to the specs as `.manifest.json`. For each
+component it records the generator version, the mapping and a hash of every
+source file the spec was extracted from (including the modules of inherited
+base classes), so that a later run can skip the components whose inputs did
+not change.
+"""
+import os
+import json
+import hashlib
+from typing import Dict, Any, Optional
+
+MANIFEST_FILENAME = ".manifest.json"
+
+
+def get_manifest_path(specs_dir: str) -> str:
+    """Get the path of the manifest file of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        The path to the manifest file
+    """
+    return os.path.join(specs_dir, MANIFEST_FILENAME)
+
+
+def load_manifest(specs_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Load the manifest entries of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        A dictionary of component names to manifest entries, empty if there is
+        no readable manifest
+    """
+    manifest_path = get_manifest_path(specs_dir)
+    if not os.path.exists(manifest_path):
+        return {}
+
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable manifest {manifest_path}: {e}")
+        return {}
+
+    return manifest.get("specs", {})
+
+
+def save_manifest(specs_dir: str, entries: Dict[str, Dict[str, Any]]) -> str:
+    """Save the manifest entries of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+        entries: A dictionary of component names to manifest entries
+
+    Returns:
+        The path to the saved manifest file
+    """
+    manifest_path = get_manifest_path(specs_dir)
+    os.makedirs(specs_dir, exist_ok=True)
+
+    with open(manifest_path, 'w') as f:
+        json.dump({"specs": dict(sorted(entries.items()))}, f, indent=2)
+
+    return manifest_path
+
+
+def hash_source_file(file_path: str, file_hashes: Optional[Dict[str, Optional[str]]] = None) -> Optional[str]:
+    """Hash the content of a source file.
+
+    Args:
+        file_path: The path of the source file
+        file_hashes: Optional cache of hashes already computed during this run
+
+    Returns:
+        The SHA-256 hex digest of the file, or None if the file does not exist
+    """
+    if file_hashes is not None and file_path in file_hashes:
+        return file_hashes[file_path]
+
+    digest = None
+    if os.path.exists(file_path):
+        with open(file_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+
+    if file_hashes is not None:
+        file_hashes[file_path] = digest
+
+    return digest
+
+
+def hash_spec(spec: Dict[str, Any]) -> str:
+    """Hash the content of a spec.
+
+    The hash does not depend on the key order or on the format the spec is
+    saved in, so a normalized spec file and the expanded spec in the bundle
+    have the same hash.
+
+    Args:
+        spec: The full specification dictionary
+
+    Returns:
+        The SHA-256 hex digest of the spec
+    """
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def build_manifest_entry(
+    mapping: Dict[str, str],
+    spec_file: str,
+    sources: Dict[str, Optional[str]],
+    normalized: bool = False,
+    doc_path: Optional[str] = None,
+    runtime: bool = False,
+    literal_aliases: Optional[str] = None,
+    spec_hash: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the manifest entry of a component.
+
+    Args:
+        mapping: The mapping information for the component
+        spec_file: The name of the spec file in the specs directory
+        sources: A dictionary of the source files of the spec to their hashes
+        normalized: Whether the spec was saved in the normalized format
+        doc_path: The documentation page of the component, if it has one
+        runtime: Whether the spec includes the fields found at runtime
+        literal_aliases: The digest of the literal alias table the enum
+            values of the spec were resolved with
+        spec_hash: The hash of the full spec, see `hash_spec`
+
+    Returns:
+        The manifest entry
+    """
+    from spec_generator import __version__
+
+    return {
+        "spec_file": spec_file,
+        "generator_version": __version__,
+        "module_path": mapping.get('module_path', ''),
+        "file_path": mapping.get('file_path', ''),
+        "class_name": mapping.get('class_name'),
+        "namespace_class": mapping.get('namespace_class'),
+        "normalized": normalized,
+        "doc_path": doc_path,
+        "runtime": runtime,
+        "literal_aliases": literal_aliases,
+        "spec_hash": spec_hash,
+        "sources": sources,
+    }
+
+
+def is_spec_up_to_date(
+    previous: Optional[Dict[str, Any]],
+    mapping: Dict[str, str],
+    spec_file: str,
+    specs_dir: str,
+    file_hashes: Optional[Dict[str, Optional[str]]] = None,
+    normalized: bool = False,
+    doc_path: Optional[str] = None,
+    runtime: bool = False,
+    literal_aliases: Optional[str] = None,
+) -> bool:
+    """Check if a spec file can be kept as is.
+
+    Args:
+        previous: The manifest entry recorded by the last run, if any
+        mapping: The current mapping information for the component
+        spec_file: The current name of the spec file
+        specs_dir: The directory the specs are saved to
+        file_hashes: Optional cache of hashes already computed during this run
+        normalized: Whether the spec should be in the normalized format
+        doc_path: The current documentation page of the component
+        runtime: Whether the spec should include the fields found at runtime
+        literal_aliases: The digest of the current literal alias table
+
+    Returns:
+        True if the generator version, the output format, the mapping, the
+        documentation page, the literal aliases and every source file
+        recorded for the spec are unchanged, and the spec file still exists
+    """
+    from spec_generator import __version__
+
+    if not previous:
+        return False
+    if (
+        previous.get("generator_version") != __version__
+        or previous.get("normalized", False) != normalized
+        or previous.get("spec_file") != spec_file
+        or previous.get("module_path") != mapping.get('module_path', '')
+        or previous.get("file_path") != mapping.get('file_path', '')
+        or previous.get("class_name") != mapping.get('class_name')
+        or previous.get("namespace_class") != mapping.get('namespace_class')
+        or previous.get("doc_path") != doc_path
+        or previous.get("runtime", False) != runtime
+        or previous.get("literal_aliases") != literal_aliases
+    ):
+        return False
+
+    for source_path, digest in previous.get("sources", {}).items():
+        if hash_source_file(source_path, file_hashes) != digest:
+            return False
+
+    return os.path.exists(os.path.join(specs_dir, spec_file))
@@ -0,0 +1,372 @@
+"""
+Normalized spec output.
+
+Full specs repeat a lot of shared data: every component that supports the
+common props lists the same event handlers, props inherited from a base class
+are copied into every subclass spec, and enum props carry the values of the
+`Literal` aliases that are already in `common_props.json`.
+
+Normalized specs replace those copies with references:
+
+- `event_groups` names the groups of `shared_groups.json` that the event
+  names start with, and `event_names` only lists the remaining events.
+- `inherited_properties` and `inherited_styling_props` hold
+  `{"group": <class>, "names": [...]}` entries pointing to the props of the
+  class in `shared_groups.json`.
+- A prop with `values_ref` instead of `values` takes its values from the
+  `type_mappings` of `common_props.json`.
+
+`SpecLoader` expands normalized specs back to the full format when they are
+loaded.
+"""
+import os
+import copy
+import json
+from typing import Dict, Any, List, Optional, Tuple
+
+SHARED_GROUPS_FILENAME = "shared_groups.json"
+COMMON_EVENTS_GROUP = "common_events"
+
+# Spec fields holding the props a class declares and the props it inherits
+OWN_PROP_FIELDS = ["properties", "styling_props"]
+INHERITED_PROP_FIELDS = ["inherited_properties", "inherited_styling_props"]
+
+
+def get_shared_groups_path(specs_dir: str) -> str:
+    """Get the path of the shared groups file of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        The path to the shared groups file
+    """
+    return os.path.join(specs_dir, SHARED_GROUPS_FILENAME)
+
+
+def new_shared_groups() -> Dict[str, Any]:
+    """Create the shared groups of a normalized spec set.
+
+    Returns:
+        A dictionary with the "event_groups" and the (initially empty)
+        "prop_groups"
+    """
+    from spec_generator.extraction.component import COMMON_EVENT_HANDLERS
+
+    return {
+        "event_groups": {COMMON_EVENTS_GROUP: list(COMMON_EVENT_HANDLERS)},
+        "prop_groups": {},
+    }
+
+
+def load_shared_groups(specs_dir: str) -> Optional[Dict[str, Any]]:
+    """Load the shared groups of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        The shared groups, or None if there is no readable file
+    """
+    shared_groups_path = get_shared_groups_path(specs_dir)
+    if not os.path.exists(shared_groups_path):
+        return None
+
+    try:
+        with open(shared_groups_path, 'r') as f:
+            saved = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable shared groups {shared_groups_path}: {e}")
+        return None
+
+    shared_groups = new_shared_groups()
+
+    shared_groups["prop_groups"].update(saved.get("prop_groups", {}))
+    return shared_groups
+
+
+def save_shared_groups(specs_dir: str, shared_groups: Dict[str, Any]) -> str:
+    """Save the shared groups of a specs directory.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+        shared_groups: The shared groups to save
+
+    Returns:
+        The path to the saved shared groups file
+    """
+    shared_groups_path = get_shared_groups_path(specs_dir)
+    os.makedirs(specs_dir, exist_ok=True)
+
+    with open(shared_groups_path, 'w') as f:
+        json.dump({
+            "event_groups": shared_groups["event_groups"],
+            "prop_groups": dict(sorted(shared_groups["prop_groups"].items())),
+        }, f, indent=2)
+
+    return shared_groups_path
+
+
+def normalize_spec(
+    spec: Dict[str, Any],
+    shared_groups: Dict[str, Any],
+    type_mappings: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Replace the shared data of a spec with references.
+
+    The props inherited by the spec are added to the prop groups.
+
+    Args:
+        spec: The full specification dictionary
+        shared_groups: The shared groups, updated in place
+        type_mappings: The enums props can refer to, like the
+            `type_mappings` of `common_props.json`
+
+    Returns:
+        The normalized specification dictionary
+    """
+    if type_mappings is None:
+        type_mappings = {}
+
+    value_refs = {tuple(info["values"]): name for name, info in type_mappings.items()}
+    normalized = _normalize_fields(spec, shared_groups, value_refs)
+    normalized["shared_groups"] = SHARED_GROUPS_FILENAME
+    return normalized
+
+
+def is_normalized_spec(spec: Dict[str, Any]) -> bool:
+    """Check whether a spec was saved in the normalized format.
+
+    Args:
+        spec: The specification dictionary
+
+    Returns:
+        True if the spec refers to shared groups
+    """
+    return "shared_groups" in spec
+
+
+def expand_spec(
+    spec: Dict[str, Any],
+    shared_groups: Dict[str, Any],
+    type_mappings: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Expand the references of a normalized spec.
+
+    Args:
+        spec: The normalized specification dictionary
+        shared_groups: The shared groups the spec refers to
+        type_mappings: The enums the props refer to
+
+    Returns:
+        The full specification dictionary
+    """
+    expanded = _expand_fields(spec, shared_groups, type_mappings)
+    expanded.pop("shared_groups", None)
+    return expanded
+
+
+class SpecLoader:
+    """Load specs from a specs directory, expanding normalized specs.
+
+    The shared groups and type mappings are only read when the first
+    normalized spec is loaded, and full specs are returned as saved.
+
+    Example:
+        loader = SpecLoader("specs")
+        button = loader.get("button")
+    """
+
+    def __init__(self, specs_dir: str):
+        """Create a loader.
+
+        Args:
+            specs_dir: The directory the specs are saved to
+        """
+        self.specs_dir = specs_dir
+        self._shared_groups: Optional[Dict[str, Any]] = None
+        self._type_mappings: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def get(self, component_name: str) -> Optional[Dict[str, Any]]:
+        """Load the spec of a component.
+
+        Args:
+            component_name: The name of the component, or a legacy name, see
+                `LEGACY_COMPONENT_NAMES`
+
+        Returns:
+            The full specification dictionary, or None if there is no spec
+            file for the component
+        """
+        from spec_generator.mapping import get_current_component_name
+        from spec_generator.output.writer import get_spec_filename
+
+        spec = self.load_file(get_spec_filename(component_name))
+        if spec is None and get_current_component_name(component_name) != component_name:
+            spec = self.load_file(get_spec_filename(get_current_component_name(component_name)))
+        return spec
+
+    def load_file(self, spec_file: str) -> Optional[Dict[str, Any]]:
+        """Load a spec file of the specs directory.
+
+        Args:
+            spec_file: The name of the spec file
+
+        Returns:
+            The full specification dictionary, or None if the file does not
+            exist
+        """
+        spec_path = os.path.join(self.specs_dir, spec_file)
+        if not os.path.exists(spec_path):
+            return None
+
+        with open(spec_path, 'r') as f:
+            spec = json.load(f)
+
+        if not is_normalized_spec(spec):
+            return spec
+
+        if self._shared_groups is None:
+            self._shared_groups = load_shared_groups(self.specs_dir) or new_shared_groups()
+            self._type_mappings = self._load_type_mappings()
+        return expand_spec(spec, self._shared_groups, self._type_mappings)
+
+    def _load_type_mappings(self) -> Dict[str, Dict[str, Any]]:
+        """Load the type mappings saved in `common_props.json`."""
+        common_props_path = os.path.join(self.specs_dir, "common_props.json")
+        if os.path.exists(common_props_path):
+            with open(common_props_path, 'r') as f:
+                return json.load(f).get("type_mappings", {})
+        return {}
+
+
+def _normalize_fields(
+    spec: Dict[str, Any],
+    shared_groups: Dict[str, Any],
+    value_refs: Dict[Tuple[str, ...], str],
+) -> Dict[str, Any]:
+    """Normalize the fields of a spec or subcomponent spec, keeping their order."""
+    normalized = {}
+    for key, value in spec.items():
+        if key == "event_names":
+            event_groups, event_names = _group_event_names(value, shared_groups)
+            if event_groups:
+                normalized["event_groups"] = event_groups
+            normalized[key] = event_names
+        elif key in OWN_PROP_FIELDS:
+            normalized[key] = [_normalize_prop(prop, value_refs) for prop in value]
+        elif key in INHERITED_PROP_FIELDS:
+            normalized[key] = _group_inherited_props(value, shared_groups, value_refs)
+        elif key == "subcomponents":
+            normalized[key] = {
+                name: _normalize_fields(subcomponent, shared_groups, value_refs)
+                for name, subcomponent in value.items()
+            }
+        else:
+            normalized[key] = value
+    return normalized
+
+
+def _expand_fields(
+    spec: Dict[str, Any],
+    shared_groups: Dict[str, Any],
+    type_mappings: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Expand the fields of a spec or subcomponent spec, keeping their order."""
+    expanded = {}
+    for key, value in spec.items():
+        if key == "event_groups":
+            continue
+        if key == "event_names":
+            event_names = []
+            for group in spec.get("event_groups", []):
+                event_names.extend(shared_groups["event_groups"][group])
+            expanded[key] = event_names + value
+        elif key in OWN_PROP_FIELDS:
+            expanded[key] = [_expand_prop(prop, type_mappings) for prop in value]
+        elif key in INHERITED_PROP_FIELDS:
+            expanded[key] = []
+            for entry in value:
+                if "group" not in entry:
+                    expanded[key].append(_expand_prop(entry, type_mappings))
+                    continue
+                group = shared_groups["prop_groups"][entry["group"]]
+                for name in entry["names"]:
+                    prop = _expand_prop(group[name], type_mappings)
+                    prop["inherited_from"] = entry["group"]
+                    expanded[key].append(prop)
+        elif key == "subcomponents":
+            expanded[key] = {
+                name: _expand_fields(subcomponent, shared_groups, type_mappings)
+                for name, subcomponent in value.items()
+            }
+        else:
+            expanded[key] = value
+    return expanded
+
+
+def _group_event_names(
+    event_names: List[str],
+    shared_groups: Dict[str, Any],
+) -> Tuple[List[str], List[str]]:
+    """Split the event groups the event names start with from the other events."""
+    event_groups = []
+    for group, group_events in shared_groups["event_groups"].items():
+        if group_events and event_names[:len(group_events)] == group_events:
+            event_groups.append(group)
+            event_names = event_names[len(group_events):]
+    return event_groups, list(event_names)
+
+
+def _group_inherited_props(
+    props: List[Dict[str, Any]],
+    shared_groups: Dict[str, Any],
+    value_refs: Dict[Tuple[str, ...], str],
+) -> List[Dict[str, Any]]:
+    """Replace consecutive props inherited from the same class with a group reference."""
+    entries: List[Dict[str, Any]] = []
+    for prop in props:
+        origin = prop.get("inherited_from")
+        if origin is None:
+            entries.append(_normalize_prop(prop, value_refs))
+            continue
+
+        shared_prop = {key: value for key, value in prop.items() if key != "inherited_from"}
+        shared_groups["prop_groups"].setdefault(origin, {})[prop["name"]] = _normalize_prop(
+            shared_prop, value_refs
+        )
+
+        if entries and entries[-1].get("group") == origin:
+            entries[-1]["names"].append(prop["name"])
+        else:
+            entries.append({"group": origin, "names": [prop["name"]]})
+    return entries
+
+
+def _normalize_prop(prop: Dict[str, Any], value_refs: Dict[Tuple[str, ...], str]) -> Dict[str, Any]:
+    """Replace the enum values of a prop with a reference to its type mapping."""
+    ref = value_refs.get(tuple(prop.get("values", ())))
+    if ref is None:
+        return prop
+
+    normalized = {}
+    for key, value in prop.items():
+        if key == "values":
+            normalized["values_ref"] = ref
+        else:
+            normalized[key] = value
+    return normalized
+
+
+def _expand_prop(prop: Dict[str, Any], type_mappings: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Replace the type mapping reference of a prop with its enum values."""
+    if "values_ref" not in prop:
+        return copy.deepcopy(prop)
+
+    expanded = {}
+    for key, value in prop.items():
+        if key == "values_ref":
+            expanded["values"] = list(type_mappings[value]["values"])
+        else:
+            expanded[key] = copy.deepcopy(value)
+    return expanded
@@ -0,0 +1,200 @@
+"""
+Streaming generation of component specs, for use in-process.
+
+`iter_component_specs` yields the spec of each component as soon as it is
+extracted, so a caller can build the specs of a few components on demand
+without generating all of them. Nothing is written to disk unless a sink
+or a cache directory is given:
+
+    for spec in iter_component_specs(base_dir, components={"button"}):
+        ...
+
+Sinks receive every yielded spec. `FileSpecSink` saves spec files like
+`generate_spec_files`, `NDJSONSpecSink` writes one spec per line to a single
+stream and `MemorySpecSink` keeps the specs in a dictionary.
+"""
+import io
+import os
+import json
+import contextlib
+from typing import Dict, Any, Iterable, Iterator, Optional, TextIO
+
+from spec_generator.extraction.runtime import get_runtime_cache_path
+from spec_generator.mapping.legacy import get_current_component_name
+from spec_generator.output.writer import discover_components, iter_extracted_specs, save_spec_file
+
+
+class FileSpecSink:
+    """Save each spec to its own file in a specs directory."""
+
+    def __init__(self, specs_dir: str):
+        """Create a sink writing to a specs directory.
+
+        Args:
+            specs_dir: The directory to save the spec files to
+        """
+        self.specs_dir = specs_dir
+        self.paths: Dict[str, str] = {}
+
+    def write(self, spec: Dict[str, Any]) -> None:
+        """Save a spec.
+
+        Args:
+            spec: The specification dictionary
+        """
+        spec_path = save_spec_file(spec, spec["name"], self.specs_dir)
+        if spec_path:
+            self.paths[spec["name"]] = spec_path
+
+    def close(self) -> None:
+        """Nothing to release, each file is closed once written."""
+
+
+class NDJSONSpecSink:
+    """Write the specs to a single stream, one JSON document per line."""
+
+    def __init__(self, stream: TextIO):
+        """Create a sink writing to a text stream.
+
+        Args:
+            stream: The stream to write to, like an open file or `sys.stdout`
+        """
+        self.stream = stream
+
+    def write(self, spec: Dict[str, Any]) -> None:
+        """Write a spec as a line of compact JSON.
+
+        Args:
+            spec: The specification dictionary
+        """
+        self.stream.write(json.dumps(spec, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        """Flush the stream. The stream is left open for its owner to close."""
+        self.stream.flush()
+
+
+class MemorySpecSink:
+    """Keep the specs in memory, by component name."""
+
+    def __init__(self):
+        """Create an empty sink."""
+        self.specs: Dict[str, Dict[str, Any]] = {}
+
+    def write(self, spec: Dict[str, Any]) -> None:
+        """Keep a spec.
+
+        Args:
+            spec: The specification dictionary
+        """
+        self.specs[spec["name"]] = spec
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def iter_component_specs(
+    base_dir: Optional[str] = None,
+    components: Optional[Iterable[str]] = None,
+    sink: Optional[Any] = None,
+    cache_dir: Optional[str] = None,
+    runtime: bool = False,
+    verbose: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Extract component specs one at a time.
+
+    Components are extracted in discovery order and each spec is yielded as
+    soon as it is extracted. Components whose extraction fails are left out.
+
+    Args:
+        base_dir: The base directory of the Reflex codebase, defaults to the
+            current directory
+        components: Only extract the components with these names, all of them
+            if None. Legacy names, see `LEGACY_COMPONENT_NAMES`, are accepted.
+        sink: Optional sink every spec is written to before it is yielded, like
+            `FileSpecSink`, `NDJSONSpecSink` or `MemorySpecSink`. It is closed
+            once the iteration ends.
+        cache_dir: Optional directory of the discovery, docs and alias caches,
+            like a specs directory. Without it nothing is written to disk.
+        runtime: Complete the statically extracted fields with the ones found
+            by importing the component modules in a separate process
+        verbose: Print the progress of the extraction
+
+    Yields:
+        The specification dictionary of each component
+    """
+    if base_dir is None:
+        base_dir = os.getcwd()
+
+    output = None if verbose else io.StringIO()
+    with _redirect_stdout(output):
+        literal_aliases, component_mappings, docs_index = discover_components(base_dir, cache_dir)
+
+    if components is not None:
+        requested = {}
+        for component_name in components:
+            requested.setdefault(get_current_component_name(component_name), component_name)
+        for current_name in sorted(set(requested) - set(component_mappings)):
+            print(f"Warning: Unknown component: {requested[current_name]}")
+        component_mappings = {
+            name: mapping for name, mapping in component_mappings.items() if name in requested
+        }
+
+    extracted = iter_extracted_specs(
+        list(component_mappings.items()),
+        literal_aliases,
+        docs_index,
+        runtime=runtime,
+        runtime_cache_path=get_runtime_cache_path(cache_dir) if cache_dir else None,
+    )
+
+    try:
+        while True:
+            # The specs are yielded outside the capture of the output
+            with _redirect_stdout(output):
+                result = next(extracted, None)
+            if output is not None:
+                # Only the output of the current component is of any use
+                output.seek(0)
+                output.truncate()
+            if result is None:
+                break
+            spec = result[2]
+            if spec is None:
+                continue
+            if sink is not None:
+                sink.write(spec)
+            yield spec
+    finally:
+        if sink is not None:
+            sink.close()
+
+
+def generate_component_specs(
+    base_dir: Optional[str] = None,
+    components: Optional[Iterable[str]] = None,
+    cache_dir: Optional[str] = None,
+    runtime: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """Extract component specs in memory.
+
+    Args:
+        base_dir: The base directory of the Reflex codebase
+        components: Only extract the components with these names, all of them
+            if None
+        cache_dir: Optional directory of the discovery, docs and alias caches
+        runtime: Complete the statically extracted fields with the ones found
+            at runtime
+
+    Returns:
+        A dictionary of component names to specs
+    """
+    sink = MemorySpecSink()
+    for _ in iter_component_specs(base_dir, components, sink, cache_dir, runtime):
+        pass
+    return sink.specs
+
+
+def _redirect_stdout(output: Optional[io.StringIO]):
+    """Capture the output of a block, or leave it alone if there is no buffer."""
+    return contextlib.redirect_stdout(output) if output is not None else contextlib.nullcontext()
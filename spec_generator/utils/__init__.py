@@ -7,6 +7,11 @@ __all__ = [
     "find_file_in_directories",
     "get_reflex_component_path",
     "get_output_path",
+    "start_profile",
+    "stop_profile",
+    "profile_phase",
+    "profile_component",
+    "save_profile_report",
 ]
 
 from .enum_parser import extract_enum_values_from_description
@@ -17,3 +22,10 @@ from .path_resolver import (
     get_reflex_component_path,
     get_output_path,
 )
+from .profiling import (
+    start_profile,
+    stop_profile,
+    profile_phase,
+    profile_component,
+    save_profile_report,
+)
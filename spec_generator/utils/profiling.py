@@ -0,0 +1,198 @@
+"""
+Optional timing of the generation phases.
+
+Profiling is off unless `start_profile` was called, in which case every
+`profile_phase` block adds its duration to the component being processed
+(see `profile_component`), or to the run itself outside of components.
+Nested phases are timed exclusively: the time spent in an inner phase (like
+reading the module of a base class during property extraction) is not
+counted again in the outer one.
+"""
+import json
+import time
+import contextlib
+from typing import Dict, Any, Iterator, List, Optional
+
+# Phases in the order they happen for a component
+PHASES = [
+    "discovery",
+    "doc_scan",
+    "alias_scan",
+    "runtime_introspection",
+    "file_read",
+    "parse",
+    "class_lookup",
+    "property_extraction",
+    "json_write",
+]
+
+_profile: Optional[Dict[str, Any]] = None
+_component: Optional[str] = None
+_stack: List[List[Any]] = []
+
+
+def start_profile() -> Dict[str, Any]:
+    """Start recording phase timings.
+
+    Returns:
+        The profile the timings are recorded in
+    """
+    global _profile, _component
+    _profile = {"phases": {}, "components": {}, "started": time.perf_counter()}
+    _component = None
+    _stack.clear()
+    return _profile
+
+
+def stop_profile() -> Optional[Dict[str, Any]]:
+    """Stop recording phase timings.
+
+    Returns:
+        The report of the profile, or None if profiling was not started
+    """
+    global _profile
+    profile, _profile = _profile, None
+    if profile is None:
+        return None
+    return build_profile_report(profile, time.perf_counter() - profile["started"])
+
+
+def is_profiling() -> bool:
+    """Check whether phase timings are being recorded.
+
+    Returns:
+        True if `start_profile` was called and the profile not stopped yet
+    """
+    return _profile is not None
+
+
+@contextlib.contextmanager
+def profile_component(component_name: str) -> Iterator[None]:
+    """Attribute the phases timed in the block to a component.
+
+    Args:
+        component_name: The name of the component being processed
+    """
+    global _component
+    if _profile is None:
+        yield
+        return
+
+    previous = _component
+    _component = component_name
+    entry = _profile["components"].setdefault(component_name, {"seconds": 0.0, "phases": {}})
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry["seconds"] += time.perf_counter() - start
+        _component = previous
+
+
+@contextlib.contextmanager
+def profile_phase(phase: str) -> Iterator[None]:
+    """Time a phase of the generation.
+
+    Args:
+        phase: The name of the phase, one of `PHASES`
+    """
+    if _profile is None:
+        yield
+        return
+
+    now = time.perf_counter()
+    if _stack:
+        # Pause the enclosing phase
+        _record(_stack[-1][0], now - _stack[-1][1])
+    _stack.append([phase, now])
+    try:
+        yield
+    finally:
+        now = time.perf_counter()
+        _record(phase, now - _stack.pop()[1])
+        if _stack:
+            _stack[-1][1] = now
+
+
+def add_component_timings(component_name: str, timings: Dict[str, Any]) -> None:
+    """Add timings recorded in another process to the current profile.
+
+    Args:
+        component_name: The name of the component
+        timings: The component entry of the other profile
+    """
+    if _profile is None or not timings:
+        return
+
+    entry = _profile["components"].setdefault(component_name, {"seconds": 0.0, "phases": {}})
+    entry["seconds"] += timings["seconds"]
+    for phase, seconds in timings["phases"].items():
+        entry["phases"][phase] = entry["phases"].get(phase, 0.0) + seconds
+        _profile["phases"][phase] = _profile["phases"].get(phase, 0.0) + seconds
+
+
+def get_component_timings(component_name: str) -> Optional[Dict[str, Any]]:
+    """Get the timings recorded for a component.
+
+    Args:
+        component_name: The name of the component
+
+    Returns:
+        The component entry of the current profile, or None if profiling is
+        off or nothing was recorded for the component
+    """
+    if _profile is None:
+        return None
+    return _profile["components"].get(component_name)
+
+
+def build_profile_report(profile: Dict[str, Any], total_seconds: float) -> Dict[str, Any]:
+    """Build the report of a profile.
+
+    Args:
+        profile: The profile returned by `start_profile`
+        total_seconds: The wall time of the profiled run
+
+    Returns:
+        A dictionary with the total time, the time per phase and the time per
+        phase of each component, slowest components first
+    """
+    from spec_generator import __version__
+
+    def ordered(phases: Dict[str, float]) -> Dict[str, float]:
+        names = [p for p in PHASES if p in phases] + sorted(p for p in phases if p not in PHASES)
+        return {name: round(phases[name], 6) for name in names}
+
+    components = sorted(profile["components"].items(), key=lambda item: -item[1]["seconds"])
+    return {
+        "generator_version": __version__,
+        "total_seconds": round(total_seconds, 6),
+        "phases": ordered(profile["phases"]),
+        "components": {
+            name: {"seconds": round(entry["seconds"], 6), "phases": ordered(entry["phases"])}
+            for name, entry in components
+        },
+    }
+
+
+def save_profile_report(report: Dict[str, Any], report_path: str) -> str:
+    """Save a profile report as JSON.
+
+    Args:
+        report: The report returned by `stop_profile`
+        report_path: The path of the file to write
+
+    Returns:
+        The path to the saved report
+    """
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return report_path
+
+
+def _record(phase: str, seconds: float) -> None:
+    """Add time to a phase of the run and of the current component."""
+    _profile["phases"][phase] = _profile["phases"].get(phase, 0.0) + seconds
+    if _component is not None:
+        phases = _profile["components"][_component]["phases"]
+        phases[phase] = phases.get(phase, 0.0) + seconds
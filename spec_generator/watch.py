@@ -0,0 +1,214 @@
+"""
+Watch mode that regenerates specs when component sources change.
+
+A reverse index maps every source file to the components whose specs were
+extracted from it: the file each component is defined in, plus the modules
+of its base classes and subcomponents recorded in the manifest. The files
+are polled for modification time changes and only the affected components
+are re-extracted.
+
+The files the component index was built from (the lazy-loader maps of the
+`__init__.py` files and the `.pyi` stubs of the namespace packages) are
+watched too, and so are every module under `reflex/components` and every
+page of the library docs, including files created while watching. When one
+of them changes without being the source of a spec (an exported name, a
+`Literal` alias or the frontmatter of a doc page), the component mappings
+are rebuilt and every component is checked against the manifest, so added,
+removed or re-pointed components and new doc paths are picked up.
+"""
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Set
+
+from spec_generator.docs_index import get_docs_dir
+from spec_generator.extraction.literal_aliases import get_components_dir
+from spec_generator.output import generate_spec_files
+from spec_generator.output.manifest import load_manifest
+from spec_generator.mapping import get_component_index_path
+from spec_generator.mapping.index import load_component_index_cache
+
+
+def build_source_index(
+    component_mappings: Dict[str, Dict[str, str]],
+    manifest: Dict[str, Dict[str, Any]],
+) -> Dict[str, Set[str]]:
+    """Map each source file to the components whose specs depend on it.
+
+    Args:
+        component_mappings: The component mappings from `find_all_components`
+        manifest: A dictionary of component names to manifest entries
+
+    Returns:
+        A dictionary of resolved source file paths to component names
+    """
+    source_index: Dict[str, Set[str]] = {}
+
+    for component_name, mapping in component_mappings.items():
+        paths = {str(Path(mapping['file_path']).resolve())}
+        paths.update(manifest.get(component_name, {}).get("sources", {}))
+        for path in paths:
+            source_index.setdefault(path, set()).add(component_name)
+
+    return source_index
+
+
+def get_index_sources(specs_dir: str) -> Set[str]:
+    """Get the files the cached component index was built from.
+
+    Args:
+        specs_dir: The directory the specs are saved to
+
+    Returns:
+        The resolved paths of the files read to build the component index,
+        empty if the index is not cached
+    """
+    cached = load_component_index_cache(get_component_index_path(specs_dir)) or {}
+    return {str(Path(path).resolve()) for path in cached.get("sources", {})}
+
+
+def list_watched_files(base_dir: str) -> Set[str]:
+    """Get the component modules and documentation pages of the codebase.
+
+    Args:
+        base_dir: The base directory of the Reflex codebase
+
+    Returns:
+        The resolved paths of the `.py` and `.pyi` files under the
+        components directory and of the `.md` files under the docs directory
+    """
+    paths = set()
+    for directory, suffixes in (
+        (get_components_dir(base_dir), ('.py', '.pyi')),
+        (get_docs_dir(base_dir), ('.md',)),
+    ):
+        for root, dirs, filenames in os.walk(directory):
+            for filename in filenames:
+                if filename.endswith(suffixes):
+                    paths.add(str(Path(root, filename).resolve()))
+    return paths
+
+
+def get_source_mtimes(source_index: Dict[str, Set[str]]) -> Dict[str, Optional[int]]:
+    """Get the modification times of the indexed source files.
+
+    Args:
+        source_index: The index returned by `build_source_index`, or any
+            collection of source file paths
+
+    Returns:
+        A dictionary of source file paths to their modification time in
+        nanoseconds, or None if the file does not exist
+    """
+    mtimes = {}
+    for path in source_index:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def watch_spec_files(
+    base_dir: str = None,
+    specs_dir: str = 'specs',
+    interval: float = 0.5,
+    jobs: int = 1,
+    normalized: bool = False,
+    runtime: bool = False,
+    incremental: bool = True,
+) -> None:
+    """Generate the spec files, then regenerate them as their sources change.
+
+    Runs until interrupted with Ctrl+C.
+
+    Args:
+        base_dir: The base directory of the Reflex codebase
+        specs_dir: The directory to save specs to
+        interval: The number of seconds between polls of the source files
+        jobs: The number of worker processes to extract specs with
+        normalized: Save specs in the normalized format
+        runtime: Complete the statically extracted fields with the ones found
+            at runtime, see `generate_spec_files`
+        incremental: Skip the unchanged components in the first generation;
+            the regenerations are always incremental
+    """
+    if base_dir is None:
+        base_dir = os.getcwd()
+
+    generate_spec_files(
+        base_dir,
+        specs_dir,
+        incremental=incremental,
+        jobs=jobs,
+        normalized=normalized,
+        runtime=runtime,
+    )
+
+    from spec_generator.discovery import find_all_components
+
+    def load_sources():
+        # The component index is cached, so this only reparses the package
+        # files when one of them changed.
+        component_mappings = find_all_components(base_dir, get_component_index_path(specs_dir))
+        source_index = build_source_index(component_mappings, load_manifest(specs_dir))
+        index_sources = get_index_sources(specs_dir)
+        for path in index_sources | list_watched_files(base_dir):
+            source_index.setdefault(path, set())
+        return source_index, index_sources
+
+    def poll_mtimes():
+        # Files created since the last poll are listed too
+        return get_source_mtimes(set(source_index) | list_watched_files(base_dir))
+
+    source_index, index_sources = load_sources()
+    mtimes = poll_mtimes()
+
+    print(f"\nWatching {len(source_index)} source files for changes (press Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(interval)
+
+            current_mtimes = poll_mtimes()
+            changed_paths = sorted(
+                path for path, mtime in current_mtimes.items() if mtime != mtimes.get(path)
+            )
+            if not changed_paths:
+                continue
+
+            affected: Optional[Set[str]] = set()
+            for path in changed_paths:
+                print(f"\nChanged: {path}")
+                affected |= source_index.get(path, set())
+            if index_sources.intersection(changed_paths) or not all(
+                source_index.get(path) for path in changed_paths
+            ):
+                # The exported components, the Literal aliases or the doc
+                # pages may have changed, so all the components are checked
+                # against the manifest with the new mappings.
+                print("Regenerating: components whose inputs changed")
+                affected = None
+            else:
+                print(f"Regenerating: {', '.join(sorted(affected))}")
+
+            start = time.perf_counter()
+            generate_spec_files(
+                base_dir,
+                specs_dir,
+                incremental=True,
+                jobs=jobs,
+                normalized=normalized,
+                components=affected,
+                runtime=runtime,
+            )
+            print(f"Updated specs in {time.perf_counter() - start:.2f}s")
+
+            # Base classes and exported components may have been added or
+            # removed. Files that changed again during the regeneration keep
+            # their old time so the next poll picks them up.
+            source_index, index_sources = load_sources()
+            new_mtimes = poll_mtimes()
+            mtimes = {path: current_mtimes.get(path, mtime) for path, mtime in new_mtimes.items()}
+    except KeyboardInterrupt:
+        print("\nStopped watching")
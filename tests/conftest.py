@@ -0,0 +1,169 @@
+"""Fixtures of the spec generator tests."""
+import contextlib
+import io
+import os
+import re
+import sys
+import textwrap
+from pathlib import Path
+from typing import List
+
+import pytest
+
+# The tests import the generator from the repository, like generate_specs_reflex.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# The Reflex codebase checked in next to the generator
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# The files of a minimal Reflex codebase, relative to its base directory
+REFLEX_TREE = {
+    "reflex/reflex/__init__.py": '''
+        _MAPPING: dict = {
+            "components.widgets.button": ["button"],
+            "components.widgets.group": ["group"],
+        }
+    ''',
+    "reflex/reflex/components/__init__.py": "",
+    "reflex/reflex/components/component.py": '''
+        class Component:
+            """The base component."""
+    ''',
+    "reflex/reflex/components/widgets/__init__.py": "",
+    "reflex/reflex/components/widgets/base.py": '''
+        from typing import Literal
+
+        from reflex.components.component import Component
+        from reflex.vars.base import Var
+
+        LiteralSize = Literal["1", "2", "3"]
+
+
+        class Widget(Component):
+            """A widget."""
+
+            # The size of the widget.
+            size: Var[LiteralSize]
+
+            # Whether the widget is disabled.
+            disabled: Var[bool]
+    ''',
+    "reflex/reflex/components/widgets/button.py": '''
+        from reflex.vars.base import Var
+
+        from .base import Widget
+
+
+        class Button(Widget):
+            """A button."""
+
+            # The label of the button.
+            label: Var[str]
+
+            @classmethod
+            def create(cls, *children, **props):
+                """Create a button."""
+                text: str = props.pop("text", "")
+                return super().create(text, *children, **props)
+
+
+        button = Button.create
+    ''',
+    "reflex/reflex/components/widgets/group.py": '''
+        from types import SimpleNamespace
+
+        from reflex.vars.base import Var
+
+        from .base import Widget
+
+
+        class GroupRoot(Widget):
+            """The root of a group."""
+
+            # The spacing of the items.
+            spacing: Var[int]
+
+
+        class GroupItem(Widget):
+            """An item of a group."""
+
+            # The value of the item.
+            value: Var[str]
+
+
+        class Group(SimpleNamespace):
+            """Group components namespace."""
+
+            root = staticmethod(GroupRoot.create)
+            item = staticmethod(GroupItem.create)
+
+
+        group = Group()
+    ''',
+    "reflex/docs/library/forms/button.md": '''
+        ---
+        components:
+          - rx.button
+        ---
+
+        # Button
+    ''',
+}
+
+
+def write_file(path: Path, content: str):
+    """Write a file of the test codebase, with a new modification time.
+
+    Args:
+        path: The path of the file
+        content: The content of the file, dedented
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(content).lstrip())
+    # Make sure the change is visible even on filesystems with coarse timestamps
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def generate(base_dir: Path, specs_dir: Path, **kwargs) -> List[str]:
+    """Generate the specs of a codebase, keeping the output quiet.
+
+    Args:
+        base_dir: The base directory of the codebase
+        specs_dir: The directory to save specs to
+        **kwargs: The other arguments of `generate_spec_files`
+
+    Returns:
+        The names of the components whose specs were extracted, in order
+    """
+    from spec_generator import generate_spec_files
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        generate_spec_files(str(base_dir), str(specs_dir), **kwargs)
+    return get_processed_components(output.getvalue())
+
+
+def get_processed_components(output: str) -> List[str]:
+    """Get the components the generator extracted from its output.
+
+    Args:
+        output: The printed output of the generator
+
+    Returns:
+        The names of the components whose specs were extracted, in order
+    """
+    return re.findall(r"^Processing component: (.+)$", output, re.MULTILINE)
+
+
+@pytest.fixture
+def reflex_tree(tmp_path: Path) -> Path:
+    """Create a minimal Reflex codebase.
+
+    Returns:
+        The base directory of the codebase
+    """
+    base_dir = tmp_path / "codebase"
+    for relative_path, content in REFLEX_TREE.items():
+        write_file(base_dir / relative_path, content)
+    return base_dir
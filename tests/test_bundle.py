@@ -0,0 +1,55 @@
+"""Tests of the spec bundle and its reader."""
+import json
+
+import pytest
+from conftest import generate
+
+from spec_generator import SpecBundle
+from spec_generator.output.bundle import get_bundle_path, write_spec_bundle
+
+
+def test_bundle_holds_the_spec_files(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    with SpecBundle(get_bundle_path(str(specs_dir))) as bundle:
+        assert bundle.components() == ["ag_grid", "button", "group"]
+        assert len(bundle) == 3
+        for name in bundle.components():
+            assert bundle.get(name) == json.loads((specs_dir / f"{name}.json").read_text())
+        assert "select" not in bundle
+        assert bundle.get("select") is None
+
+
+def test_bundle_index_includes_inherited_fields(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    with SpecBundle(get_bundle_path(str(specs_dir))) as bundle:
+        assert bundle.components_with_prop("label") == ["button"]
+        # Inherited from the widget base class
+        assert bundle.components_with_prop("disabled") == ["button"]
+        assert bundle.components_with_prop("size") == ["button"]
+        assert bundle.components_with_prop("missing") == []
+
+
+def test_bundle_round_trip(tmp_path):
+    specs = {
+        "text": {"name": "text", "docstring": "Texte ☃", "properties": [{"name": "as_child"}], "event_names": []},
+        "box": {"name": "box", "properties": [], "event_names": ["on_click"], "inherited_event_names": ["on_blur"]},
+    }
+    bundle_path = write_spec_bundle(specs, str(tmp_path / "specs.bundle"))
+
+    with SpecBundle(bundle_path) as bundle:
+        assert bundle.components() == ["box", "text"]
+        assert bundle.get("text") == specs["text"]
+        assert bundle.components_with_event("on_blur") == ["box"]
+        assert bundle.components_with_prop("as_child") == ["text"]
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "specs.bundle"
+    path.write_bytes(b"{}")
+
+    with pytest.raises(ValueError, match="Not a spec bundle"):
+        SpecBundle(str(path))
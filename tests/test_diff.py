@@ -0,0 +1,144 @@
+"""Tests of the comparison of two sets of specs."""
+import json
+import sys
+
+import pytest
+
+from conftest import generate, write_file
+
+from spec_generator import diff as diff_module
+from spec_generator.cli import main
+from spec_generator.diff import diff_spec_sets, format_changelog
+from spec_generator.output.bundle import SpecBundle, get_bundle_path
+from spec_generator.output.manifest import hash_spec, load_manifest
+
+NEW_BUTTON_MODULE = '''
+    from reflex.vars.base import Var
+
+    from .base import Widget
+
+
+    class Button(Widget):
+        """A button."""
+
+        # The label of the button.
+        label: Var[int]
+
+        # The icon of the button.
+        icon: Var[str]
+
+
+    button = Button.create
+'''
+
+
+@pytest.fixture
+def spec_sets(reflex_tree, tmp_path):
+    """Generate the specs of the codebase before and after some changes.
+
+    Returns:
+        The old and new specs directories
+    """
+    old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+    generate(reflex_tree, old_dir)
+
+    widgets_dir = reflex_tree / "reflex/reflex/components/widgets"
+    write_file(widgets_dir / "button.py", NEW_BUTTON_MODULE)
+    base_path = widgets_dir / "base.py"
+    write_file(base_path, base_path.read_text().replace('Literal["1", "2", "3"]', 'Literal["1", "2", "4"]'))
+    init_path = reflex_tree / "reflex/reflex/__init__.py"
+    write_file(init_path, init_path.read_text().replace('"components.widgets.group": ["group"],', ""))
+    generate(reflex_tree, new_dir)
+    return old_dir, new_dir
+
+
+EXPECTED_BUTTON_DELTA = {
+    "props": {
+        "added": ["icon"],
+        "type_changed": {"label": {"old": "Var[str]", "new": "Var[int]"}},
+        "values_changed": {"size": {"added": ["4"], "removed": ["3"]}},
+    },
+}
+
+
+def test_diff_of_specs_directories(spec_sets):
+    old_dir, new_dir = spec_sets
+
+    diff = diff_spec_sets(str(old_dir), str(new_dir))
+    assert diff == {
+        "old": str(old_dir),
+        "new": str(new_dir),
+        "added": [],
+        "removed": ["group"],
+        "changed": {"button": EXPECTED_BUTTON_DELTA},
+        "unchanged": 1,
+    }
+
+
+def test_only_specs_with_different_hashes_are_loaded(spec_sets, monkeypatch):
+    old_dir, new_dir = spec_sets
+    loaded = []
+    get_spec = diff_module._SpecSource.get
+
+    def record_get(source, component_name):
+        loaded.append(component_name)
+        return get_spec(source, component_name)
+
+    monkeypatch.setattr(diff_module._SpecSource, "get", record_get)
+    diff_spec_sets(str(old_dir), get_bundle_path(str(new_dir)))
+    assert loaded == ["button", "button"]
+
+
+def test_bundles_and_directories_record_the_same_hashes(spec_sets):
+    old_dir, new_dir = spec_sets
+
+    for specs_dir in (old_dir, new_dir):
+        manifest = load_manifest(str(specs_dir))
+        with SpecBundle(get_bundle_path(str(specs_dir))) as bundle:
+            for component_name, entry in manifest.items():
+                spec = json.loads((specs_dir / entry["spec_file"]).read_text())
+                assert entry["spec_hash"] == bundle.get_hash(component_name) == hash_spec(spec)
+
+    diff = diff_spec_sets(get_bundle_path(str(old_dir)), get_bundle_path(str(new_dir)))
+    assert diff["changed"] == {"button": EXPECTED_BUTTON_DELTA}
+    assert diff["removed"] == ["group"]
+
+
+def test_changelog(spec_sets):
+    old_dir, new_dir = spec_sets
+
+    changelog = format_changelog(diff_spec_sets(str(old_dir), str(new_dir)))
+    assert changelog == "\n".join([
+        f"# Spec changes from {old_dir} to {new_dir}",
+        "",
+        "Removed components: group",
+        "Changed components: 1, unchanged: 1",
+        "",
+        "## button",
+        "",
+        "- Added prop `icon`",
+        "- Prop `label` type changed from `Var[str]` to `Var[int]`",
+        "- Prop `size` values: added `4`; removed `3`",
+        "",
+    ])
+
+
+def test_diff_command(spec_sets, tmp_path, monkeypatch, capsys):
+    old_dir, new_dir = spec_sets
+
+    monkeypatch.setattr(sys, "argv", ["generate_specs_reflex.py", "--diff", str(old_dir), str(new_dir)])
+    main()
+    assert json.loads(capsys.readouterr().out) == diff_spec_sets(str(old_dir), str(new_dir))
+
+    changelog_path = tmp_path / "CHANGES.md"
+    monkeypatch.setattr(sys, "argv", [
+        "generate_specs_reflex.py", "--diff", str(old_dir), str(new_dir),
+        "--changelog", "--diff-output", str(changelog_path),
+    ])
+    main()
+    assert capsys.readouterr().out == f"Spec changes saved to: {changelog_path}\n"
+    assert changelog_path.read_text() == format_changelog(diff_spec_sets(str(old_dir), str(new_dir)))
+
+    monkeypatch.setattr(sys, "argv", ["generate_specs_reflex.py", "--diff", str(old_dir), str(tmp_path / "missing")])
+    main()
+    assert capsys.readouterr().out.startswith("Error: Not a specs directory or bundle")
@@ -0,0 +1,92 @@
+"""Tests of the discovery of the components exported by the Reflex package."""
+import json
+
+from conftest import REPO_DIR, generate, write_file
+
+from spec_generator import SpecLoader
+from spec_generator.mapping.index import build_component_index
+from spec_generator.output.bundle import SpecBundle, write_spec_bundle
+
+TOGGLE_MODULE = '''
+    from reflex.components.component import ComponentNamespace
+    from reflex.vars.base import Var
+
+    from .base import Widget
+
+
+    class ToggleRoot(Widget):
+        """The root of a toggle."""
+
+        # Whether the toggle is pressed.
+        pressed: Var[bool]
+
+
+    class ToggleIndicator(Widget):
+        """The indicator of a toggle."""
+
+        # The color of the indicator.
+        color: Var[str]
+
+
+    class Toggle(ComponentNamespace):
+        """Toggle components namespace."""
+
+        root = __call__ = staticmethod(ToggleRoot.create)
+        indicator = staticmethod(ToggleIndicator.create)
+
+
+    toggle = Toggle()
+'''
+
+
+def add_toggle(base_dir):
+    """Add a callable component namespace to the codebase."""
+    write_file(base_dir / "reflex/reflex/components/component.py", '''
+        class Component:
+            """The base component."""
+
+
+        class ComponentNamespace:
+            """A namespace of components."""
+    ''')
+    write_file(base_dir / "reflex/reflex/components/widgets/toggle.py", TOGGLE_MODULE)
+    init_path = base_dir / "reflex/reflex/__init__.py"
+    write_file(init_path, init_path.read_text().replace(
+        '"components.widgets.group": ["group"],',
+        '"components.widgets.group": ["group"],\n    "components.widgets.toggle": ["toggle"],',
+    ))
+
+
+def test_namespaces_are_indexed(reflex_tree):
+    index = build_component_index(str(reflex_tree))
+
+    assert index["button"]["class_name"] == "Button"
+    assert index["group"]["class_name"] == "Group"
+    assert "namespace_class" not in index["group"]
+
+
+def test_callable_namespaces_resolve_to_the_component_they_create(reflex_tree, tmp_path):
+    add_toggle(reflex_tree)
+
+    entry = build_component_index(str(reflex_tree))["toggle"]
+    assert entry["class_name"] == "ToggleRoot"
+    assert entry["namespace_class"] == "Toggle"
+
+    generate(reflex_tree, tmp_path / "specs")
+    spec = json.loads((tmp_path / "specs" / "toggle.json").read_text())
+    assert spec["docstring"] == "The root of a toggle."
+    assert [prop["name"] for prop in spec["properties"]] == ["pressed"]
+    assert {prop["name"] for prop in spec["inherited_properties"]} == {"disabled"}
+    assert {prop["name"] for prop in spec["inherited_styling_props"]} == {"size"}
+    assert list(spec["subcomponents"]) == ["ToggleRoot", "ToggleIndicator"]
+
+
+def test_legacy_names_load_the_renamed_specs(tmp_path):
+    loader = SpecLoader(str(REPO_DIR / "specs"))
+    assert not (REPO_DIR / "specs" / "areachart.json").exists()
+    assert loader.get("areachart") == loader.get("recharts.area_chart") is not None
+    assert loader.get("Fragment") == loader.get("fragment") is not None
+
+    bundle_path = write_spec_bundle({"fragment": loader.get("fragment")}, str(tmp_path / "specs.bundle"))
+    with SpecBundle(bundle_path) as bundle:
+        assert bundle.get("Fragment") == loader.get("fragment")
@@ -0,0 +1,75 @@
+"""Tests of the index of the documentation pages."""
+from conftest import write_file
+
+from spec_generator import docs_index
+from spec_generator.docs_index import build_docs_index, get_component_name, parse_frontmatter_components
+
+
+def test_frontmatter_entries_are_converted_to_spec_names():
+    frontmatter = """
+components:
+  - rx.button
+  - rx.alert_dialog.root
+  - rx.recharts.AreaChart
+  - rx.recharts.XAxis
+  - rx.el.H1
+  - rx.el.Del
+  - rx.button
+only_low_level:
+  - rx.select
+"""
+    assert parse_frontmatter_components(frontmatter) == [
+        "button",
+        "alert_dialog.root",
+        "recharts.area_chart",
+        "recharts.x_axis",
+        "el.h1",
+        "el.del_",
+    ]
+
+
+def test_component_names():
+    assert get_component_name("radial_bar_chart") == "radial_bar_chart"
+    assert get_component_name("recharts.RadialBarChart") == "recharts.radial_bar_chart"
+    assert get_component_name("el.A") == "el.a"
+
+
+def test_namespace_members_document_their_namespace(tmp_path):
+    docs_dir = tmp_path / "reflex/docs/library"
+    write_file(docs_dir / "a_overlay/dialog.md", "---\ncomponents:\n  - rx.dialog.root\n  - rx.dialog.content\n---\n")
+    write_file(docs_dir / "b_charts/area.md", "---\ncomponents:\n  - rx.recharts.AreaChart\n---\n")
+    write_file(docs_dir / "c_other/recharts.md", "---\ncomponents:\n  - rx.recharts\n---\n")
+
+    index = build_docs_index(str(docs_dir), relative_to=str(tmp_path))
+
+    assert index == {
+        "dialog": "reflex/docs/library/a_overlay/dialog.md",
+        "dialog.root": "reflex/docs/library/a_overlay/dialog.md",
+        "dialog.content": "reflex/docs/library/a_overlay/dialog.md",
+        "recharts.area_chart": "reflex/docs/library/b_charts/area.md",
+        # Named by a page of its own, which wins over the pages of its members
+        "recharts": "reflex/docs/library/c_other/recharts.md",
+    }
+
+
+def test_unchanged_pages_are_not_read_again(tmp_path, monkeypatch):
+    docs_dir = tmp_path / "docs"
+    cache_path = str(tmp_path / "specs" / ".docs_index.json")
+    write_file(docs_dir / "button.md", "---\ncomponents:\n  - rx.button\n---\n")
+    write_file(docs_dir / "badge.md", "---\ncomponents:\n  - rx.badge\n---\n")
+    build_docs_index(str(docs_dir), cache_path)
+
+    scanned = []
+    scan_doc_file = docs_index.scan_doc_file
+    monkeypatch.setattr(docs_index, "scan_doc_file", lambda path: scanned.append(path) or scan_doc_file(path))
+    write_file(docs_dir / "badge.md", "---\ncomponents:\n  - rx.badge\n  - rx.el.Span\n---\n")
+
+    index = build_docs_index(str(docs_dir), cache_path)
+
+    assert scanned == [str(docs_dir / "badge.md")]
+    assert index == {
+        "badge": str(docs_dir / "badge.md"),
+        "el": str(docs_dir / "badge.md"),
+        "el.span": str(docs_dir / "badge.md"),
+        "button": str(docs_dir / "button.md"),
+    }
@@ -0,0 +1,53 @@
+"""Tests of the extraction of component specs from the AST class index."""
+import json
+
+from conftest import generate, write_file
+
+
+def test_props_of_the_component_class(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    spec = json.loads((specs_dir / "button.json").read_text())
+    assert spec["docstring"] == "A button."
+    assert spec["bases"] == ["Widget"]
+    # The annotated local variable of `create` is not a prop
+    assert spec["properties"] == [
+        {"name": "label", "type": "Var[str]", "description": "The label of the button."},
+    ]
+
+
+def test_inherited_props_name_their_class(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    spec = json.loads((specs_dir / "button.json").read_text())
+    widget = "reflex.components.widgets.base.Widget"
+    assert spec["inherited_properties"] == [
+        {
+            "name": "disabled",
+            "type": "Var[bool]",
+            "description": "Whether the widget is disabled.",
+            "inherited_from": widget,
+        },
+    ]
+    assert [(prop["name"], prop["inherited_from"]) for prop in spec["inherited_styling_props"]] == [("size", widget)]
+
+
+def test_redeclared_props_are_not_inherited(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    button_path = reflex_tree / "reflex/reflex/components/widgets/button.py"
+    write_file(
+        button_path,
+        button_path.read_text().replace(
+            "    label: Var[str]\n",
+            "    label: Var[str]\n\n    # Whether the button is disabled.\n    disabled: Var[bool]\n",
+        ),
+    )
+
+    generate(reflex_tree, specs_dir)
+
+    spec = json.loads((specs_dir / "button.json").read_text())
+    assert [prop["name"] for prop in spec["properties"]] == ["label", "disabled"]
+    assert spec["properties"][1]["description"] == "Whether the button is disabled."
+    assert spec["inherited_properties"] == []
@@ -0,0 +1,53 @@
+"""Tests of the incremental regeneration of specs."""
+import json
+
+from conftest import generate, write_file
+
+
+def test_unchanged_components_are_skipped(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    assert generate(reflex_tree, specs_dir) == ["button", "group", "ag_grid"]
+    assert generate(reflex_tree, specs_dir) == []
+
+
+def test_changed_source_regenerates_its_components(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    button_path = reflex_tree / "reflex/reflex/components/widgets/button.py"
+    write_file(button_path, button_path.read_text().replace("# The label of the button.", "# The text."))
+
+    assert "group" not in generate(reflex_tree, specs_dir)
+    spec = json.loads((specs_dir / "button.json").read_text())
+    assert spec["properties"][0]["description"] == "The text."
+
+
+def test_changed_base_class_regenerates_subclasses(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    base_path = reflex_tree / "reflex/reflex/components/widgets/base.py"
+    write_file(base_path, base_path.read_text().replace('"1", "2", "3"', '"1", "2"'))
+
+    assert {"button", "group"} <= set(generate(reflex_tree, specs_dir))
+    spec = json.loads((specs_dir / "button.json").read_text())
+    size = next(prop for prop in spec["inherited_styling_props"] if prop["name"] == "size")
+    assert size["values"] == ["1", "2"]
+
+
+def test_new_export_is_generated(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    init_path = reflex_tree / "reflex/reflex/__init__.py"
+    write_file(init_path, init_path.read_text().replace('["button"]', '["button", ("button", "action")]'))
+
+    assert "action" in generate(reflex_tree, specs_dir)
+    assert (specs_dir / "action.json").exists()
+
+
+def test_force_regenerates_everything(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    assert generate(reflex_tree, specs_dir, incremental=False) == ["button", "group", "ag_grid"]
@@ -0,0 +1,123 @@
+"""Tests of the table of the Literal aliases of the component modules."""
+import json
+
+from conftest import generate, write_file
+
+from spec_generator.extraction.literal_aliases import (
+    collect_literal_aliases,
+    get_components_dir,
+    get_type_mappings,
+)
+
+THEME_MODULE = '''
+    from typing import Literal
+
+    LiteralColor = Literal["red", "blue"]
+
+    # Nests another alias
+    LiteralTone = Literal[LiteralColor, "gray"]
+
+    LiteralPosition = Literal["top", "bottom"]
+'''
+
+LAYOUT_MODULE = '''
+    from typing import Literal
+
+    from .theme import LiteralTone
+
+    # Defined differently by the theme module
+    LiteralPosition = Literal["left", "right"]
+
+    # A plain alias of an imported alias
+    LiteralShade = LiteralTone
+'''
+
+BUTTON_MODULE = '''
+    from reflex.vars.base import Var
+
+    from .base import Widget
+    from .layout import LiteralPosition, LiteralShade
+    from .theme import LiteralTone
+
+
+    class Button(Widget):
+        """A button."""
+
+        # The tone of the button.
+        tone: Var[LiteralTone]
+
+        # The shade of the button.
+        shade: Var[LiteralShade]
+
+        # The position of the button.
+        position: Var[LiteralPosition]
+
+
+    button = Button.create
+'''
+
+
+def add_aliases(base_dir):
+    """Add modules defining and importing aliases to the codebase."""
+    widgets_dir = base_dir / "reflex/reflex/components/widgets"
+    write_file(widgets_dir / "theme.py", THEME_MODULE)
+    write_file(widgets_dir / "layout.py", LAYOUT_MODULE)
+    write_file(widgets_dir / "button.py", BUTTON_MODULE)
+
+
+def get_prop_values(spec):
+    """Get the values of the props of a spec, own and inherited, by name."""
+    return {
+        prop["name"]: prop.get("values")
+        for field in ("properties", "styling_props", "inherited_properties", "inherited_styling_props")
+        for prop in spec[field]
+    }
+
+
+def test_aliases_are_collected_per_module(reflex_tree):
+    add_aliases(reflex_tree)
+
+    aliases = collect_literal_aliases(get_components_dir(str(reflex_tree)))
+    assert aliases["LiteralSize"] == {"reflex.components.widgets.base": ["1", "2", "3"]}
+    assert aliases["LiteralTone"] == {"reflex.components.widgets.theme": ["red", "blue", "gray"]}
+    assert aliases["LiteralShade"] == {"reflex.components.widgets.layout": ["red", "blue", "gray"]}
+    assert aliases["LiteralPosition"] == {
+        "reflex.components.widgets.layout": ["left", "right"],
+        "reflex.components.widgets.theme": ["top", "bottom"],
+    }
+
+
+def test_ambiguous_names_are_qualified_in_the_type_mappings(reflex_tree):
+    add_aliases(reflex_tree)
+
+    type_mappings = get_type_mappings(collect_literal_aliases(get_components_dir(str(reflex_tree))))
+    assert type_mappings["LiteralTone"] == {"values": ["red", "blue", "gray"]}
+    assert "LiteralPosition" not in type_mappings
+    assert type_mappings["reflex.components.widgets.layout.LiteralPosition"] == {"values": ["left", "right"]}
+    assert type_mappings["reflex.components.widgets.theme.LiteralPosition"] == {"values": ["top", "bottom"]}
+
+
+def test_props_get_the_values_of_the_aliases_in_scope(reflex_tree, tmp_path):
+    add_aliases(reflex_tree)
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    values = get_prop_values(json.loads((specs_dir / "button.json").read_text()))
+    assert values["size"] == ["1", "2", "3"]
+    assert values["tone"] == ["red", "blue", "gray"]
+    assert values["shade"] == ["red", "blue", "gray"]
+    # The definition imported by the module of the prop is picked
+    assert values["position"] == ["left", "right"]
+
+
+def test_changed_aliases_update_the_specs(reflex_tree, tmp_path):
+    add_aliases(reflex_tree)
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    theme_path = reflex_tree / "reflex/reflex/components/widgets/theme.py"
+    write_file(theme_path, THEME_MODULE.replace('"red", "blue"', '"red", "green"'))
+    assert "button" in generate(reflex_tree, specs_dir)
+
+    values = get_prop_values(json.loads((specs_dir / "button.json").read_text()))
+    assert values["tone"] == ["red", "green", "gray"]
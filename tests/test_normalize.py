@@ -0,0 +1,43 @@
+"""Tests of the normalized spec format."""
+from pathlib import Path
+
+from conftest import REPO_DIR, generate
+
+from spec_generator import SpecLoader
+from spec_generator.output.manifest import load_manifest
+from spec_generator.output.normalize import SHARED_GROUPS_FILENAME
+
+
+def assert_same_specs(full_dir: Path, normalized_dir: Path):
+    """Check that the normalized specs expand to the full specs.
+
+    Args:
+        full_dir: The directory of the full specs
+        normalized_dir: The directory of the normalized specs
+    """
+    full_loader = SpecLoader(str(full_dir))
+    normalized_loader = SpecLoader(str(normalized_dir))
+    names = list(load_manifest(str(full_dir)))
+    assert names
+    for name in names:
+        assert normalized_loader.get(name) == full_loader.get(name), name
+
+
+def test_normalized_specs_expand_to_full_specs(tmp_path):
+    generate(REPO_DIR, tmp_path / "full")
+    generate(REPO_DIR, tmp_path / "normalized", normalized=True)
+
+    assert (tmp_path / "normalized" / SHARED_GROUPS_FILENAME).exists()
+    assert_same_specs(tmp_path / "full", tmp_path / "normalized")
+
+
+def test_lost_shared_groups_are_rebuilt(reflex_tree, tmp_path):
+    generate(reflex_tree, tmp_path / "full")
+    normalized_dir = tmp_path / "normalized"
+    generate(reflex_tree, normalized_dir, normalized=True)
+
+    (normalized_dir / SHARED_GROUPS_FILENAME).unlink()
+    assert {"button", "group"} <= set(generate(reflex_tree, normalized_dir, normalized=True))
+
+    assert_same_specs(tmp_path / "full", normalized_dir)
+
@@ -0,0 +1,46 @@
+"""Tests of the extraction of specs over worker processes."""
+from pathlib import Path
+
+from conftest import REPO_DIR, generate
+
+from spec_generator.output import writer
+
+
+def read_files(directory: Path) -> dict:
+    """Read every file of a directory.
+
+    Args:
+        directory: The directory to read
+
+    Returns:
+        A dictionary of relative paths to file contents
+    """
+    return {
+        str(path.relative_to(directory)): path.read_bytes()
+        for path in sorted(directory.rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_parallel_output_matches_sequential_output(tmp_path, monkeypatch):
+    generate(REPO_DIR, tmp_path / "sequential")
+
+    # Start the workers even on machines with a single CPU
+    monkeypatch.setattr(writer, "get_effective_jobs", lambda jobs, num_components: jobs)
+    parallel_runs = []
+    extract_parallel = writer.extract_component_specs_parallel
+
+    def record_parallel_run(components, jobs, *args):
+        parallel_runs.append((len(components), jobs))
+        return extract_parallel(components, jobs, *args)
+
+    monkeypatch.setattr(writer, "extract_component_specs_parallel", record_parallel_run)
+    processed = generate(REPO_DIR, tmp_path / "parallel", jobs=2)
+
+    assert parallel_runs == [(len(processed), 2)]
+    assert read_files(tmp_path / "parallel") == read_files(tmp_path / "sequential")
+
+
+def test_effective_jobs_need_enough_components():
+    assert writer.get_effective_jobs(8, writer.MIN_COMPONENTS_PER_JOB - 1) == 1
+    assert writer.get_effective_jobs(1, 10 * writer.MIN_COMPONENTS_PER_JOB) == 1
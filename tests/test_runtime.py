@@ -0,0 +1,114 @@
+"""Tests of the runtime introspection mode."""
+import json
+
+from conftest import generate, write_file
+
+from spec_generator.extraction import runtime
+
+# Stand-ins for the reflex modules the components of the test codebase import
+RUNTIME_FILES = {
+    "reflex/reflex/vars/__init__.py": "",
+    "reflex/reflex/vars/base.py": '''
+        from typing import Generic, TypeVar
+
+        T = TypeVar("T")
+
+
+        class Var(Generic[T]):
+            """A var."""
+    ''',
+    "reflex/reflex/event.py": '''
+        class EventHandler:
+            """An event handler."""
+    ''',
+    "reflex/reflex/components/component.py": '''
+        class Field:
+            """A field of a component class."""
+
+            def __init__(self, annotation, required=False):
+                self.annotation = annotation
+                self.outer_type_ = annotation
+                self.required = required
+
+
+        class Component:
+            """The base component."""
+
+            @classmethod
+            def get_fields(cls):
+                fields = {"id": Field(str)}
+                for klass in reversed(cls.__mro__[:-2]):
+                    for name, annotation in vars(klass).get("__annotations__", {}).items():
+                        fields[name] = Field(annotation, required=name == "label")
+                return fields
+
+            @classmethod
+            def get_props(cls):
+                return set(cls.get_fields())
+
+            @classmethod
+            def construct(cls):
+                return cls.__new__(cls)
+
+            def get_event_triggers(self):
+                return {"on_click": None}
+
+            @classmethod
+            def create(cls, *children, **props):
+                return cls()
+    ''',
+}
+
+
+def test_runtime_fields_complete_the_specs(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    for relative_path, content in RUNTIME_FILES.items():
+        write_file(reflex_tree / relative_path, content)
+
+    generate(reflex_tree, specs_dir, runtime=True)
+
+    spec = json.loads((specs_dir / "button.json").read_text())
+    assert spec["properties"] == [
+        {"name": "label", "type": "Var[str]", "description": "The label of the button.", "required": True},
+        {"name": "id", "type": "str", "description": "", "runtime": True},
+    ]
+    assert spec["event_names"] == ["on_click"]
+    cache = json.loads((specs_dir / ".runtime_cache.json").read_text())
+    assert list(cache["modules"]) == [
+        "reflex.components.widgets.button",
+        "reflex.components.widgets.group",
+    ]
+
+
+def test_runtime_results_are_cached(reflex_tree, tmp_path, monkeypatch):
+    specs_dir = tmp_path / "specs"
+    for relative_path, content in RUNTIME_FILES.items():
+        write_file(reflex_tree / relative_path, content)
+    generate(reflex_tree, specs_dir, runtime=True)
+
+    introspected = []
+    run_worker = runtime.run_introspection_worker
+
+    def record_worker_run(module_names, sys_paths):
+        introspected.append(module_names)
+        return run_worker(module_names, sys_paths)
+
+    monkeypatch.setattr(runtime, "run_introspection_worker", record_worker_run)
+    button_path = reflex_tree / "reflex/reflex/components/widgets/button.py"
+    write_file(button_path, button_path.read_text().replace("# The label of the button.", "# The text."))
+
+    assert generate(reflex_tree, specs_dir, runtime=True) == ["button"]
+    assert introspected == [["reflex.components.widgets.button"]]
+    spec = json.loads((specs_dir / "button.json").read_text())
+    assert spec["properties"][0]["required"] is True
+
+
+def test_failed_import_falls_back_to_the_static_specs(reflex_tree, tmp_path):
+    # The test codebase does not define the modules its components import
+    generate(reflex_tree, tmp_path / "static")
+    generate(reflex_tree, tmp_path / "runtime", runtime=True)
+
+    for name in ("button", "group"):
+        static = json.loads((tmp_path / "static" / f"{name}.json").read_text())
+        runtime = json.loads((tmp_path / "runtime" / f"{name}.json").read_text())
+        assert runtime == static
@@ -0,0 +1,96 @@
+"""Tests of the streaming generation of component specs."""
+import io
+import json
+import shutil
+
+from conftest import generate, write_file
+
+from spec_generator import iter_component_specs
+from spec_generator.output.stream import FileSpecSink, NDJSONSpecSink, generate_component_specs
+
+TOOLBAR_MODULE = '''
+    from reflex.vars.base import Var
+
+    from .base import LiteralShape, Widget
+
+
+    class Toolbar(Widget):
+        """A toolbar."""
+
+        # The shape of the toolbar.
+        shape: Var[LiteralShape]
+
+
+    toolbar = Toolbar.create
+'''
+
+
+def add_component(base_dir, module_name, content):
+    """Add a component module to the codebase and export it under the module name."""
+    write_file(base_dir / f"reflex/reflex/components/widgets/{module_name}.py", content)
+    init_path = base_dir / "reflex/reflex/__init__.py"
+    write_file(init_path, init_path.read_text().replace(
+        '"components.widgets.group": ["group"],',
+        f'"components.widgets.group": ["group"],\n    "components.widgets.{module_name}": ["{module_name}"],',
+    ))
+
+
+def test_streamed_specs_match_the_spec_files(reflex_tree, tmp_path):
+    specs_dir = tmp_path / "specs"
+    generate(reflex_tree, specs_dir)
+
+    names = []
+    for spec in iter_component_specs(str(reflex_tree)):
+        names.append(spec["name"])
+        assert spec == json.loads((specs_dir / f"{spec['name']}.json").read_text())
+    assert names == ["button", "group", "ag_grid"]
+
+    # Without a cache directory nothing is written
+    assert not list(reflex_tree.rglob("*.json"))
+
+
+def test_components_filter_accepts_legacy_names(reflex_tree, capsys):
+    add_component(reflex_tree, "fragment", '''
+        from reflex.components.component import Component
+
+
+        class Fragment(Component):
+            """A fragment."""
+
+
+        fragment = Fragment.create
+    ''')
+
+    specs = generate_component_specs(str(reflex_tree), components=["Fragment", "button", "missing"])
+    assert list(specs) == ["button", "fragment"]
+    assert capsys.readouterr().out == "Warning: Unknown component: missing\n"
+
+
+def test_sinks_receive_every_spec(reflex_tree, tmp_path):
+    stream = io.StringIO()
+    specs = list(iter_component_specs(str(reflex_tree), sink=NDJSONSpecSink(stream)))
+    assert [json.loads(line) for line in stream.getvalue().splitlines()] == specs
+
+    sink = FileSpecSink(str(tmp_path / "specs"))
+    for spec in iter_component_specs(str(reflex_tree), components={"button"}, sink=sink):
+        assert json.loads((tmp_path / "specs" / "button.json").read_text()) == spec
+    assert list(sink.paths) == ["button"]
+
+
+def test_interleaved_iterations_use_their_own_aliases(reflex_tree, tmp_path):
+    add_component(reflex_tree, "toolbar", TOOLBAR_MODULE)
+    other_tree = tmp_path / "other"
+    shutil.copytree(reflex_tree, other_tree)
+    for base_dir, shapes in ((reflex_tree, '"round", "square"'), (other_tree, '"pill"')):
+        base_path = base_dir / "reflex/reflex/components/widgets/base.py"
+        write_file(base_path, base_path.read_text() + f"\nLiteralShape = Literal[{shapes}]\n")
+
+    specs = iter_component_specs(str(reflex_tree), components={"button", "toolbar"})
+    assert next(specs)["name"] == "button"
+
+    # The other codebase is discovered before the toolbar of the first one is extracted
+    other_toolbar = next(iter_component_specs(str(other_tree), components={"toolbar"}))
+    toolbar = next(specs)
+
+    assert toolbar["properties"][0]["values"] == ["round", "square"]
+    assert other_toolbar["properties"][0]["values"] == ["pill"]
@@ -0,0 +1,97 @@
+"""Tests of the watch mode."""
+import contextlib
+import io
+import json
+import time
+from types import SimpleNamespace
+
+from conftest import get_processed_components, write_file
+
+from spec_generator import watch
+
+
+def run_watch(monkeypatch, base_dir, specs_dir, edits, **kwargs):
+    """Watch a codebase, making one edit before each poll until they run out.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture
+        base_dir: The base directory of the codebase
+        specs_dir: The directory to save specs to
+        edits: Functions editing the codebase
+        **kwargs: The other arguments of `watch_spec_files`
+
+    Returns:
+        The names of the components whose specs were extracted, in order
+    """
+    pending = list(edits)
+
+    def sleep(seconds):
+        if not pending:
+            raise KeyboardInterrupt
+        pending.pop(0)()
+
+    monkeypatch.setattr(watch, "time", SimpleNamespace(sleep=sleep, perf_counter=time.perf_counter))
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        watch.watch_spec_files(str(base_dir), str(specs_dir), **kwargs)
+    return get_processed_components(output.getvalue())
+
+
+def test_changed_source_regenerates_its_components(reflex_tree, tmp_path, monkeypatch):
+    specs_dir = tmp_path / "specs"
+    button_path = reflex_tree / "reflex/reflex/components/widgets/button.py"
+
+    def edit_button():
+        write_file(button_path, button_path.read_text().replace("# The label of the button.", "# The text."))
+
+    processed = run_watch(monkeypatch, reflex_tree, specs_dir, [edit_button])
+
+    assert processed == ["button", "group", "ag_grid", "button"]
+    spec = json.loads((specs_dir / "button.json").read_text())
+    assert spec["properties"][0]["description"] == "The text."
+
+
+def test_new_doc_page_is_picked_up(reflex_tree, tmp_path, monkeypatch):
+    specs_dir = tmp_path / "specs"
+
+    def add_doc_page():
+        write_file(
+            reflex_tree / "reflex/docs/library/layout/group.md",
+            """
+            ---
+            components:
+              - rx.group
+            ---
+            """,
+        )
+
+    processed = run_watch(monkeypatch, reflex_tree, specs_dir, [add_doc_page])
+
+    assert processed[3:] == ["group"]
+    spec = json.loads((specs_dir / "group.json").read_text())
+    assert spec["doc_path"] == "reflex/docs/library/layout/group.md"
+
+
+def test_generation_options_are_forwarded(reflex_tree, tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(watch, "generate_spec_files", lambda *args, **kwargs: calls.append(kwargs))
+    base_path = reflex_tree / "reflex/reflex/components/widgets/base.py"
+
+    def edit_base():
+        write_file(base_path, base_path.read_text() + "\n")
+
+    run_watch(
+        monkeypatch,
+        reflex_tree,
+        tmp_path / "specs",
+        [edit_base],
+        jobs=2,
+        normalized=True,
+        runtime=True,
+        incremental=False,
+    )
+
+    assert len(calls) == 2
+    for call in calls:
+        assert (call["jobs"], call["normalized"], call["runtime"]) == (2, True, True)
+    assert [call["incremental"] for call in calls] == [False, True]